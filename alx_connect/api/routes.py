@@ -1,20 +1,28 @@
-from fastapi import APIRouter, File, Form, UploadFile, HTTPException, WebSocket, WebSocketDisconnect, Depends, Request
+from fastapi import APIRouter, File, Form, UploadFile, HTTPException, WebSocket, WebSocketDisconnect, Depends, Request, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import List, Optional
 import asyncio
 import uuid
 import tempfile
 import os
 from ..models.profile import Profile, ProfileInput
+from ..models.matching import MatchingJobInput
 from ..models.chat import QuestionInput
 from ..services.matching import ImprovedMentorMatchingSystem
-from ..services.interview_coach import InterviewCoach
-from ..services.cv_review import CVReviewService
-from ..config.config import ALLOWED_FILE_TYPES, MAX_UPLOAD_SIZE
+from ..services.matching_jobs import MatchingJobManager, match_to_dict
+from ..services.match_stream import iter_ndjson_matches
+from ..services.chat_stream import relay_tokens
+from ..services.container import default_container
+from ..services.conversation_store import sweep_periodically
+from ..services.request_metrics import RequestMetrics, StageTimer
+from ..config.config import ALLOWED_FILE_TYPES, MAX_UPLOAD_SIZE, MATCHING_JOB_CONFIG, SERVICE_CONFIG
 
 router = APIRouter()
 matching_system = ImprovedMentorMatchingSystem()
-interview_coach = InterviewCoach()
-cv_reviewer = CVReviewService()
+matching_jobs = MatchingJobManager(matching_system)
+# Interview coach, CV reviewer and their models load on first use or during warm-up
+services = default_container()
+request_metrics = RequestMetrics()
 
 @router.get("/")
 async def root():
@@ -51,37 +59,155 @@ async def generate_summary(
         "user_id": user_id
     }
 
+@router.get("/ready")
+async def readiness():
+    required = SERVICE_CONFIG["warm_up_services"] if SERVICE_CONFIG["warm_up"] else []
+    ready = services.is_ready(required)
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "services": services.status()}
+    )
+
+@router.get("/metrics")
+async def get_request_metrics():
+    metrics = {"requests": request_metrics.summary()}
+    interview_coach = services.peek("interview_coach")
+    if interview_coach is not None:
+        metrics["conversations"] = interview_coach.conversations.stats()
+        if interview_coach.answer_cache is not None:
+            metrics["answer_cache"] = interview_coach.answer_cache.stats()
+    return metrics
+
+@router.on_event("startup")
+async def warm_up_services():
+    if SERVICE_CONFIG["warm_up"]:
+        # Keep a reference so the task is not garbage collected mid-load
+        router.warm_up_task = asyncio.create_task(services.warm_up(SERVICE_CONFIG["warm_up_services"]))
+
+@router.on_event("startup")
+async def start_conversation_sweeper():
+    def sweep():
+        # Only once the coach has been loaded; sweeping must not load it
+        interview_coach = services.peek("interview_coach")
+        if interview_coach is not None:
+            interview_coach.clean_inactive_conversations()
+
+    router.conversation_sweeper = asyncio.create_task(sweep_periodically(sweep))
+
+@router.on_event("shutdown")
+async def stop_conversation_sweeper():
+    sweeper = getattr(router, "conversation_sweeper", None)
+    if sweeper is not None:
+        sweeper.cancel()
+
+@router.on_event("shutdown")
+async def shutdown_matching_jobs():
+    await asyncio.to_thread(matching_jobs.shutdown)
+
+def embed_profiles(profiles: List[Profile]) -> List[Profile]:
+    """Fill in the semantic embeddings of ``profiles`` from their summaries.
+
+    If the embedding model cannot be loaded, profiles are matched without
+    the semantic score rather than failing the request.
+    """
+    try:
+        profile_embeddings = services.get("profile_embeddings")
+    except Exception:
+        # The container has logged the failure and retries on the next request
+        return profiles
+    return profile_embeddings.embed_profiles(profiles)
+
+async def prepare_profiles(profile_inputs: List[ProfileInput]) -> List[Profile]:
+    # Loading and running the embedding model would block the event loop
+    return await asyncio.to_thread(embed_profiles, [profile.to_profile() for profile in profile_inputs])
+
 @router.post("/api/v1/mentor-matching/")
-async def find_mentor_matches(profiles: List[ProfileInput]):
+async def find_mentor_matches(profiles: List[ProfileInput], top_k: Optional[int] = Query(None, ge=1)):
     try:
-        mentee_profile = profiles[0].model_dump()
-        matches = matching_system.find_matches(mentee_profile)
-        return {"matches": matches}
+        # Scoring is CPU-bound; keep it off the event loop
+        matches = await asyncio.to_thread(
+            matching_system.find_matches,
+            await prepare_profiles(profiles),
+            top_k=top_k,
+            vectorized=True
+        )
+        return {"matches": [match_to_dict(match) for match in matches]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/mentor-matching/stream")
+async def stream_mentor_matches(
+    profiles: List[ProfileInput],
+    top_k: Optional[int] = Query(MATCHING_JOB_CONFIG["top_k"], ge=1)
+):
+    # StreamingResponse drains sync iterators in a worker thread, off the event loop;
+    # mentees are embedded a block at a time there, so the first line comes early
+    return StreamingResponse(
+        iter_ndjson_matches(matching_system, [profile.to_profile() for profile in profiles], top_k,
+                            prepare=embed_profiles),
+        media_type="application/x-ndjson"
+    )
+
+@router.post("/mentor-matching/jobs", status_code=202)
+async def submit_matching_job(job_input: MatchingJobInput):
+    try:
+        job = matching_jobs.submit(
+            [profile.to_profile() for profile in job_input.profiles],
+            top_k=job_input.top_k,
+            min_score=job_input.min_score,
+            prune=job_input.prune,
+            # Embedded by the job, so submitting a large cohort still returns at once
+            prepare=embed_profiles
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return job.to_dict()
+
+@router.get("/mentor-matching/jobs/{job_id}")
+async def get_matching_job(job_id: str):
+    job = matching_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Matching job not found")
+    return job.to_dict()
+
+@router.get("/mentor-matching/jobs/{job_id}/results")
+async def get_matching_job_results(
+    job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(MATCHING_JOB_CONFIG["page_size"], ge=1, le=1000)
+):
+    page = matching_jobs.results_page(job_id, offset, limit)
+    if page is None:
+        raise HTTPException(status_code=404, detail="Matching job not found")
+    return page
+
+@router.delete("/mentor-matching/jobs/{job_id}")
+async def cancel_matching_job(job_id: str):
+    job = matching_jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Matching job not found")
+    return job.to_dict()
+
 @router.post("/api/v1/ask-question/")
-async def ask_interview_question(question_input: QuestionInput):
+async def ask_interview_question(question_input: QuestionInput, http_response: Response):
     try:
-        chain = interview_coach.create_rag_chain()
-        response = await chain.ainvoke({"question": question_input.question})
+        timer = StageTimer()
+        with timer.stage("services"):
+            interview_coach = await services.aget("interview_coach")
+        response, cached = await interview_coach.answer_question(
+            question_input.question, timer, conversation_id=question_input.conversation_id
+        )
         
         # Add to conversation history if conversation_id provided
         if question_input.conversation_id:
-            interview_coach.add_message_to_conversation(
-                question_input.conversation_id,
-                "user",
-                question_input.question
-            )
-            interview_coach.add_message_to_conversation(
-                question_input.conversation_id,
-                "assistant",
-                response
-            )
+            interview_coach.record_turn(question_input.conversation_id, question_input.question, response)
         
+        request_metrics.record("ask_question.cache_hit" if cached else "ask_question.cache_miss", timer.timings())
+        http_response.headers["Server-Timing"] = timer.server_timing()
         return {
             "answer": interview_coach.clean_response(response),
-            "conversation_id": question_input.conversation_id
+            "conversation_id": question_input.conversation_id,
+            "cached": cached
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -104,6 +230,7 @@ async def review_cv(
     Returns detailed feedback and suggestions for improvement.
     """
     try:
+        cv_reviewer = await services.aget("cv_reviewer")
         # Create a temporary file to store the uploaded resume
         with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
             content = await file.read()
@@ -137,16 +264,40 @@ async def review_cv(
 
 @router.websocket("/ws/chat/{conversation_id}")
 async def websocket_chat(websocket: WebSocket, conversation_id: str):
+    """Chat with the interview coach; replies stream back as JSON frames.
+
+    Each text message gets ``{"type": "token", "content": ...}`` frames as
+    the LLM generates, then ``{"type": "end", "content": <full reply>}``.
+    A message sent while a reply is streaming interrupts it, and a
+    disconnect cancels generation.
+    """
     await websocket.accept()
+    incoming = None
     try:
+        interview_coach = await services.aget("interview_coach")
+        incoming = asyncio.create_task(websocket.receive_text())
         while True:
-            data = await websocket.receive_text()
-            response = await interview_coach.generate_response(
-                data,
-                conversation_id
-            )
-            await websocket.send_text(response)
+            message = await incoming
+            # Keep listening while the reply streams, to notice interruptions and disconnects
+            incoming = asyncio.create_task(websocket.receive_text())
+            timer = StageTimer()
+            reply = asyncio.create_task(relay_tokens(
+                interview_coach.generate_response(message, conversation_id, timer),
+                websocket.send_json
+            ))
+            await asyncio.wait({reply, incoming}, return_when=asyncio.FIRST_COMPLETED)
+            if not reply.done():
+                reply.cancel()
+            (outcome,) = await asyncio.gather(reply, return_exceptions=True)
+            if isinstance(outcome, Exception):
+                # The client already got an error frame; keep the conversation open
+                interview_coach.logger.error(f"Chat reply failed: {outcome}")
+            elif not isinstance(outcome, asyncio.CancelledError):
+                request_metrics.record("chat", timer.timings())
     except WebSocketDisconnect:
         pass
     except Exception as e:
-        await websocket.close(code=1000) 
\ No newline at end of file
+        await websocket.close(code=1000)
+    finally:
+        if incoming is not None:
+            incoming.cancel()
@@ -22,6 +22,13 @@ ALLOWED_ORIGINS = [
 GROQ_MODEL_NAME = "llama3-8b-8192"
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 
+# Service Loading Configuration
+SERVICE_CONFIG = {
+    # Load these in the background at startup; readiness waits for them
+    "warm_up": os.getenv("WARM_UP_SERVICES", "true").lower() in ("1", "true", "yes"),
+    "warm_up_services": ["embeddings", "llm", "interview_coach", "cv_reviewer", "profile_embeddings"],
+}
+
 # Matching System Configuration
 MATCHING_CONFIG = {
     "experience_weight": 0.3,
@@ -30,6 +37,31 @@ MATCHING_CONFIG = {
     "domain_weight": 0.3,
     "min_experience_gap": 0.5,
     "max_experience_gap": 10.0,
+    "min_score": 0.0,  # pairs must score strictly above this to be returned
+    "chunk_size": 1024,  # mentees scored per block in vectorized mode
+    "embedding_precision": "float64",  # float64, float32, float16 or int8 (per-vector scales)
+    "stream_chunk_size": 128,  # smaller blocks when streaming, for a quick first line
+    "index_candidates": 200,  # mentors retrieved per mentee from the FAISS mentor index
+    "incremental_top_k": 10,  # mentors kept per mentee by the incremental matcher
+    "incremental_slack": 10,  # extra ranked mentors kept to absorb removals without a rescore
+    "mentor_capacity": 3,  # mentees a mentor can take in assignment mode
+    "assignment_candidates": 50,  # best mentors per mentee the assignment solver considers
+}
+
+# Matching Job Configuration
+MATCHING_JOB_CONFIG = {
+    "workers": 2,  # matching jobs run concurrently; the rest queue
+    "processes": 2,  # scoring processes per running job
+    "max_jobs": 100,  # queued, running and retained jobs tracked at once
+    "job_ttl": 3600,  # seconds finished job results are kept
+    "top_k": 10,  # mentors returned per mentee unless the request says otherwise
+    "page_size": 100,  # matches per results page
+}
+
+# Profile Embedding Configuration
+PROFILE_EMBEDDING_CONFIG = {
+    "batch_size": 64,
+    "cache_path": os.getenv("PROFILE_EMBEDDING_CACHE", ".cache/profile_embeddings.sqlite3"),
 }
 
 # Interview Coach Configuration
@@ -37,6 +69,41 @@ INTERVIEW_COACH_CONFIG = {
     "context_window": 5,
     "max_conversation_age": 3600,  # 1 hour in seconds
     "cleanup_interval": 300,  # 5 minutes in seconds
+    "max_conversations": 10000,  # least recently active conversations are evicted beyond this
+    # "memory" (one worker) or "sqlite" (shared by all workers on the host)
+    "conversation_store": os.getenv("CONVERSATION_STORE", "memory"),
+    "conversation_db_path": os.getenv("CONVERSATION_DB_PATH", ".cache/conversations.sqlite3"),
+    "retrieval_k": 4,  # knowledge base documents retrieved per question
+    "query_history_messages": 2,  # earlier user messages added to a follow-up's retrieval query
+    # Estimated prompt tokens for retrieved documents and for the conversation so far
+    "context_token_budget": 1500,
+    "history_token_budget": 500,
+    "stream_buffer": 64,  # streamed tokens queued for a slow client before generation pauses
+}
+
+# Answer Cache Configuration
+ANSWER_CACHE_CONFIG = {
+    "enabled": os.getenv("ANSWER_CACHE_ENABLED", "true").lower() in ("1", "true", "yes"),
+    "similarity_threshold": 0.95,  # cosine similarity of question embeddings to reuse an answer
+    "ttl": 24 * 3600,  # seconds an answer is reused
+    "max_entries": 10000,  # least recently used answers are evicted beyond this
+}
+
+# Interview Knowledge Base Configuration
+KNOWLEDGE_BASE_CONFIG = {
+    "path": os.getenv("KNOWLEDGE_BASE_PATH", "data/knowledge_base"),
+    "embedding_model": "sentence-transformers/all-mpnet-base-v2",
+    "batch_size": 1000,  # CSV rows read per batch
+    "embedding_batch_size": 64,  # documents per embed_documents call
+    "chunk_size": 1000,
+    "chunk_overlap": 200,
+    "keep_versions": 2,  # published index versions kept on disk
+    "refresh_interval": 30,  # seconds between checks for a newly published version
+}
+
+# Request Metrics Configuration
+METRICS_CONFIG = {
+    "window": 1000,  # most recent requests per endpoint summarized
 }
 
 # File Upload Configuration
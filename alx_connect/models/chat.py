@@ -1,3 +1,4 @@
+import time
 from enum import Enum
 from datetime import datetime
 from pydantic import BaseModel, Field, field_validator
@@ -18,6 +19,55 @@ class Message(BaseModel):
             raise ValueError("Message content cannot be empty")
         return v.strip()
 
+ROLES = tuple(MessageRole)
+_ROLE_INDEX = {role: index for index, role in enumerate(ROLES)}
+_ROLE_PREFIXES = tuple(f"{role.value}: " for role in ROLES)
+
+class ChatRecord:
+    """A message as the conversation stores keep it.
+
+    ``Message`` validates and timestamps every instance, which is most of
+    the cost of a chat turn's bookkeeping. A record is a bare ``__slots__``
+    object instead: the role is an index into ``ROLES`` and ``created`` a
+    ``time.monotonic()`` reading. It becomes a ``Message`` only where
+    history leaves the service.
+    """
+    __slots__ = ("role_index", "content", "created")
+
+    def __init__(self, role_index: int, content: str, created: float):
+        self.role_index = role_index
+        self.content = content
+        self.created = created
+
+    @classmethod
+    def create(cls, role: MessageRole, content: str) -> "ChatRecord":
+        """A record created now, with ``Message``'s content rules."""
+        try:
+            role_index = _ROLE_INDEX[role]
+        except KeyError:
+            raise ValueError(f"Unknown message role {role!r}") from None
+        content = content.strip()
+        if not content:
+            raise ValueError("Message content cannot be empty")
+        return cls(role_index, content, time.monotonic())
+
+    @classmethod
+    def from_message(cls, message: Message) -> "ChatRecord":
+        age = time.time() - message.timestamp.timestamp()
+        return cls(_ROLE_INDEX[message.role], message.content, time.monotonic() - age)
+
+    @property
+    def role(self) -> MessageRole:
+        return ROLES[self.role_index]
+
+    def render(self) -> str:
+        """The record as a ``role: content`` line of the prompt's conversation history."""
+        return _ROLE_PREFIXES[self.role_index] + self.content
+
+    def to_message(self) -> Message:
+        age = time.monotonic() - self.created
+        return Message(role=self.role, content=self.content, timestamp=datetime.fromtimestamp(time.time() - age))
+
 class ConversationState(BaseModel):
     messages: list[Message] = Field(default_factory=list)
     last_activity: datetime = Field(default_factory=datetime.now)
@@ -0,0 +1,10 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from .profile import ProfileInput
+from ..config.config import MATCHING_CONFIG, MATCHING_JOB_CONFIG
+
+class MatchingJobInput(BaseModel):
+    profiles: List[ProfileInput]
+    top_k: Optional[int] = Field(default=MATCHING_JOB_CONFIG["top_k"], ge=1)
+    min_score: float = MATCHING_CONFIG["min_score"]
+    prune: bool = False
@@ -23,6 +23,9 @@ class ProfileInput(BaseModel):
             "portfolio": self.portfolio
         }
 
+    def to_profile(self) -> "Profile":
+        return Profile(**self.model_dump())
+
 @dataclass
 class Profile:
     id: str
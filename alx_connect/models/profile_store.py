@@ -0,0 +1,260 @@
+from array import array
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+import scipy.sparse as sp
+
+from .profile import Profile
+from .vocabulary import VocabularyInterner
+
+STRING_FIELDS = ["id", "full_name", "email", "personal_summary", "professional_summary", "portfolio"]
+SET_FIELDS = {
+    "extracted_skills": "skills",
+    "industry_domains": "domains",
+    "seniority_keywords": "seniority",
+}
+
+
+class StringTable:
+    """Append-only UTF-8 string column: one byte buffer plus offsets.
+
+    The buffer and offsets may also be read-only memory maps of a snapshot.
+    """
+
+    def __init__(self, buffer=None, offsets=None):
+        self.buffer = bytearray() if buffer is None else buffer
+        self.offsets = array("q", [0]) if offsets is None else offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> str:
+        return bytes(self.buffer[self.offsets[row]:self.offsets[row + 1]]).decode("utf-8")
+
+    def append(self, value: str):
+        self.buffer += value.encode("utf-8")
+        self.offsets.append(len(self.buffer))
+
+
+class TermColumn:
+    """Append-only column of term-id sets, laid out as CSR arrays."""
+
+    def __init__(self, interner: Optional[VocabularyInterner] = None, indices=None, indptr=None):
+        self.interner = interner if interner is not None else VocabularyInterner()
+        self.indices = array("i") if indices is None else indices
+        self.indptr = array("q", [0]) if indptr is None else indptr
+
+    def __getitem__(self, row: int) -> FrozenSet[str]:
+        terms = self.interner.terms
+        return frozenset(terms[i] for i in self.indices[self.indptr[row]:self.indptr[row + 1]])
+
+    def append(self, items: Iterable[str]):
+        self.indices.extend(sorted(self.interner.intern(item) for item in items))
+        self.indptr.append(len(self.indices))
+
+    def matrix(self) -> sp.csr_matrix:
+        indices = np.asarray(self.indices, dtype=np.int32) if len(self.indices) else np.zeros(0, dtype=np.int32)
+        indptr = np.asarray(self.indptr, dtype=np.int64)
+        return sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(indptr) - 1, len(self.interner))
+        )
+
+
+class ProfileView(Profile):
+    """Read-only ``Profile`` backed by one row of a ``ProfileStore``.
+
+    A view holds only its store and row number; fields are decoded from
+    the store's columns on access. Call ``copy()`` for a regular, mutable
+    ``Profile``.
+    """
+
+    def __init__(self, store: "ProfileStore", row: int):
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "_row", row)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ProfileView is read-only; use copy() to get a mutable Profile")
+
+    id = property(lambda self: self._store.strings["id"][self._row])
+    full_name = property(lambda self: self._store.strings["full_name"][self._row])
+    email = property(lambda self: self._store.strings["email"][self._row])
+    personal_summary = property(lambda self: self._store.strings["personal_summary"][self._row])
+    professional_summary = property(lambda self: self._store.strings["professional_summary"][self._row])
+    portfolio = property(lambda self: self._store.strings["portfolio"][self._row])
+    cumulative_year = property(lambda self: int(self._store.years[self._row]))
+    extracted_skills = property(lambda self: self._store.terms["skills"][self._row])
+    industry_domains = property(lambda self: self._store.terms["domains"][self._row])
+    seniority_keywords = property(lambda self: self._store.terms["seniority"][self._row])
+
+    @property
+    def semantic_embedding(self) -> Optional[np.ndarray]:
+        if not self._store.has_embedding[self._row]:
+            return None
+        return self._store.embeddings[self._row]
+
+    def copy(self, **kwargs) -> Profile:
+        profile_dict = {name: getattr(self, name) for name in STRING_FIELDS}
+        profile_dict["cumulative_year"] = self.cumulative_year
+        for field in SET_FIELDS:
+            profile_dict[field] = set(getattr(self, field))
+        embedding = self.semantic_embedding
+        profile_dict["semantic_embedding"] = None if embedding is None else embedding.copy()
+        profile_dict.update(kwargs)
+        return Profile(**profile_dict)
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    @property
+    def store(self) -> "ProfileStore":
+        return self._store
+
+
+class ProfileStore:
+    """Columnar storage for many profiles.
+
+    Years live in an int32 array, embeddings in one contiguous float32 matrix,
+    skills/domains/seniority keywords as interned CSR ids and text fields in
+    UTF-8 string tables. Rows are append-only: re-adding an id or removing
+    one tombstones the old row, and iteration yields ``ProfileView`` objects
+    for live rows only.
+    """
+
+    def __init__(self, dimension: Optional[int] = None, capacity: int = 1024):
+        self.dimension = dimension
+        self.read_only = False
+        self._size = 0
+        self._years = np.zeros(capacity, dtype=np.int32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._has_embedding = np.zeros(capacity, dtype=bool)
+        self._embeddings = np.zeros((capacity, dimension or 0), dtype=np.float32)
+        self.strings: Dict[str, StringTable] = {name: StringTable() for name in STRING_FIELDS}
+        self.terms: Dict[str, TermColumn] = {column: TermColumn() for column in SET_FIELDS.values()}
+        self.rows: Dict[str, int] = {}
+
+    @classmethod
+    def from_columns(cls, years: np.ndarray, has_embedding: np.ndarray, embeddings: np.ndarray,
+                     strings: Dict[str, StringTable], terms: Dict[str, TermColumn]) -> "ProfileStore":
+        """Read-only store over existing columns, e.g. memory-mapped snapshot files."""
+        store = cls(embeddings.shape[1] or None, capacity=0)
+        store.read_only = True
+        store._size = len(years)
+        store._years = years
+        store._alive = np.ones(len(years), dtype=bool)
+        store._has_embedding = has_embedding
+        store._embeddings = embeddings
+        store.strings = strings
+        store.terms = terms
+        id_column = strings["id"]
+        store.rows = {id_column[row]: row for row in range(len(years))}
+        return store
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable[Profile], dimension: Optional[int] = None) -> "ProfileStore":
+        store = cls(dimension)
+        for profile in profiles:
+            store.add(profile)
+        return store
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, profile_id: str) -> bool:
+        return profile_id in self.rows
+
+    def __iter__(self) -> Iterator[ProfileView]:
+        for row in np.flatnonzero(self.alive):
+            yield ProfileView(self, int(row))
+
+    def __getitem__(self, profile_id: str) -> ProfileView:
+        return ProfileView(self, self.rows[profile_id])
+
+    @property
+    def years(self) -> np.ndarray:
+        return self._years[:self._size]
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self._alive[:self._size]
+
+    @property
+    def has_embedding(self) -> np.ndarray:
+        return self._has_embedding[:self._size]
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        return self._embeddings[:self._size]
+
+    def _grow(self):
+        capacity = max(2 * len(self._years), 1)
+        self._years = np.resize(self._years, capacity)
+        self._alive = np.resize(self._alive, capacity)
+        self._has_embedding = np.resize(self._has_embedding, capacity)
+        embeddings = np.zeros((capacity, self._embeddings.shape[1]), dtype=np.float32)
+        embeddings[:self._size] = self._embeddings[:self._size]
+        self._embeddings = embeddings
+
+    def add(self, profile: Profile) -> int:
+        """Append ``profile`` and return its row, replacing any row with the same id."""
+        if self.read_only:
+            raise ValueError("This ProfileStore is read-only")
+        embedding = profile.semantic_embedding
+        if embedding is not None:
+            embedding = np.asarray(embedding, dtype=np.float32).ravel()
+            if self.dimension is None:
+                self.dimension = len(embedding)
+                self._embeddings = np.zeros((len(self._years), self.dimension), dtype=np.float32)
+            elif len(embedding) != self.dimension:
+                raise ValueError(f"Expected embedding of dimension {self.dimension}, got {len(embedding)}")
+
+        if profile.id in self.rows:
+            self.remove(profile.id)
+        if self._size == len(self._years):
+            self._grow()
+
+        row = self._size
+        self._years[row] = profile.cumulative_year
+        self._alive[row] = True
+        self._has_embedding[row] = embedding is not None
+        if embedding is not None:
+            self._embeddings[row] = embedding
+        for name in STRING_FIELDS:
+            self.strings[name].append(getattr(profile, name))
+        for field, column in SET_FIELDS.items():
+            self.terms[column].append(getattr(profile, field) or ())
+
+        self._size += 1
+        self.rows[profile.id] = row
+        return row
+
+    def remove(self, profile_id: str):
+        if self.read_only:
+            raise ValueError("This ProfileStore is read-only")
+        self._alive[self.rows.pop(profile_id)] = False
+
+    def term_matrix(self, column: str) -> sp.csr_matrix:
+        """CSR matrix of interned ids for ``skills``, ``domains`` or ``seniority``."""
+        return self.terms[column].matrix()
+
+    def views(self, rows: Iterable[int]) -> List[ProfileView]:
+        return [ProfileView(self, int(row)) for row in rows]
+
+    def feature_columns(self, rows: Union[np.ndarray, List[int]]) -> Dict[str, Union[np.ndarray, sp.csr_matrix]]:
+        """Matching features for ``rows`` read straight from the columns.
+
+        Same layout as ``ImprovedMentorMatchingSystem.prepare_features``;
+        skill/domain ids are the store's own, so both sides of a match must
+        come from the same store.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        embeddings = self.embeddings[rows].astype(np.float64)
+        norms = np.sqrt(np.einsum("ij,ij->i", embeddings, embeddings))
+        norms[norms == 0.0] = 1.0
+        return {
+            "years": self.years[rows].astype(np.float64),
+            "embeddings": embeddings / norms[:, np.newaxis],
+            "domains": self.term_matrix("domains")[rows],
+            "skills": self.term_matrix("skills")[rows],
+        }
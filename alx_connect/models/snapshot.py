@@ -0,0 +1,184 @@
+"""On-disk, memory-mappable snapshots of a ``ProfileStore``.
+
+A snapshot root holds numbered version directories and a ``CURRENT`` file
+naming the published one::
+
+    root/
+      CURRENT                 -> "v000002"
+      v000001/ ...
+      v000002/
+        header.json           format, row count, dimension, vocabularies
+        years.npy             int32 (rows,)
+        has_embedding.npy     bool (rows,)
+        embeddings.npy        float32 (rows, dimension)
+        <terms>_indices.npy   int32 CSR ids for skills/domains/seniority
+        <terms>_indptr.npy    int64 CSR row pointers
+        <field>.bin           UTF-8 string table
+        <field>_offsets.npy   int64 string offsets
+
+Versions are written to a temporary directory, renamed into place and then
+published by atomically replacing ``CURRENT``, so readers never see a
+partial snapshot. Arrays are opened with ``mmap_mode="r"``, so every worker
+process mapping the same version shares one page-cache copy.
+"""
+import json
+import os
+import shutil
+import tempfile
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from .profile_store import SET_FIELDS, STRING_FIELDS, ProfileStore, StringTable, TermColumn
+from .vocabulary import VocabularyInterner
+
+FORMAT_VERSION = 1
+CURRENT_FILE = "CURRENT"
+HEADER_FILE = "header.json"
+
+
+def _fsync_directory(path: str):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def list_versions(root: str) -> List[str]:
+    if not os.path.isdir(root):
+        return []
+    return sorted(name for name in os.listdir(root) if name.startswith("v") and name[1:].isdigit())
+
+
+def current_version(root: str) -> Optional[str]:
+    try:
+        with open(os.path.join(root, CURRENT_FILE)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _write_columns(store: ProfileStore, directory: str):
+    rows = np.flatnonzero(store.alive)
+
+    np.save(os.path.join(directory, "years.npy"), store.years[rows].astype(np.int32))
+    np.save(os.path.join(directory, "has_embedding.npy"), store.has_embedding[rows])
+    np.save(os.path.join(directory, "embeddings.npy"),
+            np.ascontiguousarray(store.embeddings[rows], dtype=np.float32))
+
+    for column in SET_FIELDS.values():
+        matrix = store.term_matrix(column)[rows]
+        np.save(os.path.join(directory, f"{column}_indices.npy"), matrix.indices.astype(np.int32))
+        np.save(os.path.join(directory, f"{column}_indptr.npy"), matrix.indptr.astype(np.int64))
+
+    for name in STRING_FIELDS:
+        table = store.strings[name]
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        with open(os.path.join(directory, f"{name}.bin"), "wb") as f:
+            for i, row in enumerate(rows):
+                value = bytes(table.buffer[table.offsets[row]:table.offsets[row + 1]])
+                f.write(value)
+                offsets[i + 1] = offsets[i] + len(value)
+        np.save(os.path.join(directory, f"{name}_offsets.npy"), offsets)
+
+    header = {
+        "format_version": FORMAT_VERSION,
+        "rows": int(len(rows)),
+        "dimension": int(store.embeddings.shape[1]),
+        "vocabularies": {column: store.terms[column].interner.terms for column in SET_FIELDS.values()},
+    }
+    with open(os.path.join(directory, HEADER_FILE), "w") as f:
+        json.dump(header, f)
+
+
+def publish_version(root: str, write: Callable[[str], None], keep: int = 2) -> str:
+    """Publish the files ``write(directory)`` creates as the next version of ``root``.
+
+    The files are written to a staging directory, synced and renamed into
+    place before ``CURRENT`` is atomically replaced, so readers see either
+    the old or the new version in full. Only the newest ``keep`` versions
+    are retained; older ones are deleted once the new version is current.
+    Returns the new version's name.
+    """
+    os.makedirs(root, exist_ok=True)
+    versions = list_versions(root)
+    version = f"v{int(versions[-1][1:]) + 1 if versions else 1:06d}"
+
+    staging = tempfile.mkdtemp(prefix=".staging-", dir=root)
+    try:
+        write(staging)
+        for name in os.listdir(staging):
+            with open(os.path.join(staging, name), "rb") as f:
+                os.fsync(f.fileno())
+        os.rename(staging, os.path.join(root, version))
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    pointer = os.path.join(root, f".{CURRENT_FILE}.{version}")
+    with open(pointer, "w") as f:
+        f.write(version)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(pointer, os.path.join(root, CURRENT_FILE))
+    _fsync_directory(root)
+
+    for old in list_versions(root)[:-keep] if keep > 0 else []:
+        shutil.rmtree(os.path.join(root, old), ignore_errors=True)
+    return version
+
+
+def write_snapshot(store: ProfileStore, root: str, keep: int = 2) -> str:
+    """Write the live rows of ``store`` as a new version, publish it and return its name."""
+    return publish_version(root, lambda directory: _write_columns(store, directory), keep)
+
+
+def open_snapshot(root: str, version: Optional[str] = None) -> ProfileStore:
+    """Open a snapshot version (the current one by default) as a read-only store."""
+    version = version or current_version(root)
+    if version is None:
+        raise FileNotFoundError(f"No published snapshot in {root}")
+    directory = os.path.join(root, version)
+    with open(os.path.join(directory, HEADER_FILE)) as f:
+        header = json.load(f)
+    if header["format_version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format {header['format_version']}")
+
+    def load(name: str) -> np.ndarray:
+        return np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+
+    strings = {}
+    for name in STRING_FIELDS:
+        path = os.path.join(directory, f"{name}.bin")
+        # np.memmap cannot map empty files
+        buffer = np.memmap(path, dtype=np.uint8, mode="r") if os.path.getsize(path) else b""
+        strings[name] = StringTable(buffer, load(f"{name}_offsets"))
+
+    terms = {
+        column: TermColumn(VocabularyInterner(header["vocabularies"][column]),
+                           load(f"{column}_indices"), load(f"{column}_indptr"))
+        for column in SET_FIELDS.values()
+    }
+    return ProfileStore.from_columns(load("years"), load("has_embedding"), load("embeddings"), strings, terms)
+
+
+class SnapshotHandle:
+    """Keeps the current snapshot of ``root`` open and follows new publications.
+
+    Call ``get()`` per request or batch: it re-reads ``CURRENT`` and swaps to
+    the new version when one has been published. Stores already handed out
+    keep their mapping of the old files until they are dropped.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.version: Optional[str] = None
+        self.store: Optional[ProfileStore] = None
+
+    def get(self) -> ProfileStore:
+        version = current_version(self.root)
+        if version != self.version or self.store is None:
+            self.store = open_snapshot(self.root, version)
+            self.version = version
+        return self.store
@@ -0,0 +1,40 @@
+from typing import Dict, Iterable, List, Set
+
+import numpy as np
+import scipy.sparse as sp
+
+
+class VocabularyInterner:
+    """Maps skill or domain strings to dense integer ids."""
+
+    def __init__(self, terms: Iterable[str] = ()):
+        self.ids: Dict[str, int] = {}
+        self.terms: List[str] = []
+        for term in terms:
+            self.intern(term)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def intern(self, term: str) -> int:
+        term_id = self.ids.get(term)
+        if term_id is None:
+            term_id = self.ids[term] = len(self.terms)
+            self.terms.append(term)
+        return term_id
+
+    def encode(self, sets: Iterable[Set[str]]) -> sp.csr_matrix:
+        """One binary CSR row per set; unseen terms are interned on the way."""
+        indptr = [0]
+        indices: List[int] = []
+        for items in sets:
+            indices.extend(sorted(self.intern(item) for item in items))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.int32)
+        return sp.csr_matrix(
+            (data, np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, len(self.terms))
+        )
+
+    def decode(self, row: sp.csr_matrix) -> Set[str]:
+        return {self.terms[term_id] for term_id in row.indices}
@@ -0,0 +1,152 @@
+"""Semantic cache of interview coach answers.
+
+An answer is reused for a new question when both were answered from the
+same retrieved context (same knowledge base version and documents) and
+their question embeddings have cosine similarity of at least
+``similarity_threshold``. Entries expire ``ttl`` seconds after they were
+stored, and the least recently used entry is evicted once ``max_entries``
+answers are cached.
+
+Entries are grouped by context fingerprint, so a lookup only compares
+the question against the few cached questions that retrieved the same
+documents: one small matrix-vector product.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Set
+
+import numpy as np
+
+from ..config.config import ANSWER_CACHE_CONFIG
+
+
+def context_fingerprint(documents: Iterable, version: Optional[str] = None, history: str = "") -> str:
+    """Hash of the knowledge base version, retrieved document texts, in order, and the prompt's conversation history."""
+    digest = hashlib.sha256((version or "").encode("utf-8"))
+    for document in documents:
+        digest.update(b"\0")
+        digest.update(document.page_content.encode("utf-8"))
+    digest.update(b"\1")
+    digest.update(history.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _Entry:
+    __slots__ = ("fingerprint", "answer", "expires")
+
+    def __init__(self, fingerprint: str, answer: str, expires: float):
+        self.fingerprint = fingerprint
+        self.answer = answer
+        self.expires = expires
+
+
+class SemanticAnswerCache:
+    """Answers keyed by question embedding and context fingerprint, with TTL and LRU eviction."""
+
+    def __init__(self, similarity_threshold: float = ANSWER_CACHE_CONFIG["similarity_threshold"],
+                 ttl: float = ANSWER_CACHE_CONFIG["ttl"],
+                 max_entries: int = ANSWER_CACHE_CONFIG["max_entries"],
+                 clock: Callable[[], float] = time.monotonic):
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._lock = threading.Lock()
+        # slot -> entry, least recently used first; the slot's row of _vectors holds its embedding
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._by_fingerprint: Dict[str, Set[int]] = {}
+        self._vectors: Optional[np.ndarray] = None
+        self._reset()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "expirations": 0}
+        self._lookup_seconds = 0.0
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _remove(self, slot: int):
+        entry = self._entries.pop(slot)
+        slots = self._by_fingerprint[entry.fingerprint]
+        slots.discard(slot)
+        if not slots:
+            del self._by_fingerprint[entry.fingerprint]
+        self._free.append(slot)
+
+    def _best(self, vector: np.ndarray, fingerprint: str):
+        """(slot, similarity) of the closest live entry for ``fingerprint``, dropping expired ones."""
+        now = self.clock()
+        for slot in [s for s in self._by_fingerprint.get(fingerprint, ()) if self._entries[s].expires <= now]:
+            self._remove(slot)
+            self._stats["expirations"] += 1
+        slots = list(self._by_fingerprint.get(fingerprint, ()))
+        if not slots or self._vectors is None or self._vectors.shape[1] != len(vector):
+            return None, -np.inf
+        if len(slots) * 8 > len(self._vectors):
+            # Gathering many rows costs more than scoring them all in place
+            similarities = (self._vectors @ vector)[slots]
+        else:
+            similarities = self._vectors[slots] @ vector
+        best = int(np.argmax(similarities))
+        return slots[best], float(similarities[best])
+
+    def get(self, embedding, fingerprint: str) -> Optional[str]:
+        """The cached answer for a similar question over the same context, or None."""
+        started = time.perf_counter()
+        vector = self._normalize(embedding)
+        with self._lock:
+            slot, similarity = self._best(vector, fingerprint)
+            if slot is not None and similarity >= self.similarity_threshold:
+                self._entries.move_to_end(slot)
+                self._stats["hits"] += 1
+                answer = self._entries[slot].answer
+            else:
+                self._stats["misses"] += 1
+                answer = None
+            self._lookup_seconds += time.perf_counter() - started
+        return answer
+
+    def put(self, embedding, fingerprint: str, answer: str):
+        vector = self._normalize(embedding)
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != len(vector):
+                # First entry, or the embedding model changed: start over
+                self._reset()
+                self._vectors = np.zeros((self.max_entries, len(vector)), dtype=np.float32)
+
+            slot, similarity = self._best(vector, fingerprint)
+            if slot is None or similarity < self.similarity_threshold:
+                if not self._free:
+                    self._remove(next(iter(self._entries)))
+                    self._stats["evictions"] += 1
+                slot = self._free.pop()
+                self._by_fingerprint.setdefault(fingerprint, set()).add(slot)
+            self._vectors[slot] = vector
+            self._entries[slot] = _Entry(fingerprint, answer, self.clock() + self.ttl)
+            self._entries.move_to_end(slot)
+            self._stats["stores"] += 1
+
+    def _reset(self):
+        self._entries.clear()
+        self._by_fingerprint.clear()
+        self._free = list(range(self.max_entries - 1, -1, -1))
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else None,
+                "mean_lookup_ms": round(self._lookup_seconds / lookups * 1000, 3) if lookups else None,
+            }
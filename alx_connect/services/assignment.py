@@ -0,0 +1,127 @@
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+
+from ..models.profile import Profile
+
+if TYPE_CHECKING:
+    from .matching import ImprovedMentorMatchingSystem
+
+
+def candidate_graph(matching_system: "ImprovedMentorMatchingSystem", mentors: List[Profile],
+                    mentees: List[Profile], candidates: Optional[int], min_score: float,
+                    chunk_size: int) -> Tuple[sp.csr_matrix, Dict[str, sp.csr_matrix]]:
+    """Sparse (mentees, mentors) score matrix keeping each mentee's best ``candidates`` mentors.
+
+    Only pairs scoring above ``min_score`` become edges. Component scores
+    are returned as matrices with the same sparsity pattern.
+    """
+    indptr = [0]
+    indices, totals = [], []
+    names = [kernel.name for kernel in matching_system.kernels]
+    components: Dict[str, list] = {name: [] for name in names}
+    for _, total, block_components in matching_system.iter_score_blocks(mentors, mentees, chunk_size):
+        for row in range(total.shape[0]):
+            ranked = np.sort(matching_system.rank_candidates(total[row], candidates, min_score))
+            indices.append(ranked)
+            totals.append(total[row, ranked])
+            for name in names:
+                components[name].append(block_components[name][row, ranked])
+            indptr.append(indptr[-1] + len(ranked))
+
+    columns = np.concatenate(indices).astype(np.int32) if indices else np.zeros(0, dtype=np.int32)
+
+    def build(data: list) -> sp.csr_matrix:
+        values = np.concatenate(data) if data else np.zeros(0)
+        return sp.csr_matrix((values, columns, np.asarray(indptr, dtype=np.int64)),
+                             shape=(len(mentees), len(mentors)))
+
+    return build(totals), {name: build(values) for name, values in components.items()}
+
+
+def solve_assignment(scores: sp.csr_matrix, capacities: np.ndarray) -> np.ndarray:
+    """Maximum-total-score assignment of rows to columns under column capacities.
+
+    ``scores`` holds one edge per allowed (row, column) pair. Column ``j``
+    takes at most ``capacities[j]`` rows and every row takes at most one
+    column. Returns the assigned column per row, or -1 for rows left out,
+    which happens only when no edge of theirs improves the total.
+
+    Capacities are expanded into unit slots, capped at a column's in-degree
+    since extra slots could never be used, and each row gets a private
+    "unassigned" slot so a full matching always exists. The result is an
+    exact min-cost solve (sparse LAPJV) over costs ``offset - score``.
+    """
+    scores = sp.csr_matrix(scores)
+    rows, columns = scores.shape
+    assigned = np.full(rows, -1, dtype=np.intp)
+    if rows == 0 or scores.nnz == 0:
+        return assigned
+
+    coo = scores.tocoo()
+    in_degree = np.bincount(coo.col, minlength=columns)
+    slots = np.minimum(np.asarray(capacities, dtype=np.int64), in_degree)
+    slots[slots < 0] = 0
+    slot_start = np.concatenate([[0], np.cumsum(slots)])
+    slot_owner = np.repeat(np.arange(columns), slots)
+    total_slots = int(slot_start[-1])
+    if total_slots == 0:
+        return assigned
+
+    # Every edge is repeated once per slot of its column
+    edge_slots = slots[coo.col]
+    keep = edge_slots > 0
+    edge_rows = np.repeat(coo.row[keep], edge_slots[keep])
+    edge_values = np.repeat(coo.data[keep], edge_slots[keep])
+    first_slot = np.repeat(slot_start[coo.col[keep]], edge_slots[keep])
+    run_starts = np.repeat(np.cumsum(edge_slots[keep]) - edge_slots[keep], edge_slots[keep])
+    edge_cols = first_slot + np.arange(len(edge_rows)) - run_starts
+
+    # Costs must be strictly positive: explicit zeros are not edges to the solver
+    offset = max(float(coo.data.max()), 0.0) + 1.0
+    graph = sp.csr_matrix(
+        (
+            np.concatenate([offset - edge_values, np.full(rows, offset)]),
+            (np.concatenate([edge_rows, np.arange(rows)]),
+             np.concatenate([edge_cols, total_slots + np.arange(rows)]))
+        ),
+        shape=(rows, total_slots + rows)
+    )
+    matched_rows, matched_slots = min_weight_full_bipartite_matching(graph)
+    real = matched_slots < total_slots
+    assigned[matched_rows[real]] = slot_owner[matched_slots[real]]
+    return assigned
+
+
+def assign_mentors(matching_system: "ImprovedMentorMatchingSystem", mentors: List[Profile],
+                   mentees: List[Profile], capacity: Union[int, Dict[str, int]],
+                   candidates: Optional[int], min_score: float,
+                   chunk_size: int) -> List[Tuple[Profile, Profile, float, Dict]]:
+    """One mentor per mentee, at most ``capacity`` mentees per mentor, maximizing total score.
+
+    ``capacity`` is either one limit for every mentor or a mapping from
+    mentor id to its limit (mentors missing from it take none). The optimum
+    is exact over the candidate graph; with ``candidates=None`` that graph
+    holds every pair above ``min_score``, so the assignment is globally optimal.
+    """
+    if not mentors or not mentees:
+        return []
+    if isinstance(capacity, dict):
+        capacities = np.array([capacity.get(mentor.id, 0) for mentor in mentors], dtype=np.int64)
+    else:
+        capacities = np.full(len(mentors), capacity, dtype=np.int64)
+
+    scores, components = candidate_graph(matching_system, mentors, mentees, candidates, min_score, chunk_size)
+    assigned = solve_assignment(scores, capacities)
+
+    assignments = []
+    for row in np.flatnonzero(assigned >= 0):
+        col = assigned[row]
+        # Row indices are sorted, so the edge is found by bisection instead of CSR indexing
+        start, end = scores.indptr[row], scores.indptr[row + 1]
+        edge = start + np.searchsorted(scores.indices[start:end], col)
+        breakdown = {name: float(values.data[edge]) for name, values in components.items()}
+        assignments.append((mentors[col], mentees[row], float(scores.data[edge]), breakdown))
+    return assignments
@@ -0,0 +1,75 @@
+from typing import TYPE_CHECKING, Dict, Union
+
+import numpy as np
+import scipy.sparse as sp
+
+from .quantization import DOT_HEADROOM, embedding_norms, precision_of
+
+if TYPE_CHECKING:
+    from .matching import ImprovedMentorMatchingSystem
+
+# Headroom for rounding in normalized dot products, which can exceed 1.0 slightly
+SEMANTIC_BOUND = 1.0 + 1e-9
+# Components whose score is zero outside the candidate set, or bounded by SEMANTIC_BOUND
+INDEXED_COMPONENTS = {"experience_score", "semantic_score", "domain_score", "skill_score"}
+
+
+class CandidateGenerator:
+    """Finds the mentors a mentee can score against without touching the rest.
+
+    A mentor is a candidate when it shares a domain or skill with the mentee
+    (looked up through inverted indexes over interned ids) or when its
+    experience falls inside the mentoring window (a range scan over sorted
+    mentor years). Every other mentor has zero experience, domain and skill
+    scores, so its total is bounded by the semantic weight alone.
+    """
+
+    def __init__(self, matching_system: "ImprovedMentorMatchingSystem",
+                 mentor_features: Dict[str, Union[np.ndarray, sp.csr_matrix]]):
+        self.matching_system = matching_system
+        # CSC columns are exactly the posting lists: term id -> mentor rows
+        self.domain_postings = mentor_features["domains"].tocsc()
+        self.skill_postings = mentor_features["skills"].tocsc()
+        years = mentor_features["years"]
+        self.year_order = np.argsort(years, kind="stable")
+        self.sorted_years = years[self.year_order]
+        embeddings = mentor_features["embeddings"]
+        self.mentors_embedded = embeddings.shape[1] > 0 and bool(np.any(embeddings))
+        precision = precision_of(mentor_features)
+        # Reduced-precision vectors are only near unit length, so bound by their actual norms
+        self.max_mentor_norm = None
+        if precision != "float64" and self.mentors_embedded:
+            self.max_mentor_norm = float(embedding_norms(mentor_features).max()) * (1.0 + DOT_HEADROOM[precision])
+        # Added kernels are not indexed, so any mentor may score up to their full weight
+        self.unindexed_bound = sum(
+            max(matching_system.kernel_weight(kernel), 0.0) * kernel.max_score
+            for kernel in matching_system.kernels if kernel.name not in INDEXED_COMPONENTS
+        )
+
+    def _postings(self, postings: sp.csc_matrix, terms: sp.csr_matrix, row: int) -> list:
+        found = []
+        for term_id in terms.indices[terms.indptr[row]:terms.indptr[row + 1]]:
+            if term_id < postings.shape[1]:
+                found.append(postings.indices[postings.indptr[term_id]:postings.indptr[term_id + 1]])
+        return found
+
+    def candidates(self, mentee_features: Dict[str, Union[np.ndarray, sp.csr_matrix]], row: int) -> np.ndarray:
+        """Sorted mentor rows that share a term with, or are in range of, mentee ``row``."""
+        year = mentee_features["years"][row]
+        low = np.searchsorted(self.sorted_years, year + self.matching_system.min_experience_gap, side="left")
+        high = np.searchsorted(self.sorted_years, year + self.matching_system.max_experience_gap, side="right")
+
+        parts = [self.year_order[low:high]]
+        parts.extend(self._postings(self.domain_postings, mentee_features["domains"], row))
+        parts.extend(self._postings(self.skill_postings, mentee_features["skills"], row))
+        return np.unique(np.concatenate(parts)).astype(np.intp)
+
+    def outside_bound(self, mentee_features: Dict[str, Union[np.ndarray, sp.csr_matrix]], row: int) -> float:
+        """Upper bound on the total score of any mentor not in ``candidates``."""
+        if not self.mentors_embedded or not np.any(mentee_features["embeddings"][row]):
+            return self.unindexed_bound
+        if self.max_mentor_norm is None:
+            return max(self.matching_system.semantic_weight, 0.0) * SEMANTIC_BOUND + self.unindexed_bound
+        mentee_norm = embedding_norms({name: values[row:row + 1] for name, values in mentee_features.items()
+                                       if name in ("embeddings", "embedding_scales")})[0]
+        return max(self.matching_system.semantic_weight, 0.0) * self.max_mentor_norm * mentee_norm + self.unindexed_bound
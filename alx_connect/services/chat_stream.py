@@ -0,0 +1,68 @@
+"""Relaying streamed LLM tokens to a slow consumer such as a WebSocket.
+
+Tokens are pulled from the generator by a producer task into a bounded
+queue and sent by the caller's coroutine. When the client reads slower
+than the model writes, the tokens queued since the last send go out as
+one frame, and once ``max_buffer`` tokens are waiting the producer stops
+pulling from the model until the client catches up. Cancelling the relay
+(for example when the client disconnects) cancels the producer, which
+closes the token generator and with it the upstream LLM stream.
+"""
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Dict
+
+from ..config.config import INTERVIEW_COACH_CONFIG
+
+_DONE = object()
+
+
+async def relay_tokens(tokens: AsyncIterator[str], send: Callable[[Dict[str, str]], Awaitable[None]],
+                       max_buffer: int = INTERVIEW_COACH_CONFIG["stream_buffer"]) -> str:
+    """Send ``tokens`` as ``{"type": "token"}`` frames then an ``{"type": "end"}`` frame.
+
+    The end frame carries the full reply, which is also returned. Errors
+    from ``tokens`` are sent as an ``{"type": "error"}`` frame and re-raised.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffer)
+
+    async def produce():
+        try:
+            async for token in tokens:
+                await queue.put(token)
+        except Exception as e:
+            await queue.put(e)
+            return
+        finally:
+            # Also when cancelled while waiting for queue space, with the generator suspended
+            await tokens.aclose()
+        await queue.put(_DONE)
+
+    producer = asyncio.create_task(produce())
+    parts = []
+    try:
+        finished = False
+        while not finished:
+            frame = []
+            item = await queue.get()
+            # Coalesce whatever queued up while the previous frame was being sent
+            while True:
+                if item is _DONE:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    await send({"type": "error", "detail": str(item)})
+                    raise item
+                frame.append(item)
+                if queue.empty():
+                    break
+                item = queue.get_nowait()
+            if frame:
+                parts.extend(frame)
+                await send({"type": "token", "content": "".join(frame)})
+        reply = "".join(parts)
+        await send({"type": "end", "content": reply})
+        return reply
+    finally:
+        if not producer.done():
+            producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
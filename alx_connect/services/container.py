@@ -0,0 +1,149 @@
+"""Lazily built, shared heavy services for the API.
+
+Loading the sentence-transformer, the FAISS knowledge base and the
+LlamaParse client takes seconds, so nothing is built at import time.
+Each service is created by its factory on first ``get`` (or by the
+background warm-up started with the app) and then shared by every
+request; services that depend on others fetch them from the container,
+so the embedding model and the Groq client are loaded once and used by
+both the interview coach and the CV reviewer.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from ..config.config import GROQ_API_KEY, GROQ_MODEL_NAME
+
+PENDING, LOADING, READY, FAILED = "pending", "loading", "ready", "failed"
+
+
+class _Slot:
+    __slots__ = ("factory", "lock", "instance", "state", "error", "seconds")
+
+    def __init__(self, factory: Callable[["ServiceContainer"], object]):
+        self.factory = factory
+        self.lock = threading.Lock()
+        self.instance = None
+        self.state = PENDING
+        self.error: Optional[str] = None
+        self.seconds: Optional[float] = None
+
+
+class ServiceContainer:
+    """Named services built once, on first use, by ``factory(container)``."""
+
+    def __init__(self):
+        self.setup_logging()
+        self._slots: Dict[str, _Slot] = {}
+
+    def setup_logging(self):
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        self.logger = logging.getLogger(__name__)
+
+    def register(self, name: str, factory: Callable[["ServiceContainer"], object]):
+        if name in self._slots:
+            raise ValueError(f"Service {name!r} is already registered")
+        self._slots[name] = _Slot(factory)
+
+    def get(self, name: str):
+        """The shared instance of ``name``, building it if needed.
+
+        Concurrent callers wait for a single build. A failed build is
+        raised to its callers and retried by the next ``get``.
+        """
+        slot = self._slots[name]
+        if slot.state == READY:
+            return slot.instance
+        with slot.lock:
+            if slot.state == READY:
+                return slot.instance
+            slot.state = LOADING
+            started = time.perf_counter()
+            try:
+                instance = slot.factory(self)
+            except Exception as e:
+                slot.state, slot.error = FAILED, f"{type(e).__name__}: {e}"
+                self.logger.error(f"Failed to load service {name}: {slot.error}")
+                raise
+            slot.instance, slot.error = instance, None
+            slot.seconds = time.perf_counter() - started
+            slot.state = READY
+            self.logger.info(f"Loaded service {name} in {slot.seconds:.2f}s")
+            return instance
+
+    async def aget(self, name: str):
+        """``get`` without blocking the event loop while the service loads."""
+        slot = self._slots[name]
+        if slot.state == READY:
+            return slot.instance
+        return await asyncio.to_thread(self.get, name)
+
+    def peek(self, name: str):
+        """The instance of ``name`` if it has been built, without building it."""
+        slot = self._slots[name]
+        return slot.instance if slot.state == READY else None
+
+    async def warm_up(self, names: Iterable[str]):
+        """Build ``names`` in order in a worker thread; failures are only recorded."""
+        for name in names:
+            try:
+                await self.aget(name)
+            except Exception:
+                pass
+
+    def status(self) -> Dict[str, Dict[str, object]]:
+        return {
+            name: {
+                "state": slot.state,
+                "seconds": round(slot.seconds, 3) if slot.seconds is not None else None,
+                "error": slot.error,
+            }
+            for name, slot in self._slots.items()
+        }
+
+    def is_ready(self, names: Iterable[str]) -> bool:
+        return all(self._slots[name].state == READY for name in names)
+
+
+def _embeddings(container: ServiceContainer):
+    from .knowledge_base import default_embeddings
+    return default_embeddings()
+
+
+def _llm(container: ServiceContainer):
+    from langchain_groq import ChatGroq
+    return ChatGroq(
+        model_name=GROQ_MODEL_NAME,
+        api_key=GROQ_API_KEY,
+        temperature=0.7
+    )
+
+
+def _interview_coach(container: ServiceContainer):
+    from .interview_coach import InterviewCoach
+    return InterviewCoach(llm=container.get("llm"), embeddings=container.get("embeddings"))
+
+
+def _cv_reviewer(container: ServiceContainer):
+    from .cv_review import CVReviewService
+    return CVReviewService(llm=container.get("llm"))
+
+
+def _profile_embeddings(container: ServiceContainer):
+    from .profile_embeddings import ProfileEmbeddingService
+    return ProfileEmbeddingService(container.get("embeddings"))
+
+
+def default_container() -> ServiceContainer:
+    container = ServiceContainer()
+    container.register("embeddings", _embeddings)
+    container.register("llm", _llm)
+    container.register("interview_coach", _interview_coach)
+    container.register("cv_reviewer", _cv_reviewer)
+    container.register("profile_embeddings", _profile_embeddings)
+    return container
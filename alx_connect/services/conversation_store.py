@@ -0,0 +1,399 @@
+"""Bounded conversation history for the interview coach.
+
+``ConversationStore`` is the interface the coach uses; two backends
+implement it:
+
+- ``InMemoryConversationStore`` keeps conversations in the process, for a
+  single worker.
+- ``SQLiteConversationStore`` keeps them in a SQLite database in WAL mode,
+  which every worker process on the host opens, so a session can move
+  between ``uvicorn --workers N`` processes.
+
+Both keep at most ``max_conversations`` conversations, dropping the least
+recently active, keep only the last ``max_messages`` messages of each
+(all the coach ever reads is ``context_window``), and drop conversations
+inactive for longer than ``ttl`` seconds in ``sweep``, which the API runs
+every ``cleanup_interval`` seconds.
+
+Messages go in and come out of the stores as ``ChatRecord``; the
+pydantic ``Message`` and ``ConversationState`` are only built by the
+dict-style access (``store[id]``, ``store.get``) that hands history out.
+"""
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from ..config.config import INTERVIEW_COACH_CONFIG
+from ..models.chat import ROLES, ChatRecord, ConversationState
+
+logger = logging.getLogger(__name__)
+
+_ROLE_INDEX = {role.value: index for index, role in enumerate(ROLES)}
+
+
+class ConversationStore(ABC):
+    """Conversation history by id.
+
+    Supports ``in``, ``len``, ``del`` and item access like the dict it
+    replaced; ``store[id]`` returns a ``ConversationState`` snapshot.
+    """
+
+    def __init__(self, max_conversations: int = INTERVIEW_COACH_CONFIG["max_conversations"],
+                 max_messages: int = INTERVIEW_COACH_CONFIG["context_window"],
+                 ttl: float = INTERVIEW_COACH_CONFIG["max_conversation_age"]):
+        self.max_conversations = max_conversations
+        self.max_messages = max_messages
+        self.ttl = ttl
+        self.evicted = 0
+        self.expired = 0
+
+    @abstractmethod
+    def append_many(self, conversation_id: str, messages: Sequence[ChatRecord]):
+        """Append ``messages`` to the conversation as one write."""
+
+    def append(self, conversation_id: str, message: ChatRecord):
+        self.append_many(conversation_id, [message])
+
+    @abstractmethod
+    def recent(self, conversation_id: str, limit: Optional[int] = None) -> List[ChatRecord]:
+        """The last ``limit`` messages (all kept ones by default), oldest first."""
+
+    def render(self, conversation_id: str, limit: Optional[int] = None) -> str:
+        """The last ``limit`` messages as ``role: content`` lines, for a prompt."""
+        return "\n".join(message.render() for message in self.recent(conversation_id, limit))
+
+    @abstractmethod
+    def idle_seconds(self, conversation_id: str) -> Optional[float]:
+        """Seconds since the conversation's last message, or None if it is not stored."""
+
+    @abstractmethod
+    def replace(self, conversation_id: str, messages: Sequence[ChatRecord], idle_seconds: float):
+        """Store ``messages`` as the whole conversation, last active ``idle_seconds`` ago."""
+
+    @abstractmethod
+    def delete(self, conversation_id: str) -> bool:
+        """Drop the conversation; False if it was not stored."""
+
+    @abstractmethod
+    def sweep(self) -> List[str]:
+        """Drop conversations inactive for longer than ``ttl``; returns their ids."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored conversations."""
+
+    def __contains__(self, conversation_id: str) -> bool:
+        return self.idle_seconds(conversation_id) is not None
+
+    def get(self, conversation_id: str, default=None) -> Optional[ConversationState]:
+        idle = self.idle_seconds(conversation_id)
+        if idle is None:
+            return default
+        return ConversationState(messages=[message.to_message() for message in self.recent(conversation_id)],
+                                 last_activity=datetime.now() - timedelta(seconds=idle))
+
+    def __getitem__(self, conversation_id: str) -> ConversationState:
+        state = self.get(conversation_id)
+        if state is None:
+            raise KeyError(conversation_id)
+        return state
+
+    def __setitem__(self, conversation_id: str, state: ConversationState):
+        self.replace(conversation_id, [ChatRecord.from_message(message) for message in state.messages], max((datetime.now() - state.last_activity).total_seconds(), 0.0))
+
+    def __delitem__(self, conversation_id: str):
+        if not self.delete(conversation_id):
+            raise KeyError(conversation_id)
+
+    def stats(self) -> Dict[str, int]:
+        return {"conversations": len(self), "evicted": self.evicted, "expired": self.expired}
+
+    def close(self):
+        pass
+
+
+class _Conversation:
+    __slots__ = ("messages", "last_activity")
+
+    def __init__(self, max_messages: int, last_activity: float):
+        self.messages: Deque[ChatRecord] = deque(maxlen=max_messages)
+        self.last_activity = last_activity
+
+
+class InMemoryConversationStore(ConversationStore):
+    """Conversations in this process, each with a ring buffer of recent messages.
+
+    Starting a conversation beyond ``max_conversations`` evicts the least
+    recently active one immediately.
+    """
+
+    def __init__(self, max_conversations: int = INTERVIEW_COACH_CONFIG["max_conversations"],
+                 max_messages: int = INTERVIEW_COACH_CONFIG["context_window"],
+                 ttl: float = INTERVIEW_COACH_CONFIG["max_conversation_age"],
+                 clock: Callable[[], float] = time.monotonic):
+        super().__init__(max_conversations, max_messages, ttl)
+        self.clock = clock
+        self._lock = threading.Lock()
+        # Least recently active first
+        self._conversations: "OrderedDict[str, _Conversation]" = OrderedDict()
+
+    def _touch(self, conversation_id: str, now: float) -> _Conversation:
+        conversation = self._conversations.get(conversation_id)
+        if conversation is None:
+            if len(self._conversations) >= self.max_conversations:
+                self._conversations.popitem(last=False)
+                self.evicted += 1
+            conversation = self._conversations[conversation_id] = _Conversation(self.max_messages, now)
+        else:
+            self._conversations.move_to_end(conversation_id)
+            conversation.last_activity = now
+        return conversation
+
+    def append_many(self, conversation_id: str, messages: Sequence[ChatRecord]):
+        with self._lock:
+            self._touch(conversation_id, self.clock()).messages.extend(messages)
+
+    def recent(self, conversation_id: str, limit: Optional[int] = None) -> List[ChatRecord]:
+        with self._lock:
+            conversation = self._conversations.get(conversation_id)
+            if conversation is None:
+                return []
+            messages = list(conversation.messages)
+        return messages[-limit:] if limit is not None and limit < len(messages) else messages
+
+    def idle_seconds(self, conversation_id: str) -> Optional[float]:
+        conversation = self._conversations.get(conversation_id)
+        return self.clock() - conversation.last_activity if conversation is not None else None
+
+    def replace(self, conversation_id: str, messages: Sequence[ChatRecord], idle_seconds: float):
+        with self._lock:
+            self._conversations.pop(conversation_id, None)
+            self._touch(conversation_id, self.clock() - idle_seconds).messages.extend(messages)
+
+    def delete(self, conversation_id: str) -> bool:
+        with self._lock:
+            return self._conversations.pop(conversation_id, None) is not None
+
+    def sweep(self) -> List[str]:
+        cutoff = self.clock() - self.ttl
+        with self._lock:
+            expired = [conversation_id for conversation_id, conversation in self._conversations.items()
+                       if conversation.last_activity < cutoff]
+            for conversation_id in expired:
+                del self._conversations[conversation_id]
+            self.expired += len(expired)
+        return expired
+
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+
+class _PendingAppend:
+    """An ``append_many`` waiting for a group commit, and its outcome."""
+    __slots__ = ("conversation_id", "messages", "now", "error")
+
+    def __init__(self, conversation_id: str, messages: List[ChatRecord], now: float):
+        self.conversation_id = conversation_id
+        self.messages = messages
+        self.now = now
+        # Set when the batch holding this append was rolled back
+        self.error: Optional[BaseException] = None
+
+
+class SQLiteConversationStore(ConversationStore):
+    """Conversations in a SQLite database shared by every worker process.
+
+    The database runs in WAL mode, so readers in any process never wait
+    for a writer. Messages are keyed by ``(conversation_id, seq)``, so the
+    last ``context_window`` messages are one backwards index range scan.
+    Each ``append_many`` is one transaction that also trims the
+    conversation to ``max_messages``. Appends from threads that arrive
+    while another thread is committing are grouped into that thread's next
+    transaction; if it rolls back, every grouped ``append_many`` raises.
+    ``max_conversations`` is enforced by ``sweep``.
+    Activity and message times are wall-clock seconds, comparable across
+    processes; message times are converted from and to the records'
+    monotonic clock on the way in and out.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS conversations ("
+        " id TEXT PRIMARY KEY, last_activity REAL NOT NULL, next_seq INTEGER NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS conversations_last_activity ON conversations (last_activity)",
+        "CREATE TABLE IF NOT EXISTS messages ("
+        " conversation_id TEXT NOT NULL, seq INTEGER NOT NULL, role TEXT NOT NULL,"
+        " content TEXT NOT NULL, created REAL NOT NULL, PRIMARY KEY (conversation_id, seq)) WITHOUT ROWID",
+    )
+
+    def __init__(self, path: str = INTERVIEW_COACH_CONFIG["conversation_db_path"],
+                 max_conversations: int = INTERVIEW_COACH_CONFIG["max_conversations"],
+                 max_messages: int = INTERVIEW_COACH_CONFIG["context_window"],
+                 ttl: float = INTERVIEW_COACH_CONFIG["max_conversation_age"],
+                 clock: Callable[[], float] = time.time):
+        super().__init__(max_conversations, max_messages, ttl)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.clock = clock
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: List[_PendingAppend] = []
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection; sqlite3 connections must not be shared between threads."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            # WAL with synchronous=NORMAL only syncs at checkpoints; commits stay atomic
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def append_many(self, conversation_id: str, messages: Sequence[ChatRecord]):
+        append = _PendingAppend(conversation_id, list(messages), self.clock())
+        with self._pending_lock:
+            self._pending.append(append)
+        # Group commit: whoever holds the write lock commits everything queued so far.
+        # Once this thread holds it, its own append has been committed or rolled back.
+        with self._write_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+            if pending:
+                try:
+                    self._write([(entry.conversation_id, entry.messages, entry.now) for entry in pending])
+                except BaseException as error:
+                    for entry in pending:
+                        entry.error = error
+        if append.error is not None:
+            raise append.error
+
+    def _write(self, pending: List[Tuple[str, Sequence[ChatRecord], float]]):
+        wall_offset = time.time() - time.monotonic()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for conversation_id, messages, now in pending:
+                row = connection.execute(
+                    "INSERT INTO conversations (id, last_activity, next_seq) VALUES (?, ?, 0) "
+                    "ON CONFLICT (id) DO UPDATE SET last_activity = excluded.last_activity "
+                    "RETURNING next_seq", (conversation_id, now)
+                ).fetchone()
+                first = row[0]
+                connection.executemany(
+                    "INSERT INTO messages (conversation_id, seq, role, content, created) VALUES (?, ?, ?, ?, ?)",
+                    [(conversation_id, first + i, ROLES[message.role_index].value, message.content,
+                      message.created + wall_offset) for i, message in enumerate(messages)]
+                )
+                next_seq = first + len(messages)
+                connection.execute("UPDATE conversations SET next_seq = ? WHERE id = ?", (next_seq, conversation_id))
+                connection.execute("DELETE FROM messages WHERE conversation_id = ? AND seq < ?",
+                                   (conversation_id, next_seq - self.max_messages))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def recent(self, conversation_id: str, limit: Optional[int] = None) -> List[ChatRecord]:
+        limit = self.max_messages if limit is None else min(limit, self.max_messages)
+        rows = self._connection().execute(
+            "SELECT role, content, created FROM messages WHERE conversation_id = ? ORDER BY seq DESC LIMIT ?",
+            (conversation_id, limit)
+        ).fetchall()
+        wall_offset = time.time() - time.monotonic()
+        return [ChatRecord(_ROLE_INDEX[role], content, created - wall_offset)
+                for role, content, created in reversed(rows)]
+
+    def idle_seconds(self, conversation_id: str) -> Optional[float]:
+        row = self._connection().execute(
+            "SELECT last_activity FROM conversations WHERE id = ?", (conversation_id,)
+        ).fetchone()
+        return self.clock() - row[0] if row is not None else None
+
+    def replace(self, conversation_id: str, messages: Sequence[ChatRecord], idle_seconds: float):
+        with self._write_lock:
+            self.delete(conversation_id)
+            self._write([(conversation_id, list(messages), self.clock() - idle_seconds)])
+
+    def _delete_where(self, connection: sqlite3.Connection, condition: str, parameters: tuple) -> List[str]:
+        ids = [row[0] for row in connection.execute(f"SELECT id FROM conversations WHERE {condition}", parameters)]
+        connection.executemany("DELETE FROM messages WHERE conversation_id = ?", [(i,) for i in ids])
+        connection.executemany("DELETE FROM conversations WHERE id = ?", [(i,) for i in ids])
+        return ids
+
+    def delete(self, conversation_id: str) -> bool:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            deleted = self._delete_where(connection, "id = ?", (conversation_id,))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return bool(deleted)
+
+    def sweep(self) -> List[str]:
+        """Drop expired conversations, then the least recently active beyond ``max_conversations``."""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            expired = self._delete_where(connection, "last_activity < ?", (self.clock() - self.ttl,))
+            excess = connection.execute("SELECT COUNT(*) FROM conversations").fetchone()[0] - self.max_conversations
+            evicted = self._delete_where(
+                connection, "id IN (SELECT id FROM conversations ORDER BY last_activity LIMIT ?)", (excess,)
+            ) if excess > 0 else []
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self.expired += len(expired)
+        self.evicted += len(evicted)
+        return expired + evicted
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM conversations").fetchone()[0]
+
+    def close(self):
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+CONVERSATION_STORES = {
+    "memory": InMemoryConversationStore,
+    "sqlite": SQLiteConversationStore,
+}
+
+
+def create_conversation_store(backend: str = INTERVIEW_COACH_CONFIG["conversation_store"], **kwargs) -> ConversationStore:
+    if backend not in CONVERSATION_STORES:
+        raise ValueError(f"Unknown conversation store {backend!r}; expected one of {sorted(CONVERSATION_STORES)}")
+    return CONVERSATION_STORES[backend](**kwargs)
+
+
+async def sweep_periodically(sweep: Callable[[], object], interval: float = INTERVIEW_COACH_CONFIG["cleanup_interval"]):
+    """Call ``sweep`` in a worker thread every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(sweep)
+        except Exception:
+            logger.exception("Conversation sweep failed")
@@ -6,9 +6,9 @@ from llama_parse import LlamaParse
 from ..config.config import GROQ_MODEL_NAME, GROQ_API_KEY
 
 class CVReviewService:
-    def __init__(self):
+    def __init__(self, llm=None):
         self.setup_logging()
-        self.llm = ChatGroq(
+        self.llm = llm if llm is not None else ChatGroq(
             model_name=GROQ_MODEL_NAME,
             api_key=GROQ_API_KEY,
             temperature=0.7
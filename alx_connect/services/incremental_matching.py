@@ -0,0 +1,354 @@
+import bisect
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from ..models.profile import Profile
+from ..models.profile_store import TermColumn
+from ..models.vocabulary import VocabularyInterner
+from ..config.config import MATCHING_CONFIG
+from .matching import Features, ImprovedMentorMatchingSystem
+
+# Ranking entries sort best first: (-score, mentor sequence, mentor id, breakdown)
+Entry = Tuple[float, int, str, Dict]
+
+
+class _Side:
+    """Append-only feature columns for the mentors or the mentees.
+
+    Updating or removing a profile tombstones its slot; ``compact`` drops
+    dead slots once they pile up.
+    """
+
+    def __init__(self, domains: VocabularyInterner, skills: VocabularyInterner, dimension: int = 0,
+                 extra_features: Optional[Callable[[List[Profile]], Features]] = None):
+        self.domain_interner = domains
+        self.skill_interner = skills
+        # Columns of added scoring kernels, kept as one precomputed row per slot
+        self.extra_features = extra_features or (lambda profiles: {})
+        self.extra: Dict[str, list] = {name: [] for name in self.extra_features([])}
+        self.slots: Dict[str, int] = {}
+        self.ids: List[Optional[str]] = []
+        self.profiles: Dict[str, Profile] = {}
+        self.size = 0
+        self.years = np.zeros(16, dtype=np.float64)
+        self.sequence = np.zeros(16, dtype=np.int64)
+        self.alive = np.zeros(16, dtype=bool)
+        # Score of the worst entry a mentee's ranking will still accept
+        self.floor = np.full(16, -np.inf)
+        # Whether a mentee's ranking dropped candidates that may be needed later
+        self.truncated = np.zeros(16, dtype=bool)
+        self.embeddings = np.zeros((16, dimension), dtype=np.float64)
+        self.domains = TermColumn(domains)
+        self.skills = TermColumn(skills)
+
+    @property
+    def dead(self) -> int:
+        return self.size - len(self.slots)
+
+    def set_dimension(self, dimension: int):
+        self.embeddings = np.zeros((len(self.years), dimension), dtype=np.float64)
+
+    def _grow(self):
+        capacity = 2 * len(self.years)
+        for name in ("years", "sequence", "alive", "truncated"):
+            setattr(self, name, np.resize(getattr(self, name), capacity))
+        floor = np.full(capacity, -np.inf)
+        floor[:self.size] = self.floor[:self.size]
+        self.floor = floor
+        embeddings = np.zeros((capacity, self.embeddings.shape[1]), dtype=np.float64)
+        embeddings[:self.size] = self.embeddings[:self.size]
+        self.embeddings = embeddings
+
+    def append(self, profile: Profile, sequence: int, embedding: np.ndarray) -> int:
+        if self.size == len(self.years):
+            self._grow()
+        slot = self.size
+        self.years[slot] = profile.cumulative_year
+        self.sequence[slot] = sequence
+        self.alive[slot] = True
+        self.floor[slot] = -np.inf
+        self.truncated[slot] = False
+        if self.embeddings.shape[1]:
+            self.embeddings[slot] = embedding
+        self.domains.append(profile.industry_domains)
+        self.skills.append(profile.extracted_skills)
+        for name, values in self.extra_features([profile]).items():
+            self.extra[name].append(values)
+        self.ids.append(profile.id)
+        self.slots[profile.id] = slot
+        self.profiles[profile.id] = profile
+        self.size += 1
+        return slot
+
+    def remove(self, profile_id: str) -> Profile:
+        slot = self.slots.pop(profile_id)
+        self.alive[slot] = False
+        self.ids[slot] = None
+        return self.profiles.pop(profile_id)
+
+    def features(self) -> Features:
+        features = {
+            "years": self.years[:self.size],
+            "embeddings": self.embeddings[:self.size],
+            "domains": self.domains.matrix(),
+            "skills": self.skills.matrix(),
+        }
+        if self.size:
+            for name, rows in self.extra.items():
+                features[name] = sp.vstack(rows, format="csr") if sp.issparse(rows[0]) else np.concatenate(rows)
+        else:
+            features.update(self.extra_features([]))
+        return features
+
+    def compact(self):
+        live = np.flatnonzero(self.alive[:self.size])
+        years, sequence = self.years[live], self.sequence[live]
+        floor, truncated = self.floor[live], self.truncated[live]
+        embeddings = self.embeddings[live]
+        profiles = [self.profiles[self.ids[slot]] for slot in live]
+
+        self.__init__(self.domain_interner, self.skill_interner, self.embeddings.shape[1], self.extra_features)
+        for i, profile in enumerate(profiles):
+            self.append(profile, int(sequence[i]), embeddings[i])
+        self.years[:len(live)] = years
+        self.floor[:len(live)] = floor
+        self.truncated[:len(live)] = truncated
+
+
+class IncrementalMatcher:
+    """Keeps every mentee's top-K mentors current as single profiles change.
+
+    Each mentee holds a sorted ranking of up to ``top_k + slack`` mentors and
+    each mentor keeps reverse links to the mentees ranking it. Inserting or
+    updating a profile rescores only that profile against the other side;
+    removing a mentor patches the mentees linked to it. A mentee whose
+    ranking had dropped candidates and falls below ``top_k`` entries is
+    rescored against all mentors, so the result always equals
+    ``find_matches(profiles, top_k=top_k)`` over the profiles in insertion
+    order.
+    """
+
+    def __init__(self, matching_system: Optional[ImprovedMentorMatchingSystem] = None,
+                 top_k: int = MATCHING_CONFIG["incremental_top_k"],
+                 slack: int = MATCHING_CONFIG["incremental_slack"],
+                 min_score: float = MATCHING_CONFIG["min_score"]):
+        if top_k < 1:
+            raise ValueError("top_k must be a positive integer")
+        self.matching_system = matching_system or ImprovedMentorMatchingSystem()
+        self.top_k = top_k
+        self.capacity = top_k + max(slack, 0)
+        self.min_score = min_score
+        self.dimension: Optional[int] = None
+        self.domains = VocabularyInterner()
+        self.skills = VocabularyInterner()
+        # Shared with added kernels, so their vocabularies span both sides too
+        self.context = {"domains": self.domains, "skills": self.skills}
+        self.mentors = _Side(self.domains, self.skills, extra_features=self._extra_features)
+        self.mentees = _Side(self.domains, self.skills, extra_features=self._extra_features)
+        self.sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+        self.rankings: Dict[str, List[Entry]] = {}
+        self.reverse: Dict[str, Set[str]] = defaultdict(set)
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable[Profile], chunk_size: int = MATCHING_CONFIG["chunk_size"],
+                      **kwargs) -> "IncrementalMatcher":
+        """Build all rankings in chunked blocks rather than one profile at a time."""
+        matcher = cls(**kwargs)
+        for profile in profiles:
+            if profile.id in matcher.sequence:
+                matcher._discard(profile.id)
+            matcher._add(profile)
+        mentor_features = matcher._side_features(matcher.mentors)
+        mentee_features = matcher._side_features(matcher.mentees)
+        for start in range(0, matcher.mentees.size, chunk_size):
+            chunk = {name: values[start:start + chunk_size] for name, values in mentee_features.items()}
+            total, components = matcher.matching_system.score_block(mentor_features, chunk)
+            total[:, ~matcher.mentors.alive[:matcher.mentors.size]] = -np.inf
+            for row in range(total.shape[0]):
+                mentee_id = matcher.mentees.ids[start + row]
+                if mentee_id is not None:
+                    matcher._set_ranking(mentee_id, *matcher._rank(total[row], components, row))
+        return matcher
+
+    def __len__(self) -> int:
+        return len(self.sequence)
+
+    def __contains__(self, profile_id: str) -> bool:
+        return profile_id in self.sequence
+
+    def _embedding(self, profile: Profile) -> np.ndarray:
+        if profile.semantic_embedding is None:
+            return np.zeros(self.dimension or 0)
+        row = self.matching_system._embedding_matrix([profile])[0]
+        if self.dimension is None:
+            # Nothing embedded yet, so the zero-width columns can simply be replaced
+            self.dimension = len(row)
+            self.mentors.set_dimension(self.dimension)
+            self.mentees.set_dimension(self.dimension)
+        elif len(row) != self.dimension:
+            raise ValueError(f"Expected embedding of dimension {self.dimension}, got {len(row)}")
+        return row
+
+    def _extra_features(self, profiles: List[Profile]) -> Features:
+        return self.matching_system.precompute_features(profiles, self.context, builtin=False)
+
+    def _query_features(self, profile: Profile) -> Features:
+        features = {
+            "years": np.array([profile.cumulative_year], dtype=np.float64),
+            "embeddings": self._embedding(profile).reshape(1, -1),
+            "domains": self.domains.encode([profile.industry_domains]),
+            "skills": self.skills.encode([profile.extracted_skills]),
+        }
+        features.update(self._extra_features([profile]))
+        return self.matching_system.encode_features(features)
+
+    def _side_features(self, side: _Side) -> Features:
+        # Sides keep float64 embeddings; scoring sees them at the configured precision
+        return self.matching_system.encode_features(side.features())
+
+    def _add(self, profile: Profile):
+        if profile.id not in self.sequence:
+            self.sequence[profile.id] = self._next_sequence
+            self._next_sequence += 1
+        side = self.mentors if self.matching_system.is_mentor(profile) else self.mentees
+        embedding = self._embedding(profile)
+        side.append(profile, self.sequence[profile.id], embedding)
+
+    def _rank(self, scores: np.ndarray, components: Dict[str, np.ndarray], row: int) -> Tuple[List[Entry], bool]:
+        """Best ``capacity`` mentors from one row of scores, ties in insertion order."""
+        candidates = np.flatnonzero(scores > self.min_score)
+        truncated = len(candidates) > self.capacity
+        if truncated:
+            values = scores[candidates]
+            kth = np.partition(values, len(values) - self.capacity)[len(values) - self.capacity]
+            candidates = candidates[values >= kth]
+        order = np.lexsort((self.mentors.sequence[candidates], -scores[candidates]))[:self.capacity]
+
+        entries = []
+        for slot in candidates[order]:
+            breakdown = {name: float(values[row, slot]) for name, values in components.items()}
+            entries.append((-float(scores[slot]), int(self.mentors.sequence[slot]), self.mentors.ids[slot], breakdown))
+        return entries, truncated
+
+    def _update_floor(self, mentee_id: str):
+        slot = self.mentees.slots[mentee_id]
+        ranking = self.rankings[mentee_id]
+        full = len(ranking) >= self.capacity
+        # A truncated ranking is only an exact prefix, so nothing below its tail may join
+        if ranking and (full or self.mentees.truncated[slot]):
+            self.mentees.floor[slot] = -ranking[-1][0]
+        else:
+            self.mentees.floor[slot] = -np.inf
+
+    def _set_ranking(self, mentee_id: str, entries: List[Entry], truncated: bool):
+        for entry in self.rankings.get(mentee_id, ()):
+            self.reverse[entry[2]].discard(mentee_id)
+        self.rankings[mentee_id] = entries
+        for entry in entries:
+            self.reverse[entry[2]].add(mentee_id)
+        self.mentees.truncated[self.mentees.slots[mentee_id]] = truncated
+        self._update_floor(mentee_id)
+
+    def _rescore_mentee(self, mentee_id: str):
+        query = self._query_features(self.mentees.profiles[mentee_id])
+        total, components = self.matching_system.score_block(self._side_features(self.mentors), query)
+        total[0, ~self.mentors.alive[:self.mentors.size]] = -np.inf
+        self._set_ranking(mentee_id, *self._rank(total[0], components, 0))
+
+    def _offer_mentor(self, mentor: Profile):
+        """Score one mentor against every mentee and insert it where it ranks."""
+        query = self._query_features(mentor)
+        total, components = self.matching_system.score_block(query, self._side_features(self.mentees))
+        scores = total[:, 0]
+        size = self.mentees.size
+        alive = self.mentees.alive[:size]
+        eligible = alive & (scores > self.min_score)
+        # Rankings that can neither take nor must remember this mentor are skipped in bulk
+        accepted = eligible & (scores >= self.mentees.floor[:size])
+        self.mentees.truncated[:size] |= eligible & ~accepted
+
+        sequence = self.sequence[mentor.id]
+        for slot in np.flatnonzero(accepted):
+            mentee_id = self.mentees.ids[slot]
+            ranking = self.rankings[mentee_id]
+            breakdown = {name: float(values[slot, 0]) for name, values in components.items()}
+            entry = (-float(scores[slot]), sequence, mentor.id, breakdown)
+            if self.mentees.truncated[slot] and ranking and entry[:2] > ranking[-1][:2]:
+                continue
+            if len(ranking) >= self.capacity:
+                if entry[:2] > ranking[-1][:2]:
+                    self.mentees.truncated[slot] = True
+                    continue
+                dropped = ranking.pop()
+                self.reverse[dropped[2]].discard(mentee_id)
+                self.mentees.truncated[slot] = True
+            # Sequences are unique, so tuple order never reaches the breakdown dict
+            bisect.insort(ranking, entry)
+            self.reverse[mentor.id].add(mentee_id)
+            self._update_floor(mentee_id)
+
+    def _discard(self, profile_id: str) -> Set[str]:
+        """Drop a profile from its side; return mentees that lost a ranked mentor."""
+        if profile_id in self.mentees.slots:
+            for entry in self.rankings.pop(profile_id, ()):
+                self.reverse[entry[2]].discard(profile_id)
+            self.mentees.remove(profile_id)
+            return set()
+
+        self.mentors.remove(profile_id)
+        affected = self.reverse.pop(profile_id, set())
+        for mentee_id in affected:
+            ranking = self.rankings[mentee_id]
+            ranking[:] = [entry for entry in ranking if entry[2] != profile_id]
+            self._update_floor(mentee_id)
+        return affected
+
+    def _repair(self, affected: Set[str]):
+        for mentee_id in affected:
+            if mentee_id not in self.rankings:
+                continue
+            slot = self.mentees.slots[mentee_id]
+            if self.mentees.truncated[slot] and len(self.rankings[mentee_id]) < self.top_k:
+                self._rescore_mentee(mentee_id)
+
+    def _maybe_compact(self):
+        for side in (self.mentors, self.mentees):
+            if side.dead > max(1024, len(side.slots)):
+                side.compact()
+
+    def upsert(self, profile: Profile):
+        """Insert a new profile or replace the one with the same id."""
+        if profile.id in self.sequence:
+            # Repair before the new version is offered: a ranking emptied by
+            # the discard has no floor and would take a worse mentor as complete
+            self._repair(self._discard(profile.id))
+        self._add(profile)
+        if self.matching_system.is_mentor(profile):
+            self._offer_mentor(profile)
+        else:
+            self._rescore_mentee(profile.id)
+        self._maybe_compact()
+
+    def remove(self, profile_id: str):
+        affected = self._discard(profile_id)
+        del self.sequence[profile_id]
+        self._repair(affected)
+        self._maybe_compact()
+
+    def matches(self, mentee_id: str) -> List[Tuple[Profile, Profile, float, Dict]]:
+        mentee = self.mentees.profiles[mentee_id]
+        return [
+            (self.mentors.profiles[mentor_id], mentee, -negative_score, breakdown)
+            for negative_score, _, mentor_id, breakdown in self.rankings[mentee_id][:self.top_k]
+        ]
+
+    def all_matches(self) -> List[Tuple[Profile, Profile, float, Dict]]:
+        """Every mentee's top-K, in the same layout and order as ``find_matches``."""
+        matches = []
+        for mentee_id in sorted(self.rankings, key=self.sequence.__getitem__):
+            matches.extend(self.matches(mentee_id))
+        return matches
@@ -1,25 +1,55 @@
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List
+import time
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
 from langchain_groq import ChatGroq
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.chains import RetrievalQA
 from langchain.prompts import ChatPromptTemplate
 from langchain_community.vectorstores import FAISS
 from langchain_huggingface import HuggingFaceEmbeddings
-from ..models.chat import Message, MessageRole, ConversationState
-from ..config.config import INTERVIEW_COACH_CONFIG, GROQ_MODEL_NAME, GROQ_API_KEY
+from ..models.chat import ChatRecord, MessageRole
+from .answer_cache import SemanticAnswerCache, context_fingerprint
+from .conversation_store import ConversationStore, create_conversation_store
+from .knowledge_base import format_qa_row, load_knowledge_base
+from .request_metrics import StageTimer
+from ..models.snapshot import current_version
+from ..config.config import ANSWER_CACHE_CONFIG, INTERVIEW_COACH_CONFIG, KNOWLEDGE_BASE_CONFIG, GROQ_MODEL_NAME, GROQ_API_KEY
+
+QA_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "You are an expert interview coach. Use the following context to help answer the question. If you don't know the answer, say you don't know.\n\nContext: {context}"),
+    ("human", "{question}")
+])
+
+# Rough characters per Llama token in English text; prompt budgets are estimates
+CHARS_PER_TOKEN = 4
+
+def fit_to_budget(texts: Iterable[str], max_tokens: int, separator: str = "\n") -> List[str]:
+    """The leading ``texts`` that fit in about ``max_tokens`` when joined; a first text over budget is cut."""
+    remaining = max_tokens * CHARS_PER_TOKEN
+    kept = []
+    for text in texts:
+        if len(text) > remaining:
+            if not kept:
+                kept.append(text[:remaining])
+            break
+        kept.append(text)
+        remaining -= len(text) + len(separator)
+    return kept
 
 class InterviewCoach:
-    def __init__(self):
+    def __init__(self, llm=None, embeddings=None, answer_cache: Optional[SemanticAnswerCache] = None,
+                 conversations: Optional[ConversationStore] = None):
         self.setup_logging()
-        self.conversations: Dict[str, ConversationState] = {}
-        self.llm = ChatGroq(
+        self.conversations = conversations if conversations is not None else create_conversation_store()
+        self.llm = llm if llm is not None else ChatGroq(
             model_name=GROQ_MODEL_NAME,
             api_key=GROQ_API_KEY,
             temperature=0.7
         )
-        self.initialize_rag()
+        if answer_cache is None and ANSWER_CACHE_CONFIG["enabled"]:
+            answer_cache = SemanticAnswerCache()
+        self.answer_cache = answer_cache
+        self.initialize_rag(embeddings)
 
     def setup_logging(self):
         logging.basicConfig(
@@ -28,45 +58,159 @@ class InterviewCoach:
         )
         self.logger = logging.getLogger(__name__)
 
-    def initialize_rag(self):
-        self.embeddings = HuggingFaceEmbeddings()
+    def initialize_rag(self, embeddings=None):
+        self.embeddings = embeddings if embeddings is not None else HuggingFaceEmbeddings(model_name=KNOWLEDGE_BASE_CONFIG["embedding_model"])
         self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200
-        )
-        self.vectorstore = FAISS.from_texts(
-            ["Initial empty document"],
-            self.embeddings
+            chunk_size=KNOWLEDGE_BASE_CONFIG["chunk_size"],
+            chunk_overlap=KNOWLEDGE_BASE_CONFIG["chunk_overlap"]
         )
+        # Built offline by `python -m alx_connect.services.knowledge_base`
+        self.vectorstore = load_knowledge_base(self.embeddings, KNOWLEDGE_BASE_CONFIG["path"])
+        self.knowledge_base_checked = time.monotonic()
+        if self.vectorstore is None:
+            self.logger.warning(f"No knowledge base published in {KNOWLEDGE_BASE_CONFIG['path']}; answering without interview Q&A context")
+            self.vectorstore = FAISS.from_texts(
+                ["Initial empty document"],
+                self.embeddings
+            )
+        else:
+            self.logger.info(f"Loaded knowledge base {self.vectorstore.knowledge_base_version} ({self.vectorstore.index.ntotal} documents)")
 
     def process_csv_data(self, csv_data: List[Dict[str, str]]) -> List[str]:
-        processed_texts = []
-        for row in csv_data:
-            text = f"""
-            Question: {row.get('question', '')}
-            Answer: {row.get('answer', '')}
-            Category: {row.get('category', '')}
-            Difficulty: {row.get('difficulty', '')}
-            """
-            processed_texts.append(text)
-        return processed_texts
+        return [format_qa_row(row) for row in csv_data]
+
+    def refresh_knowledge_base(self, force: bool = False) -> bool:
+        """Switch to a newly published knowledge base version; True if it switched.
+
+        ``CURRENT`` is checked at most every ``refresh_interval`` seconds
+        unless ``force`` is set.
+        """
+        now = time.monotonic()
+        if not force and now - self.knowledge_base_checked < KNOWLEDGE_BASE_CONFIG["refresh_interval"]:
+            return False
+        self.knowledge_base_checked = now
+        version = current_version(KNOWLEDGE_BASE_CONFIG["path"])
+        if version is None or version == getattr(self.vectorstore, "knowledge_base_version", None):
+            return False
+        self.vectorstore = load_knowledge_base(self.embeddings, KNOWLEDGE_BASE_CONFIG["path"], version)
+        self.logger.info(f"Switched to knowledge base {version} ({self.vectorstore.index.ntotal} documents)")
+        return True
+
+    def get_vectorstore(self) -> FAISS:
+        """The current knowledge base, switching to a newly published version first."""
+        self.refresh_knowledge_base()
+        return self.vectorstore
 
     def create_rag_chain(self) -> RetrievalQA:
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are an expert interview coach. Use the following context to help answer the question. If you don't know the answer, say you don't know.\n\nContext: {context}"),
-            ("human", "{question}")
-        ])
+        """A standalone RetrievalQA chain over the current knowledge base.
 
+        Kept for callers that want a LangChain chain; requests do not use
+        it, as ``prepare_prompt`` shares one query embedding between
+        retrieval and the answer cache.
+        """
         return RetrievalQA.from_chain_type(
             llm=self.llm,
             chain_type="stuff",
-            retriever=self.vectorstore.as_retriever(),
+            retriever=self.vectorstore.as_retriever(search_kwargs={"k": INTERVIEW_COACH_CONFIG["retrieval_k"]}),
             chain_type_kwargs={
-                "prompt": prompt,
+                "prompt": QA_PROMPT,
                 "document_variable_name": "context"
             }
         )
 
+    async def retrieve(self, query: str, timer: StageTimer):
+        """The current knowledge base, the query's embedding and the documents retrieved with it."""
+        vectorstore = self.get_vectorstore()
+        with timer.stage("embedding"):
+            embedding = await self.embeddings.aembed_query(query)
+        with timer.stage("retrieval"):
+            documents = await vectorstore.asimilarity_search_by_vector(
+                embedding, k=INTERVIEW_COACH_CONFIG["retrieval_k"]
+            )
+        return vectorstore, embedding, documents
+
+    def build_retrieval_query(self, question: str, history: Sequence[ChatRecord]) -> str:
+        """``question`` followed by the conversation's last few earlier questions, newest first.
+
+        A follow-up like "and for a senior role?" retrieves nothing useful
+        on its own. The question leads because the embedding model
+        truncates long inputs from the end.
+        """
+        earlier = [message.content for message in reversed(history) if message.role is MessageRole.USER]
+        return "\n".join([question, *earlier[:INTERVIEW_COACH_CONFIG["query_history_messages"]]])
+
+    def get_prompt_history(self, history: Sequence[ChatRecord]) -> str:
+        """``history`` within ``history_token_budget``, dropping the oldest messages first."""
+        lines = fit_to_budget((message.render() for message in reversed(history)),
+                              INTERVIEW_COACH_CONFIG["history_token_budget"])
+        return "\n".join(reversed(lines))
+
+    async def prepare_prompt(self, question: str, conversation_id: Optional[str], timer: StageTimer):
+        """The question's retrieval embedding, answer cache fingerprint and LLM prompt.
+
+        The conversation is read once. Retrieval runs on
+        ``build_retrieval_query``, embedded once. The
+        prompt holds the retrieved documents and the conversation so far,
+        each within its token budget; the fingerprint covers both, so an
+        answer shaped by one conversation is not reused in another.
+        """
+        with timer.stage("history"):
+            history = self.conversations.recent(conversation_id, INTERVIEW_COACH_CONFIG["context_window"]) if conversation_id else []
+            query = self.build_retrieval_query(question, history)
+            prompt_history = self.get_prompt_history(history)
+        vectorstore, embedding, documents = await self.retrieve(query, timer)
+        context = "\n\n".join(fit_to_budget((document.page_content for document in documents),
+                                            INTERVIEW_COACH_CONFIG["context_token_budget"], "\n\n"))
+        if prompt_history:
+            context = f"{context}\n\nConversation so far:\n{prompt_history}"
+        fingerprint = context_fingerprint(documents, getattr(vectorstore, "knowledge_base_version", None), prompt_history)
+        return embedding, fingerprint, QA_PROMPT.format_messages(context=context, question=question)
+
+    async def generate_response(self, message: str, conversation_id: str,
+                                timer: Optional[StageTimer] = None) -> AsyncIterator[str]:
+        """Stream the coach's reply to a chat ``message`` as the LLM produces tokens.
+
+        The reply is grounded in the knowledge base and the recent
+        conversation (see ``prepare_prompt``). Both messages are added to
+        the conversation once the reply is complete; a reply cut short by
+        closing the generator is not recorded.
+        """
+        timer = timer or StageTimer()
+        _, _, messages = await self.prepare_prompt(message, conversation_id, timer)
+
+        parts = []
+        with timer.stage("llm"):
+            async for chunk in self.llm.astream(messages):
+                if chunk.content:
+                    if not parts:
+                        timer.add("first_token", time.perf_counter() - timer.started)
+                    parts.append(chunk.content)
+                    yield chunk.content
+        self.record_turn(conversation_id, message, "".join(parts))
+
+    async def answer_question(self, question: str, timer: Optional[StageTimer] = None,
+                              conversation_id: Optional[str] = None) -> Tuple[str, bool]:
+        """Answer ``question`` from the knowledge base; returns the answer and whether it was cached.
+
+        With a ``conversation_id`` the question is read as part of that
+        conversation (see ``prepare_prompt``). The one retrieval embedding
+        is also the semantic answer cache key.
+        """
+        timer = timer or StageTimer()
+        embedding, fingerprint, messages = await self.prepare_prompt(question, conversation_id, timer)
+
+        if self.answer_cache is not None:
+            with timer.stage("cache"):
+                answer = self.answer_cache.get(embedding, fingerprint)
+            if answer is not None:
+                return answer, True
+
+        response = await self.llm.ainvoke(messages, config={"callbacks": [timer]})
+        answer = response.content
+        if self.answer_cache is not None:
+            self.answer_cache.put(embedding, fingerprint, answer)
+        return answer, False
+
     def clean_response(self, response: str) -> str:
         # Remove any markdown code blocks
         response = response.replace("```", "")
@@ -75,30 +219,19 @@ class InterviewCoach:
         return response.strip()
 
     def get_conversation_context(self, conversation_id: str, context_window: int = INTERVIEW_COACH_CONFIG["context_window"]) -> str:
-        if conversation_id not in self.conversations:
-            return ""
-        
-        messages = self.conversations[conversation_id].messages
-        recent_messages = messages[-context_window:]
-        return "\n".join([f"{msg.role}: {msg.content}" for msg in recent_messages])
+        return self.conversations.render(conversation_id, context_window)
 
     def add_message_to_conversation(self, conversation_id: str, role: MessageRole, content: str):
-        if conversation_id not in self.conversations:
-            self.conversations[conversation_id] = ConversationState()
-        
-        message = Message(role=role, content=content)
-        self.conversations[conversation_id].messages.append(message)
-        self.conversations[conversation_id].last_activity = datetime.now()
+        self.conversations.append(conversation_id, ChatRecord.create(role, content))
+
+    def record_turn(self, conversation_id: str, question: str, answer: str):
+        """Add a question and its answer to the conversation in one store write."""
+        messages = [ChatRecord.create(MessageRole.USER, question)]
+        if answer.strip():
+            messages.append(ChatRecord.create(MessageRole.ASSISTANT, answer))
+        self.conversations.append_many(conversation_id, messages)
 
     def clean_inactive_conversations(self):
-        current_time = datetime.now()
-        inactive_threshold = timedelta(seconds=INTERVIEW_COACH_CONFIG["max_conversation_age"])
-        
-        inactive_ids = [
-            conv_id for conv_id, state in self.conversations.items()
-            if current_time - state.last_activity > inactive_threshold
-        ]
-        
-        for conv_id in inactive_ids:
-            del self.conversations[conv_id]
-            self.logger.info(f"Cleaned up inactive conversation: {conv_id}") 
\ No newline at end of file
+        inactive_ids = self.conversations.sweep()
+        if inactive_ids:
+            self.logger.info(f"Cleaned up {len(inactive_ids)} inactive conversations")
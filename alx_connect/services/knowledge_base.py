@@ -0,0 +1,251 @@
+"""Persistent FAISS knowledge base of interview Q&A for the interview coach.
+
+The index is built offline from Q&A CSVs (``question``, ``answer``,
+``category``, ``difficulty`` columns) and published as numbered versions
+under a root directory, like profile snapshots::
+
+    root/
+      CURRENT                 -> "v000002"
+      v000002/
+        manifest.json         format, embedding model, document count
+        index.faiss           FAISS index, row i is document i
+        documents.jsonl       id, text and metadata of each document, in row order
+
+Build or extend it with::
+
+    python -m alx_connect.services.knowledge_base questions.csv more.csv
+    python -m alx_connect.services.knowledge_base new_questions.csv --append
+
+CSV rows are read in batches of ``batch_size`` and embedded in batches of
+``embedding_batch_size``, so a large CSV is never held in memory at once.
+Documents are keyed by a hash of their text: appending a question set that
+overlaps the index only embeds the new questions. At startup the coach
+memory-maps the current version read-only instead of rebuilding anything.
+"""
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+
+from ..config.config import KNOWLEDGE_BASE_CONFIG
+from ..models.snapshot import current_version, publish_version
+
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+INDEX_FILE = "index.faiss"
+DOCUMENTS_FILE = "documents.jsonl"
+QA_FIELDS = ("question", "answer", "category", "difficulty")
+
+logger = logging.getLogger(__name__)
+
+
+def format_qa_row(row: Dict[str, str]) -> str:
+    return f"""
+            Question: {row.get('question', '')}
+            Answer: {row.get('answer', '')}
+            Category: {row.get('category', '')}
+            Difficulty: {row.get('difficulty', '')}
+            """
+
+
+def document_id(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def iter_csv_batches(paths: Sequence[str], batch_size: int = KNOWLEDGE_BASE_CONFIG["batch_size"]) -> Iterator[List[Dict[str, str]]]:
+    """Rows of the CSVs at ``paths`` in lists of at most ``batch_size``.
+
+    Header names are matched case-insensitively; each row also carries its
+    ``source`` file and 1-based ``row`` number.
+    """
+    batch = []
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for number, row in enumerate(reader, start=1):
+                row = {(key or "").strip().lower(): (value or "").strip() for key, value in row.items()}
+                if not row.get("question"):
+                    continue
+                row["source"], row["row"] = os.path.basename(path), number
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+    if batch:
+        yield batch
+
+
+def default_embeddings(model_name: str = KNOWLEDGE_BASE_CONFIG["embedding_model"]):
+    from langchain_huggingface import HuggingFaceEmbeddings
+    return HuggingFaceEmbeddings(model_name=model_name)
+
+
+def embeddings_model_name(embeddings) -> str:
+    return getattr(embeddings, "model_name", None) or type(embeddings).__name__
+
+
+def _read_manifest(directory: str) -> dict:
+    with open(os.path.join(directory, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+    if manifest["format_version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported knowledge base format {manifest['format_version']}")
+    return manifest
+
+
+def load_knowledge_base(embeddings, root: str = KNOWLEDGE_BASE_CONFIG["path"], version: Optional[str] = None,
+                        mmap: bool = True) -> Optional[FAISS]:
+    """The published knowledge base as a FAISS vector store, or None when there is none.
+
+    With ``mmap`` the index is memory-mapped read-only, so processes serving
+    the same version share one page-cache copy; pass ``mmap=False`` to load
+    a writable copy to extend.
+    """
+    import faiss
+
+    version = version or current_version(root)
+    if version is None:
+        return None
+    directory = os.path.join(root, version)
+    manifest = _read_manifest(directory)
+    model_name = embeddings_model_name(embeddings)
+    if manifest["embedding_model"] != model_name:
+        raise ValueError(
+            f"Knowledge base {directory} was embedded with {manifest['embedding_model']!r}, not {model_name!r}"
+        )
+
+    flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+    index = faiss.read_index(os.path.join(directory, INDEX_FILE), flags)
+    documents, index_to_docstore_id = {}, {}
+    with open(os.path.join(directory, DOCUMENTS_FILE), encoding="utf-8") as f:
+        for position, line in enumerate(f):
+            record = json.loads(line)
+            documents[record["id"]] = Document(page_content=record["text"], metadata=record["metadata"])
+            index_to_docstore_id[position] = record["id"]
+    if len(index_to_docstore_id) != index.ntotal:
+        raise ValueError(f"Knowledge base {directory} has {index.ntotal} vectors but {len(documents)} documents")
+
+    vectorstore = FAISS(embeddings, index, InMemoryDocstore(documents), index_to_docstore_id)
+    vectorstore.knowledge_base_version = version
+    return vectorstore
+
+
+def write_knowledge_base(vectorstore: FAISS, root: str = KNOWLEDGE_BASE_CONFIG["path"],
+                         keep: int = KNOWLEDGE_BASE_CONFIG["keep_versions"]) -> str:
+    """Publish ``vectorstore`` as a new version of ``root`` and return its name.
+
+    Written to a staging directory and published by replacing ``CURRENT``,
+    so a coach starting meanwhile loads either the old or the new version.
+    """
+    import faiss
+
+    def write(directory: str):
+        faiss.write_index(vectorstore.index, os.path.join(directory, INDEX_FILE))
+        with open(os.path.join(directory, DOCUMENTS_FILE), "w", encoding="utf-8") as f:
+            for position in range(vectorstore.index.ntotal):
+                doc_id = vectorstore.index_to_docstore_id[position]
+                document = vectorstore.docstore.search(doc_id)
+                f.write(json.dumps({"id": doc_id, "text": document.page_content, "metadata": document.metadata}) + "\n")
+        with open(os.path.join(directory, MANIFEST_FILE), "w") as f:
+            json.dump({
+                "format_version": FORMAT_VERSION,
+                "embedding_model": embeddings_model_name(vectorstore.embeddings),
+                "documents": int(vectorstore.index.ntotal),
+                "dimension": int(vectorstore.index.d),
+            }, f)
+
+    return publish_version(root, write, keep)
+
+
+class KnowledgeBaseIndexer:
+    """Embeds Q&A CSVs into a FAISS knowledge base and publishes it."""
+
+    def __init__(self, embeddings, root: str = KNOWLEDGE_BASE_CONFIG["path"],
+                 batch_size: int = KNOWLEDGE_BASE_CONFIG["batch_size"],
+                 embedding_batch_size: int = KNOWLEDGE_BASE_CONFIG["embedding_batch_size"]):
+        self.embeddings = embeddings
+        self.root = root
+        self.batch_size = batch_size
+        self.embedding_batch_size = embedding_batch_size
+        self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=KNOWLEDGE_BASE_CONFIG["chunk_size"],
+            chunk_overlap=KNOWLEDGE_BASE_CONFIG["chunk_overlap"]
+        )
+
+    def documents(self, rows: Iterable[Dict[str, str]]) -> List[Document]:
+        texts, metadatas = [], []
+        for row in rows:
+            texts.append(format_qa_row(row))
+            metadatas.append({key: row[key] for key in ("category", "difficulty", "source", "row") if key in row})
+        return self.text_splitter.create_documents(texts, metadatas)
+
+    def index(self, paths: Sequence[str], append: bool = False) -> Dict[str, object]:
+        """Index the CSVs at ``paths`` and publish the result.
+
+        With ``append`` the current version is extended; otherwise a new
+        index is built from ``paths`` alone. Returns the published version
+        and document counts.
+        """
+        vectorstore = load_knowledge_base(self.embeddings, self.root, mmap=False) if append else None
+        seen = set(vectorstore.index_to_docstore_id.values()) if vectorstore is not None else set()
+        added = skipped = 0
+
+        for rows in iter_csv_batches(paths, self.batch_size):
+            batch = []
+            for document in self.documents(rows):
+                doc_id = document_id(document.page_content)
+                if doc_id in seen:
+                    skipped += 1
+                    continue
+                seen.add(doc_id)
+                batch.append((doc_id, document))
+
+            for start in range(0, len(batch), self.embedding_batch_size):
+                chunk = batch[start:start + self.embedding_batch_size]
+                texts = [document.page_content for _, document in chunk]
+                text_embeddings = list(zip(texts, self.embeddings.embed_documents(texts)))
+                metadatas = [document.metadata for _, document in chunk]
+                ids = [doc_id for doc_id, _ in chunk]
+                if vectorstore is None:
+                    vectorstore = FAISS.from_embeddings(text_embeddings, self.embeddings, metadatas, ids)
+                else:
+                    vectorstore.add_embeddings(text_embeddings, metadatas, ids)
+                added += len(chunk)
+            logger.info(f"Indexed {added} documents ({skipped} already present)")
+
+        if vectorstore is None:
+            raise ValueError("No interview questions found to index")
+        if added == 0:
+            return {"version": current_version(self.root), "added": 0, "skipped": skipped,
+                    "documents": int(vectorstore.index.ntotal)}
+        version = write_knowledge_base(vectorstore, self.root)
+        return {"version": version, "added": added, "skipped": skipped, "documents": int(vectorstore.index.ntotal)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index interview Q&A CSVs into the coach's knowledge base")
+    parser.add_argument("csv", nargs="+", help="CSV files with question, answer, category and difficulty columns")
+    parser.add_argument("--append", action="store_true", help="extend the current index instead of replacing it")
+    parser.add_argument("--path", default=KNOWLEDGE_BASE_CONFIG["path"])
+    parser.add_argument("--model", default=KNOWLEDGE_BASE_CONFIG["embedding_model"])
+    parser.add_argument("--batch-size", type=int, default=KNOWLEDGE_BASE_CONFIG["batch_size"])
+    parser.add_argument("--embedding-batch-size", type=int, default=KNOWLEDGE_BASE_CONFIG["embedding_batch_size"])
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    indexer = KnowledgeBaseIndexer(default_embeddings(args.model), args.path, args.batch_size, args.embedding_batch_size)
+    print(json.dumps(indexer.index(args.csv, append=args.append)))
+
+
+if __name__ == "__main__":
+    main()
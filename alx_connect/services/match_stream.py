@@ -0,0 +1,43 @@
+import json
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..models.profile import Profile
+from ..config.config import MATCHING_CONFIG
+from .matching import ImprovedMentorMatchingSystem
+
+
+def compact_mentee_matches(mentee: Profile, matches: List[Tuple[Profile, Profile, float, Dict]]) -> dict:
+    """One mentee's ranked matches as ids and scores only."""
+    return {
+        "mentee_id": mentee.id,
+        "matches": [{"mentor_id": mentor.id, "score": score} for mentor, _, score, _ in matches]
+    }
+
+
+def iter_ndjson_matches(matching_system: ImprovedMentorMatchingSystem, profiles: Iterable[Profile],
+                        top_k: Optional[int], min_score: float = MATCHING_CONFIG["min_score"],
+                        chunk_size: int = MATCHING_CONFIG["stream_chunk_size"],
+                        prepare: Optional[Callable[[List[Profile]], List[Profile]]] = None) -> Iterator[bytes]:
+    """Yield one NDJSON line per mentee as soon as its score block is done.
+
+    Only one block of scores is alive at a time, so memory and time to the
+    first line depend on ``chunk_size``, not on the cohort size.
+    ``prepare`` (e.g. embedding summaries) runs on all mentors first, as
+    every mentee is scored against them, then on each block of mentees
+    just before it is scored, so the first line waits for the mentors
+    and one block, not the whole cohort.
+    """
+    profiles = list(profiles)
+    if prepare is None:
+        blocks = [profiles]
+    else:
+        mentors = prepare([p for p in profiles if matching_system.is_mentor(p)])
+        mentees = [p for p in profiles if not matching_system.is_mentor(p)]
+        # A pair's score depends only on the pair, so block-wise scoring changes nothing
+        blocks = (mentors + prepare(mentees[start:start + chunk_size]) for start in range(0, len(mentees), chunk_size))
+    for block in blocks:
+        mentee_matches = matching_system.iter_mentee_matches(
+            block, top_k, vectorized=True, chunk_size=chunk_size, min_score=min_score
+        )
+        for mentee, matches in mentee_matches:
+            yield json.dumps(compact_mentee_matches(mentee, matches), separators=(",", ":")).encode("utf-8") + b"\n"
@@ -1,8 +1,15 @@
+import heapq
 import numpy as np
-from typing import Set, Dict, List, Tuple, Optional
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import Set, Dict, Iterator, List, Tuple, Optional, Union
 from ..models.profile import Profile
+from ..models.profile_store import ProfileStore, ProfileView
 from ..config.config import MATCHING_CONFIG
+from .assignment import assign_mentors
+from .candidates import CandidateGenerator
+from .mentor_index import MentorIndex
+from .parallel_matching import iter_matches_parallel
+from .quantization import PRECISIONS, encode_embeddings
+from .scoring_kernels import BUILTIN_COLUMNS, DEFAULT_KERNELS, Features, ScoringKernel, embedding_matrix, resolve_kernels
 
 class ImprovedMentorMatchingSystem:
     def __init__(self, 
@@ -11,13 +18,31 @@ class ImprovedMentorMatchingSystem:
                  skill_weight: float = MATCHING_CONFIG["skill_weight"],
                  domain_weight: float = MATCHING_CONFIG["domain_weight"],
                  min_experience_gap: float = MATCHING_CONFIG["min_experience_gap"],
-                 max_experience_gap: float = MATCHING_CONFIG["max_experience_gap"]):
+                 max_experience_gap: float = MATCHING_CONFIG["max_experience_gap"],
+                 kernels: Optional[List[Union[str, ScoringKernel]]] = None,
+                 weights: Optional[Dict[str, float]] = None,
+                 embedding_precision: str = MATCHING_CONFIG["embedding_precision"]):
         self.experience_weight = experience_weight
         self.semantic_weight = semantic_weight
         self.skill_weight = skill_weight
         self.domain_weight = domain_weight
         self.min_experience_gap = min_experience_gap
         self.max_experience_gap = max_experience_gap
+        if embedding_precision not in PRECISIONS:
+            raise ValueError(f"Unknown embedding precision {embedding_precision!r}; expected one of {PRECISIONS}")
+        self.embedding_precision = embedding_precision
+        self.kernels = resolve_kernels(DEFAULT_KERNELS if kernels is None else kernels)
+        # Weights of added kernels; the built-in ones are the attributes above
+        self.weights = {
+            kernel.weight_key: MATCHING_CONFIG.get(kernel.weight_key, 0.0)
+            for kernel in self.kernels if not hasattr(self, kernel.weight_key)
+        }
+        self.weights.update(weights or {})
+
+    def kernel_weight(self, kernel: ScoringKernel) -> float:
+        if kernel.weight_key in self.weights:
+            return self.weights[kernel.weight_key]
+        return getattr(self, kernel.weight_key)
 
     def calculate_domain_similarity(self, mentor_domains: Set[str], mentee_domains: Set[str]) -> float:
         if not mentor_domains or not mentee_domains:
@@ -37,55 +62,303 @@ class ImprovedMentorMatchingSystem:
     def calculate_semantic_similarity(self, emb1: np.ndarray, emb2: np.ndarray) -> float:
         if emb1 is None or emb2 is None:
             return 0.0
-        return float(cosine_similarity([emb1], [emb2])[0][0])
+        # Same as sklearn's cosine_similarity (zero vectors score 0) without importing sklearn
+        norm1, norm2 = np.linalg.norm(emb1), np.linalg.norm(emb2)
+        return float(np.dot(np.asarray(emb1) / (norm1 or 1.0), np.asarray(emb2) / (norm2 or 1.0)))
+
+    def is_mentor(self, profile: Profile) -> bool:
+        return profile.cumulative_year >= 5
 
     def calculate_match_score(self, mentor: Profile, mentee: Profile) -> Tuple[float, Dict]:
-        experience_score = self.calculate_experience_score(
-            mentor.cumulative_year, mentee.cumulative_year
-        )
-        
-        semantic_score = self.calculate_semantic_similarity(
-            mentor.semantic_embedding, mentee.semantic_embedding
-        )
-        
-        domain_score = self.calculate_domain_similarity(
-            mentor.industry_domains, mentee.industry_domains
-        )
-        
-        skill_score = self.calculate_domain_similarity(
-            mentor.extracted_skills, mentee.extracted_skills
-        )
-        
-        total_score = (
-            self.experience_weight * experience_score +
-            self.semantic_weight * semantic_score +
-            self.domain_weight * domain_score +
-            self.skill_weight * skill_score
-        )
-        
-        breakdown = {
-            "experience_score": experience_score,
-            "semantic_score": semantic_score,
-            "domain_score": domain_score,
-            "skill_score": skill_score
-        }
-        
+        total_score = 0.0
+        breakdown = {}
+        for kernel in self.kernels:
+            breakdown[kernel.name] = kernel.score_pair(self, mentor, mentee)
+            total_score += self.kernel_weight(kernel) * breakdown[kernel.name]
+
         return total_score, breakdown
 
-    def find_matches(self, profiles: List[Profile]) -> List[Tuple[Profile, Profile, float, Dict]]:
-        mentors = [p for p in profiles if p.cumulative_year >= 5]
-        mentees = [p for p in profiles if p.cumulative_year < 5]
-        
-        matches = []
+    def _embedding_matrix(self, profiles: List[Profile]) -> np.ndarray:
+        return embedding_matrix(profiles)
+
+    def precompute_features(self, profiles: List[Profile], context: dict,
+                            builtin: bool = True) -> Features:
+        """Feature columns of every kernel for ``profiles``.
+
+        ``context`` must be shared by everything scored together, so both
+        sides intern into the same vocabularies. With ``builtin=False`` only
+        kernels with columns outside ``BUILTIN_COLUMNS`` are precomputed, for
+        callers that build the built-in columns themselves.
+        """
+        features = {}
+        for kernel in self.kernels:
+            if builtin or not BUILTIN_COLUMNS.issuperset(kernel.columns):
+                features.update(kernel.precompute(profiles, context))
+        return features
+
+    def encode_features(self, features: Features) -> Features:
+        """Store the normalized embedding column at ``embedding_precision``."""
+        if self.embedding_precision != "float64" and "embeddings" in features:
+            features.update(encode_embeddings(features["embeddings"], self.embedding_precision))
+        return features
+
+    def _shared_store(self, profiles: List[Profile]) -> Optional[ProfileStore]:
+        stores = {id(p.store): p.store for p in profiles if isinstance(p, ProfileView)}
+        if len(stores) == 1 and all(isinstance(p, ProfileView) for p in profiles):
+            return stores.popitem()[1]
+        return None
+
+    def prepare_features(self, mentors: List[Profile], mentees: List[Profile]) -> Tuple[Features, Features]:
+        """Per-profile arrays for both sides, sharing one skill/domain vocabulary.
+
+        Skills and domains become binary CSR rows over interned ids, so Jaccard
+        for a whole block is one sparse product instead of Python set work.
+        """
+        store = self._shared_store(mentors + mentees)
+        if store is not None:
+            # Views of one store already carry normalized columns and shared term ids
+            mentor_features = self.encode_features(store.feature_columns([p.row for p in mentors]))
+            mentee_features = self.encode_features(store.feature_columns([p.row for p in mentees]))
+            context = {}
+            mentor_features.update(self.precompute_features(mentors, context, builtin=False))
+            mentee_features.update(self.precompute_features(mentees, context, builtin=False))
+            return mentor_features, mentee_features
+
+        # Built over both sides at once so embedding dimensions are checked together
+        features = self.encode_features(self.precompute_features(mentors + mentees, {}))
+        mentor_features = {name: values[:len(mentors)] for name, values in features.items()}
+        mentee_features = {name: values[len(mentors):] for name, values in features.items()}
+        return mentor_features, mentee_features
+
+    def score_block(self, mentor_features: Features,
+                    mentee_features: Features) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Score every mentee row against every mentor row.
+
+        Arrays have shape (mentees, mentors) and hold what
+        ``calculate_match_score`` returns for the corresponding pair, up to
+        rounding in the semantic dot product. Each kernel returns a new
+        block, kept in ``components`` for the breakdowns; the weighted
+        blocks are added to ``total`` in kernel order through one reused
+        scratch buffer.
+        """
+        shape = (next(iter(mentee_features.values())).shape[0], next(iter(mentor_features.values())).shape[0])
+        total = np.zeros(shape)
+        scratch = np.empty(shape)
+        components = {}
+        for kernel in self.kernels:
+            values = kernel.score(self, mentor_features, mentee_features)
+            components[kernel.name] = values
+            np.multiply(values, self.kernel_weight(kernel), out=scratch)
+            total += scratch
+        return total, components
+
+    def iter_score_blocks(self, mentors: List[Profile], mentees: List[Profile],
+                          chunk_size: int = MATCHING_CONFIG["chunk_size"]) -> Iterator[Tuple[int, np.ndarray, Dict[str, np.ndarray]]]:
+        """Yield (mentee_offset, total, components) for consecutive mentee chunks."""
+        mentor_features, mentee_features = self.prepare_features(mentors, mentees)
+        for start in range(0, len(mentees), chunk_size):
+            chunk = {name: values[start:start + chunk_size] for name, values in mentee_features.items()}
+            total, components = self.score_block(mentor_features, chunk)
+            yield start, total, components
+
+    def rank_candidates(self, scores: np.ndarray, top_k: Optional[int] = None,
+                        min_score: float = MATCHING_CONFIG["min_score"]) -> np.ndarray:
+        """Indices of scores above ``min_score``, best first, truncated at ``top_k``.
+
+        Ties keep index order, so the result equals a stable descending sort
+        cut at K. Only the K best are fully sorted.
+        """
+        candidates = np.flatnonzero(scores > min_score)
+        if top_k is not None and len(candidates) > top_k:
+            values = scores[candidates]
+            kth = np.partition(values, len(values) - top_k)[len(values) - top_k]
+            above = candidates[values > kth]
+            ties = candidates[values == kth][:top_k - len(above)]
+            candidates = np.sort(np.concatenate([above, ties]))
+        # Stable sort keeps mentor order on ties, like list.sort(reverse=True)
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+    def _ranked_matches(self, mentee: Profile, mentors: List[Profile], cols: np.ndarray, total: np.ndarray,
+                        components: Dict[str, np.ndarray], row: int, ranked: np.ndarray) -> List[Tuple[Profile, Profile, float, Dict]]:
+        mentee_matches = []
+        for col in ranked:
+            breakdown = {name: float(values[row, col]) for name, values in components.items()}
+            mentee_matches.append((mentors[cols[col]], mentee, float(total[row, col]), breakdown))
+        return mentee_matches
+
+    def _score_allowed(self, mentor_features: Features, mentee_features: Features,
+                       allowed: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """Score mentee rows against the union of their allowed mentor columns.
+
+        Returns (cols, total, components); pairs outside a row's own allowed
+        set get a total of -inf so they never rank.
+        """
+        cols = np.unique(np.concatenate(allowed)).astype(np.intp)
+        mask = np.zeros((len(allowed), len(cols)), dtype=bool)
+        for row, allowed_cols in enumerate(allowed):
+            mask[row, np.searchsorted(cols, allowed_cols)] = True
+
+        total, components = self.score_block(
+            {name: values[cols] for name, values in mentor_features.items()},
+            mentee_features
+        )
+        total[~mask] = -np.inf
+        return cols, total, components
+
+    def _iter_matches_vectorized(self, mentors: List[Profile], mentees: List[Profile], top_k: Optional[int],
+                                 min_score: float, chunk_size: int) -> Iterator[Tuple[Profile, List[Tuple[Profile, Profile, float, Dict]]]]:
+        cols = np.arange(len(mentors))
+        for start, total, components in self.iter_score_blocks(mentors, mentees, chunk_size):
+            for row in range(total.shape[0]):
+                ranked = self.rank_candidates(total[row], top_k, min_score)
+                yield mentees[start + row], self._ranked_matches(mentees[start + row], mentors, cols, total, components, row, ranked)
+
+    def _iter_matches_indexed(self, mentors: List[Profile], mentees: List[Profile], top_k: Optional[int],
+                              min_score: float, mentor_index: MentorIndex, index_candidates: int,
+                              chunk_size: int) -> Iterator[Tuple[Profile, List[Tuple[Profile, Profile, float, Dict]]]]:
+        mentor_features, mentee_features = self.prepare_features(mentors, mentees)
+        columns = {mentor.id: col for col, mentor in enumerate(mentors)}
+        # Mentors the index cannot rank semantically are always rescored
+        always = np.array([col for col, mentor in enumerate(mentors) if mentor.id not in mentor_index.ids], dtype=np.intp)
+        all_columns = np.arange(len(mentors))
+
+        for start in range(0, len(mentees), chunk_size):
+            chunk = mentees[start:start + chunk_size]
+            embedded = [offset for offset, mentee in enumerate(chunk) if mentee.semantic_embedding is not None]
+            neighbours = {}
+            if embedded:
+                queries = np.stack([np.asarray(chunk[offset].semantic_embedding).ravel() for offset in embedded])
+                neighbours = dict(zip(embedded, mentor_index.search(queries, index_candidates)))
+
+            allowed = []
+            for offset in range(len(chunk)):
+                if offset in neighbours:
+                    found = [columns[mentor_id] for mentor_id in neighbours[offset] if mentor_id in columns]
+                    allowed.append(np.union1d(always, np.array(found, dtype=np.intp)).astype(np.intp))
+                else:
+                    # Without an embedding semantic retrieval says nothing, so score exhaustively
+                    allowed.append(all_columns)
+
+            chunk_features = {name: values[start:start + chunk_size] for name, values in mentee_features.items()}
+            cols, total, components = self._score_allowed(mentor_features, chunk_features, allowed)
+            for offset, mentee in enumerate(chunk):
+                ranked = self.rank_candidates(total[offset], top_k, min_score)
+                yield mentee, self._ranked_matches(mentee, mentors, cols, total, components, offset, ranked)
+
+    def _iter_matches_pruned(self, mentors: List[Profile], mentees: List[Profile], top_k: Optional[int],
+                             min_score: float, chunk_size: int) -> Iterator[Tuple[Profile, List[Tuple[Profile, Profile, float, Dict]]]]:
+        mentor_features, mentee_features = self.prepare_features(mentors, mentees)
+        generator = CandidateGenerator(self, mentor_features)
+        all_columns = np.arange(len(mentors))
+
+        for start in range(0, len(mentees), chunk_size):
+            chunk = mentees[start:start + chunk_size]
+            chunk_features = {name: values[start:start + chunk_size] for name, values in mentee_features.items()}
+            allowed = [generator.candidates(chunk_features, offset) for offset in range(len(chunk))]
+            cols, total, components = self._score_allowed(mentor_features, chunk_features, allowed)
+
+            for offset, mentee in enumerate(chunk):
+                ranked = self.rank_candidates(total[offset], top_k, min_score)
+                bound = generator.outside_bound(chunk_features, offset)
+                # Pruned pairs score at most ``bound``; keep the pruned result only if
+                # none of them could clear min_score or displace the current K-th match
+                proven = bound <= min_score or (
+                    top_k is not None and len(ranked) == top_k and total[offset, ranked[-1]] > bound
+                )
+                if proven or len(allowed[offset]) == len(mentors):
+                    yield mentee, self._ranked_matches(mentee, mentors, cols, total, components, offset, ranked)
+                    continue
+
+                row_total, row_components = self.score_block(
+                    mentor_features,
+                    {name: values[offset:offset + 1] for name, values in chunk_features.items()}
+                )
+                ranked = self.rank_candidates(row_total[0], top_k, min_score)
+                yield mentee, self._ranked_matches(mentee, mentors, all_columns, row_total, row_components, 0, ranked)
+
+    def _iter_matches_pairwise(self, mentors: List[Profile], mentees: List[Profile], top_k: Optional[int],
+                               min_score: float) -> Iterator[Tuple[Profile, List[Tuple[Profile, Profile, float, Dict]]]]:
         for mentee in mentees:
-            mentee_matches = []
-            for mentor in mentors:
-                score, breakdown = self.calculate_match_score(mentor, mentee)
-                if score > 0:
-                    mentee_matches.append((mentor, mentee, score, breakdown))
-            
+            scored = (
+                (mentor, mentee, *self.calculate_match_score(mentor, mentee))
+                for mentor in mentors
+            )
+            positive = (match for match in scored if match[2] > min_score)
+
             # Sort matches by score in descending order
-            mentee_matches.sort(key=lambda x: x[2], reverse=True)
+            if top_k is None:
+                mentee_matches = sorted(positive, key=lambda x: x[2], reverse=True)
+            else:
+                # Same ordering as the full sort cut at K, holding only K matches
+                mentee_matches = heapq.nlargest(top_k, positive, key=lambda x: x[2])
+            yield mentee, mentee_matches
+
+    def iter_mentee_matches(self, profiles: List[Profile], top_k: Optional[int] = None, vectorized: bool = False,
+                            chunk_size: int = MATCHING_CONFIG["chunk_size"],
+                            mentor_index: Optional[MentorIndex] = None,
+                            index_candidates: int = MATCHING_CONFIG["index_candidates"],
+                            prune: bool = False,
+                            min_score: float = MATCHING_CONFIG["min_score"],
+                            workers: Optional[int] = None
+                            ) -> Iterator[Tuple[Profile, List[Tuple[Profile, Profile, float, Dict]]]]:
+        """Yield (mentee, ranked matches) one mentee at a time.
+
+        Only pairs scoring above ``min_score`` are kept. With ``top_k`` only
+        the best K mentors per mentee are kept, so nothing proportional to the
+        full mentee x mentor product is ever held. With a ``mentor_index`` each
+        mentee is fully scored only against its ``index_candidates`` nearest
+        mentors, which is approximate. ``prune`` scores only mentors sharing a
+        skill/domain or inside the experience window and falls back to all
+        mentors when the pruned pairs could still make the result, so it is exact.
+        ``workers`` > 1 runs the vectorized path in a process pool with
+        identical results; a cohort of at most ``chunk_size`` mentees is one
+        block, so it is scored in the calling thread without starting a pool.
+        """
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k must be a positive integer")
+
+        mentors = [p for p in profiles if self.is_mentor(p)]
+        mentees = [p for p in profiles if not self.is_mentor(p)]
+
+        if mentor_index is not None:
+            yield from self._iter_matches_indexed(mentors, mentees, top_k, min_score, mentor_index, index_candidates, chunk_size)
+        elif prune:
+            yield from self._iter_matches_pruned(mentors, mentees, top_k, min_score, chunk_size)
+        elif workers is not None and workers > 1 and len(mentees) > chunk_size:
+            yield from iter_matches_parallel(self, mentors, mentees, top_k, min_score, chunk_size, workers)
+        elif vectorized or (workers is not None and workers > 1):
+            yield from self._iter_matches_vectorized(mentors, mentees, top_k, min_score, chunk_size)
+        else:
+            yield from self._iter_matches_pairwise(mentors, mentees, top_k, min_score)
+
+    def find_matches(self, profiles: List[Profile], top_k: Optional[int] = None, vectorized: bool = False,
+                     chunk_size: int = MATCHING_CONFIG["chunk_size"],
+                     mentor_index: Optional[MentorIndex] = None,
+                     index_candidates: int = MATCHING_CONFIG["index_candidates"],
+                     prune: bool = False,
+                     min_score: float = MATCHING_CONFIG["min_score"],
+                     workers: Optional[int] = None) -> List[Tuple[Profile, Profile, float, Dict]]:
+        matches = []
+        for _, mentee_matches in self.iter_mentee_matches(profiles, top_k, vectorized, chunk_size,
+                                                          mentor_index, index_candidates, prune, min_score,
+                                                          workers):
             matches.extend(mentee_matches)
-        
-        return matches 
\ No newline at end of file
+        return matches
+
+    def assign_mentors(self, profiles: List[Profile],
+                       capacity: Union[int, Dict[str, int]] = MATCHING_CONFIG["mentor_capacity"],
+                       candidates: Optional[int] = MATCHING_CONFIG["assignment_candidates"],
+                       min_score: float = MATCHING_CONFIG["min_score"],
+                       chunk_size: int = MATCHING_CONFIG["chunk_size"]) -> List[Tuple[Profile, Profile, float, Dict]]:
+        """Assign each mentee at most one mentor, maximizing the summed match score.
+
+        Each mentor takes at most ``capacity`` mentees (an int, or a mapping
+        from mentor id to its own limit). Only each mentee's ``candidates``
+        best mentors are considered, which keeps the solve sparse; pass
+        ``None`` to consider every pair and get the global optimum.
+        """
+        if candidates is not None and candidates < 1:
+            raise ValueError("candidates must be a positive integer")
+        mentors = [p for p in profiles if self.is_mentor(p)]
+        mentees = [p for p in profiles if not self.is_mentor(p)]
+        return assign_mentors(self, mentors, mentees, capacity, candidates, min_score, chunk_size)
@@ -0,0 +1,204 @@
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..models.profile import Profile
+from ..config.config import MATCHING_CONFIG, MATCHING_JOB_CONFIG
+from .matching import ImprovedMentorMatchingSystem
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED = {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+def match_to_dict(match: Tuple[Profile, Profile, float, Dict]) -> dict:
+    mentor, mentee, score, breakdown = match
+    return {
+        "mentor_id": mentor.id,
+        "mentee_id": mentee.id,
+        "score": score,
+        "breakdown": breakdown
+    }
+
+
+class MatchingJob:
+    """State of one background matching run.
+
+    Results are appended one mentee at a time, so pages can be read while
+    the job is still running.
+    """
+
+    def __init__(self, profiles: List[Profile], options: dict,
+                 prepare: Optional[Callable[[List[Profile]], List[Profile]]] = None):
+        self.id = uuid.uuid4().hex
+        self.profiles = profiles
+        self.prepare = prepare
+        self.options = options
+        self.status = JobStatus.QUEUED
+        self.error: Optional[str] = None
+        self.results: List[dict] = []
+        self.mentees_total = 0
+        self.mentees_done = 0
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.cancel_event = threading.Event()
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "status": self.status.value,
+            "error": self.error,
+            "progress": {
+                "mentees_total": self.mentees_total,
+                "mentees_done": self.mentees_done,
+                "matches": len(self.results)
+            },
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+
+class MatchingJobManager:
+    """Runs mentor matching off the event loop.
+
+    At most ``workers`` jobs run at once, each driven by a thread that
+    hands the scoring to a pool of ``processes`` worker processes (the
+    parallel vectorized matcher), so the per-mentee ranking loops never
+    hold the API process's GIL. Pruned jobs and cohorts of at most one
+    score block are scored in the job thread. Finished jobs are kept for
+    ``job_ttl`` seconds and at most ``max_jobs`` jobs are tracked at once.
+    """
+
+    def __init__(self, matching_system: Optional[ImprovedMentorMatchingSystem] = None,
+                 workers: int = MATCHING_JOB_CONFIG["workers"],
+                 max_jobs: int = MATCHING_JOB_CONFIG["max_jobs"],
+                 job_ttl: float = MATCHING_JOB_CONFIG["job_ttl"],
+                 processes: int = MATCHING_JOB_CONFIG["processes"]):
+        self.setup_logging()
+        self.matching_system = matching_system or ImprovedMentorMatchingSystem()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="matching-job")
+        self.processes = processes
+        self.max_jobs = max_jobs
+        self.job_ttl = job_ttl
+        self.jobs: Dict[str, MatchingJob] = {}
+        self._lock = threading.Lock()
+
+    def setup_logging(self):
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        self.logger = logging.getLogger(__name__)
+
+    def _evict_expired(self):
+        now = time.time()
+        for job_id, job in list(self.jobs.items()):
+            if job.finished_at is not None and now - job.finished_at > self.job_ttl:
+                del self.jobs[job_id]
+
+    def submit(self, profiles: List[Profile], top_k: Optional[int] = MATCHING_JOB_CONFIG["top_k"],
+               min_score: float = MATCHING_CONFIG["min_score"], prune: bool = False,
+               prepare: Optional[Callable[[List[Profile]], List[Profile]]] = None) -> MatchingJob:
+        """Queue a matching run over ``profiles``.
+
+        ``prepare`` runs in the job before matching, e.g. to embed the
+        profiles, so slow preparation does not hold up the submission.
+        """
+        if top_k is not None and top_k < 1:
+            raise ValueError("top_k must be a positive integer")
+        with self._lock:
+            self._evict_expired()
+            if len(self.jobs) >= self.max_jobs:
+                raise RuntimeError("Too many matching jobs; try again later")
+            job = MatchingJob(profiles, {"top_k": top_k, "min_score": min_score, "prune": prune}, prepare)
+            job.mentees_total = sum(1 for profile in profiles if not self.matching_system.is_mentor(profile))
+            self.jobs[job.id] = job
+        self.executor.submit(self._run, job)
+        return job
+
+    def _run(self, job: MatchingJob):
+        with self._lock:
+            # Cancelled while queued
+            if job.status != JobStatus.QUEUED:
+                return
+            job.status = JobStatus.RUNNING
+            job.started_at = time.time()
+        status = JobStatus.COMPLETED
+        mentee_matches = None
+        try:
+            profiles = job.prepare(job.profiles) if job.prepare is not None else job.profiles
+            mentee_matches = self.matching_system.iter_mentee_matches(
+                profiles, job.options["top_k"], vectorized=True,
+                prune=job.options["prune"], min_score=job.options["min_score"], workers=self.processes
+            )
+            for _, matches in mentee_matches:
+                # Checked between mentees, so a cancel lands within one score block
+                if job.cancel_event.is_set():
+                    status = JobStatus.CANCELLED
+                    break
+                job.results.extend(match_to_dict(match) for match in matches)
+                job.mentees_done += 1
+        except Exception as e:
+            self.logger.error(f"Matching job {job.id} failed: {str(e)}")
+            job.error = str(e)
+            status = JobStatus.FAILED
+        finally:
+            if mentee_matches is not None:
+                # Stops the worker processes and drops their unscored chunks
+                mentee_matches.close()
+            job.finished_at = time.time()
+            # Inputs are only needed while running
+            job.profiles = []
+            job.status = status
+
+    def get(self, job_id: str) -> Optional[MatchingJob]:
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[MatchingJob]:
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            job.cancel_event.set()
+            if job.status == JobStatus.QUEUED:
+                job.finished_at = time.time()
+                job.profiles = []
+                job.status = JobStatus.CANCELLED
+        return job
+
+    def results_page(self, job_id: str, offset: int = 0,
+                     limit: int = MATCHING_JOB_CONFIG["page_size"]) -> Optional[dict]:
+        """Matches ``offset:offset + limit`` of a job, available while it runs."""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        # Read the status first: a finished job's result list no longer grows
+        status = job.status
+        matches = job.results[offset:offset + limit]
+        next_offset = offset + len(matches)
+        return {
+            "job_id": job.id,
+            "status": status.value,
+            "matches": matches,
+            "offset": offset,
+            "next_offset": next_offset if status not in FINISHED or next_offset < len(job.results) else None
+        }
+
+    def shutdown(self):
+        for job in list(self.jobs.values()):
+            job.cancel_event.set()
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,133 @@
+import os
+import pickle
+from typing import Dict, Iterable, List
+
+import faiss
+import numpy as np
+
+from ..models.profile import Profile
+
+
+class MentorIndex:
+    """FAISS inner-product index over normalized mentor embeddings.
+
+    Profiles are keyed by ``Profile.id`` so mentors can be added, replaced or
+    removed as their profiles change. Mentors without an embedding are kept
+    aside and returned by ``unindexed_ids`` so callers can still score them.
+    """
+
+    INDEX_FILE = "mentors.faiss"
+    META_FILE = "mentors.pkl"
+
+    def __init__(self, dimension: int, factory: str = "Flat", nprobe: int = 8):
+        self.dimension = dimension
+        self.factory = factory
+        self.index = faiss.IndexIDMap2(
+            faiss.index_factory(dimension, factory, faiss.METRIC_INNER_PRODUCT)
+        )
+        self.set_nprobe(nprobe)
+        self.profiles: Dict[int, Profile] = {}
+        self.ids: Dict[str, int] = {}
+        self.unindexed: Dict[str, Profile] = {}
+        self._next_id = 0
+
+    @classmethod
+    def from_profiles(cls, profiles: List[Profile], factory: str = "Flat", nprobe: int = 8) -> "MentorIndex":
+        dims = {np.asarray(p.semantic_embedding).shape[-1] for p in profiles if p.semantic_embedding is not None}
+        if len(dims) != 1:
+            raise ValueError("Mentor profiles need embeddings of one consistent dimension")
+        index = cls(dims.pop(), factory=factory, nprobe=nprobe)
+        index.add(profiles)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.ids) + len(self.unindexed)
+
+    def __contains__(self, profile_id: str) -> bool:
+        return profile_id in self.ids or profile_id in self.unindexed
+
+    def set_nprobe(self, nprobe: int):
+        """Number of inverted lists visited per query; ignored for flat indexes."""
+        inner = faiss.downcast_index(self.index.index)
+        if hasattr(inner, "nprobe"):
+            inner.nprobe = nprobe
+
+    def normalize(self, embeddings: np.ndarray) -> np.ndarray:
+        vectors = np.ascontiguousarray(np.atleast_2d(embeddings), dtype=np.float32)
+        if vectors.shape[1] != self.dimension:
+            raise ValueError(f"Expected embeddings of dimension {self.dimension}, got {vectors.shape[1]}")
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        return vectors / norms
+
+    def add(self, profiles: Iterable[Profile]):
+        """Insert profiles, replacing any already indexed under the same id."""
+        profiles = list(profiles)
+        self.remove(p.id for p in profiles)
+
+        embedded = [p for p in profiles if p.semantic_embedding is not None]
+        for profile in profiles:
+            if profile.semantic_embedding is None:
+                self.unindexed[profile.id] = profile
+        if not embedded:
+            return
+
+        vectors = self.normalize(np.stack([np.asarray(p.semantic_embedding).ravel() for p in embedded]))
+        if not self.index.is_trained:
+            self.index.train(vectors)
+        faiss_ids = np.arange(self._next_id, self._next_id + len(embedded), dtype=np.int64)
+        self._next_id += len(embedded)
+        self.index.add_with_ids(vectors, faiss_ids)
+        for faiss_id, profile in zip(faiss_ids.tolist(), embedded):
+            self.profiles[faiss_id] = profile
+            self.ids[profile.id] = faiss_id
+
+    def remove(self, profile_ids: Iterable[str]):
+        faiss_ids = []
+        for profile_id in profile_ids:
+            self.unindexed.pop(profile_id, None)
+            faiss_id = self.ids.pop(profile_id, None)
+            if faiss_id is not None:
+                del self.profiles[faiss_id]
+                faiss_ids.append(faiss_id)
+        if faiss_ids:
+            self.index.remove_ids(np.array(faiss_ids, dtype=np.int64))
+
+    def unindexed_ids(self) -> List[str]:
+        return list(self.unindexed)
+
+    def search(self, embeddings: np.ndarray, n: int) -> List[List[str]]:
+        """Ids of the ``n`` most similar indexed mentors for each query row."""
+        queries = self.normalize(embeddings)
+        if self.index.ntotal == 0:
+            return [[] for _ in range(len(queries))]
+        _, faiss_ids = self.index.search(queries, min(n, self.index.ntotal))
+        return [
+            [self.profiles[faiss_id].id for faiss_id in row if faiss_id != -1]
+            for row in faiss_ids.tolist()
+        ]
+
+    def save(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        faiss.write_index(self.index, os.path.join(directory, self.INDEX_FILE))
+        with open(os.path.join(directory, self.META_FILE), "wb") as f:
+            pickle.dump({
+                "dimension": self.dimension,
+                "factory": self.factory,
+                "profiles": self.profiles,
+                "unindexed": self.unindexed,
+                "next_id": self._next_id
+            }, f)
+
+    @classmethod
+    def load(cls, directory: str, nprobe: int = 8) -> "MentorIndex":
+        with open(os.path.join(directory, cls.META_FILE), "rb") as f:
+            meta = pickle.load(f)
+        index = cls(meta["dimension"], factory=meta["factory"])
+        index.index = faiss.read_index(os.path.join(directory, cls.INDEX_FILE))
+        index.set_nprobe(nprobe)
+        index.profiles = meta["profiles"]
+        index.ids = {profile.id: faiss_id for faiss_id, profile in meta["profiles"].items()}
+        index.unindexed = meta["unindexed"]
+        index._next_id = meta["next_id"]
+        return index
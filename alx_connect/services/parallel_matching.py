@@ -0,0 +1,113 @@
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as sp
+from threadpoolctl import threadpool_limits
+
+from ..models.profile import Profile
+
+if TYPE_CHECKING:
+    from .matching import ImprovedMentorMatchingSystem
+
+# Per-process state set up once by the pool initializer
+_worker: Dict = {}
+
+# Workers start from a clean server process instead of a fork of the caller:
+# in the API that is a threaded process with torch/FAISS/OpenMP loaded,
+# which forking can deadlock
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def dump_features(features: Dict[str, Union[np.ndarray, sp.csr_matrix]], directory: str, prefix: str):
+    """Write feature columns as .npy files that workers can memory-map."""
+    np.save(os.path.join(directory, f"{prefix}_columns.npy"),
+            np.array([(name, sp.issparse(values)) for name, values in features.items()], dtype=str).reshape(-1, 2))
+    for name, values in features.items():
+        if sp.issparse(values):
+            np.save(os.path.join(directory, f"{prefix}_{name}_data.npy"), values.data)
+            np.save(os.path.join(directory, f"{prefix}_{name}_indices.npy"), values.indices)
+            np.save(os.path.join(directory, f"{prefix}_{name}_indptr.npy"), values.indptr)
+            np.save(os.path.join(directory, f"{prefix}_{name}_shape.npy"), np.array(values.shape))
+        else:
+            np.save(os.path.join(directory, f"{prefix}_{name}.npy"), values)
+
+
+def load_features(directory: str, prefix: str) -> Dict[str, Union[np.ndarray, sp.csr_matrix]]:
+    """Memory-map feature columns written by ``dump_features``; nothing is copied."""
+    def load(name: str) -> np.ndarray:
+        return np.load(os.path.join(directory, f"{prefix}_{name}.npy"), mmap_mode="r")
+
+    features = {}
+    for name, sparse in load("columns"):
+        if sparse == "True":
+            features[name] = sp.csr_matrix(
+                (load(f"{name}_data"), load(f"{name}_indices"), load(f"{name}_indptr")),
+                shape=tuple(load(f"{name}_shape")),
+                copy=False
+            )
+        else:
+            features[name] = load(name)
+    return features
+
+
+def _init_worker(matching_system: "ImprovedMentorMatchingSystem", directory: str):
+    _worker["matching_system"] = matching_system
+    _worker["mentors"] = load_features(directory, "mentors")
+    _worker["mentees"] = load_features(directory, "mentees")
+    # Workers already saturate the cores; nested BLAS threads only oversubscribe them
+    _worker["threadpool_limits"] = threadpool_limits(1)
+
+
+def _score_chunk(start: int, chunk_size: int, top_k: Optional[int],
+                 min_score: float) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    matching_system = _worker["matching_system"]
+    chunk = {name: values[start:start + chunk_size] for name, values in _worker["mentees"].items()}
+    total, components = matching_system.score_block(_worker["mentors"], chunk)
+
+    results = []
+    for row in range(total.shape[0]):
+        ranked = matching_system.rank_candidates(total[row], top_k, min_score)
+        breakdowns = np.stack([components[kernel.name][row, ranked] for kernel in matching_system.kernels])
+        results.append((ranked, total[row, ranked], breakdowns))
+    return results
+
+
+def iter_matches_parallel(matching_system: "ImprovedMentorMatchingSystem", mentors: List[Profile],
+                          mentees: List[Profile], top_k: Optional[int], min_score: float, chunk_size: int,
+                          workers: int) -> Iterator[Tuple[Profile, List[Tuple[Profile, Profile, float, Dict]]]]:
+    """Score mentee chunks in a process pool and yield results in mentee order.
+
+    Shards are the same chunks the serial vectorized path scores, so every
+    block is computed identically and the merged output matches it exactly.
+    Workers only receive chunk offsets; feature matrices reach them through
+    memory-mapped files shared via the page cache.
+    """
+    mentor_features, mentee_features = matching_system.prepare_features(mentors, mentees)
+    names = [kernel.name for kernel in matching_system.kernels]
+    with tempfile.TemporaryDirectory(prefix="alx-matching-") as directory:
+        dump_features(mentor_features, directory, "mentors")
+        dump_features(mentee_features, directory, "mentees")
+        del mentor_features, mentee_features
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(START_METHOD),
+                                 initializer=_init_worker, initargs=(matching_system, directory)) as executor:
+            starts = range(0, len(mentees), chunk_size)
+            shards = executor.map(
+                _score_chunk, starts, [chunk_size] * len(starts), [top_k] * len(starts), [min_score] * len(starts)
+            )
+            try:
+                for start, results in zip(starts, shards):
+                    for offset, (ranked, totals, breakdowns) in enumerate(results):
+                        mentee = mentees[start + offset]
+                        mentee_matches = []
+                        for i, col in enumerate(ranked):
+                            breakdown = {name: float(breakdowns[j, i]) for j, name in enumerate(names)}
+                            mentee_matches.append((mentors[col], mentee, float(totals[i]), breakdown))
+                        yield mentee, mentee_matches
+            finally:
+                # Closing the generator early should not wait for the chunks still queued
+                executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,138 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import unicodedata
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+from ..models.profile import Profile
+from ..config.config import PROFILE_EMBEDDING_CONFIG
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used both for embedding and for the cache key."""
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+class EmbeddingCache:
+    """SQLite-backed map from content hash to a float32 embedding."""
+
+    def __init__(self, path: str):
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._connection.commit()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = list(keys[start:start + 500])
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+                ).fetchall()
+                for key, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype=np.float32)
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]):
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in items.items()]
+            )
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class ProfileEmbeddingService:
+    """Fills ``Profile.semantic_embedding`` from profile summaries in batches.
+
+    Texts go through the LangChain embeddings model's ``embed_documents`` in
+    batches of ``batch_size``. Results are stored as L2-normalized float32
+    vectors, so cosine similarity is a plain dot product, and cached on disk
+    under a hash of the normalized text and the model name: profiles whose
+    summaries have not changed are never embedded again.
+    """
+
+    def __init__(self, embeddings, cache_path: str = PROFILE_EMBEDDING_CONFIG["cache_path"],
+                 batch_size: int = PROFILE_EMBEDDING_CONFIG["batch_size"]):
+        self.setup_logging()
+        self.embeddings = embeddings
+        self.model_name = getattr(embeddings, "model_name", None) or type(embeddings).__name__
+        self.cache = EmbeddingCache(cache_path)
+        self.batch_size = batch_size
+
+    @classmethod
+    def from_interview_coach(cls, interview_coach, **kwargs) -> "ProfileEmbeddingService":
+        """Reuse the sentence-transformer the interview coach already loaded."""
+        return cls(interview_coach.embeddings, **kwargs)
+
+    def setup_logging(self):
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        self.logger = logging.getLogger(__name__)
+
+    def profile_text(self, profile: Profile) -> str:
+        return normalize_text(f"{profile.personal_summary}\n{profile.professional_summary}")
+
+    def cache_key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def embed_texts(self, texts: Iterable[str]) -> np.ndarray:
+        """Normalized float32 embeddings for ``texts``, one row each."""
+        texts = [normalize_text(text) for text in texts]
+        keys = [self.cache_key(text) for text in texts]
+        cached = self.cache.get_many(list(dict.fromkeys(keys)))
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+        if missing:
+            self.logger.info(f"Embedding {len(missing)} new texts ({len(cached)} cached)")
+        missing_keys = list(missing)
+        for start in range(0, len(missing_keys), self.batch_size):
+            batch_keys = missing_keys[start:start + self.batch_size]
+            vectors = np.asarray(
+                self.embeddings.embed_documents([missing[key] for key in batch_keys]), dtype=np.float32
+            )
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            norms[norms == 0.0] = 1.0
+            computed = dict(zip(batch_keys, vectors / norms))
+            self.cache.put_many(computed)
+            cached.update(computed)
+
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack([cached[key] for key in keys])
+
+    def embed_profiles(self, profiles: List[Profile]) -> List[Profile]:
+        """Set ``semantic_embedding`` on each profile that has summary text.
+
+        Profiles with empty summaries keep ``semantic_embedding = None``.
+        Profile store views are read-only; embed profiles before adding them.
+        """
+        indexed = [(profile, self.profile_text(profile)) for profile in profiles]
+        indexed = [(profile, text) for profile, text in indexed if text]
+        if indexed:
+            vectors = self.embed_texts(text for _, text in indexed)
+            for (profile, _), vector in zip(indexed, vectors):
+                profile.semantic_embedding = vector
+        return profiles
+
+    def close(self):
+        self.cache.close()
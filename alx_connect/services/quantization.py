@@ -0,0 +1,87 @@
+"""Compact storage for the normalized embedding feature column.
+
+``float64`` keeps full precision. ``float32`` and ``float16`` halve and
+quarter the column; ``int8`` stores one signed byte per dimension plus a
+float32 scale per vector (``embedding_scales``), a quarter of float32.
+
+Reduced precisions are scored in float32: int8 codes are multiplied as
+float32, which is exact because every partial sum of products of codes
+stays below 2**24 for dimensions up to ``INT8_MAX_DIMENSION``, and the
+scales are applied to the resulting block afterwards. float16 and int8
+mentor columns are widened a block of rows at a time, so the column is
+never held in float32 in full.
+"""
+from typing import Dict
+
+import numpy as np
+
+PRECISIONS = ("float64", "float32", "float16", "int8")
+# Relative rounding headroom of a dot product computed at each precision
+DOT_HEADROOM = {"float64": 1e-9, "float32": 1e-4, "float16": 1e-4, "int8": 1e-4}
+INT8_MAX = 127
+# Largest dimension whose int8 dot products are exact in float32: 127**2 * d < 2**24
+INT8_MAX_DIMENSION = 1040
+# Bytes of a widened float32 mentor block in embedding_dot
+DOT_BLOCK_BYTES = 1 << 20
+
+
+def quantize_int8(matrix: np.ndarray):
+    """Symmetric per-row int8 codes and float32 scales with ``codes * scale ~= matrix``."""
+    scales = np.abs(matrix).max(axis=1) / INT8_MAX if matrix.shape[1] else np.zeros(len(matrix))
+    scales[scales == 0.0] = 1.0
+    codes = np.clip(np.rint(matrix / scales[:, np.newaxis]), -INT8_MAX, INT8_MAX).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def encode_embeddings(matrix: np.ndarray, precision: str) -> Dict[str, np.ndarray]:
+    """Feature columns holding ``matrix`` at ``precision``."""
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown embedding precision {precision!r}; expected one of {PRECISIONS}")
+    if precision == "int8":
+        if matrix.shape[1] > INT8_MAX_DIMENSION:
+            raise ValueError(f"int8 embeddings support at most {INT8_MAX_DIMENSION} dimensions, got {matrix.shape[1]}; "
+                             "use float16 or float32")
+        codes, scales = quantize_int8(matrix)
+        return {"embeddings": codes, "embedding_scales": scales}
+    return {"embeddings": np.ascontiguousarray(matrix, dtype=precision)}
+
+
+def decode_embeddings(features: Dict[str, np.ndarray]) -> np.ndarray:
+    """The float64 vectors the stored embedding column represents."""
+    matrix = np.asarray(features["embeddings"], dtype=np.float64)
+    if "embedding_scales" in features:
+        matrix = matrix * np.asarray(features["embedding_scales"], dtype=np.float64)[:, np.newaxis]
+    return matrix
+
+
+def precision_of(features: Dict[str, np.ndarray]) -> str:
+    if "embedding_scales" in features:
+        return "int8"
+    return np.dtype(features["embeddings"].dtype).name
+
+
+def embedding_dot(mentee_features: Dict[str, np.ndarray], mentor_features: Dict[str, np.ndarray]) -> np.ndarray:
+    """(mentees, mentors) float64 dot products of the stored embeddings."""
+    left, right = mentee_features["embeddings"], mentor_features["embeddings"]
+    if left.dtype == np.float64 and right.dtype == np.float64:
+        return left @ right.T
+
+    left = np.asarray(left, dtype=np.float32)
+    if right.dtype == np.float32:
+        product = (left @ right.T).astype(np.float64)
+    else:
+        product = np.empty((left.shape[0], right.shape[0]))
+        rows = max(DOT_BLOCK_BYTES // (4 * max(right.shape[1], 1)), 1)
+        for start in range(0, right.shape[0], rows):
+            block = right[start:start + rows].astype(np.float32)
+            product[:, start:start + rows] = left @ block.T
+    if "embedding_scales" in mentee_features:
+        product *= np.asarray(mentee_features["embedding_scales"], dtype=np.float64)[:, np.newaxis]
+    if "embedding_scales" in mentor_features:
+        product *= np.asarray(mentor_features["embedding_scales"], dtype=np.float64)[np.newaxis, :]
+    return product
+
+
+def embedding_norms(features: Dict[str, np.ndarray]) -> np.ndarray:
+    decoded = decode_embeddings(features)
+    return np.sqrt(np.einsum("ij,ij->i", decoded, decoded))
@@ -0,0 +1,115 @@
+"""Per-request stage timings and rolling latency summaries.
+
+``StageTimer`` is a LangChain callback handler: passed in an LLM call's
+``callbacks`` it times every retriever and LLM run of that call, and its
+``stage`` context manager times code outside LangChain runs (such as
+reading history, embedding the query and searching the vector store).
+``RequestMetrics`` keeps the timings of the last ``window`` requests per
+endpoint and summarizes them as percentiles.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict
+from uuid import UUID
+
+import numpy as np
+from langchain_core.callbacks import BaseCallbackHandler
+
+from ..config.config import METRICS_CONFIG
+
+
+class StageTimer(BaseCallbackHandler):
+    """Seconds spent per stage (``retrieval``, ``llm``, or named stages) of one request."""
+
+    # Callbacks are timestamps only; run them on the event loop instead of an executor
+    run_inline = True
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.seconds: Dict[str, float] = {}
+        self._runs: Dict[UUID, float] = {}
+
+    def add(self, stage: str, seconds: float):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def _start(self, run_id: UUID):
+        self._runs[run_id] = time.perf_counter()
+
+    def _end(self, stage: str, run_id: UUID):
+        started = self._runs.pop(run_id, None)
+        if started is not None:
+            self.add(stage, time.perf_counter() - started)
+
+    def on_retriever_start(self, serialized, query, *, run_id, **kwargs):
+        self._start(run_id)
+
+    def on_retriever_end(self, documents, *, run_id, **kwargs):
+        self._end("retrieval", run_id)
+
+    def on_retriever_error(self, error, *, run_id, **kwargs):
+        self._end("retrieval", run_id)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._start(run_id)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._start(run_id)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self._end("llm", run_id)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end("llm", run_id)
+
+    def timings(self) -> Dict[str, float]:
+        """Stage seconds plus ``total`` since the timer was created."""
+        return {**self.seconds, "total": time.perf_counter() - self.started}
+
+    def server_timing(self) -> str:
+        """The timings as a ``Server-Timing`` header value, in milliseconds."""
+        return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in self.timings().items())
+
+
+class RequestMetrics:
+    """Stage timings of the most recent requests per endpoint."""
+
+    def __init__(self, window: int = METRICS_CONFIG["window"]):
+        self.window = window
+        self._lock = threading.Lock()
+        self._requests: Dict[str, Deque[Dict[str, float]]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def record(self, endpoint: str, timings: Dict[str, float]):
+        with self._lock:
+            self._requests.setdefault(endpoint, deque(maxlen=self.window)).append(dict(timings))
+            self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+
+    def summary(self) -> Dict[str, dict]:
+        """Per endpoint: request count and mean/p50/p95/max milliseconds per stage over the window."""
+        with self._lock:
+            snapshot = {endpoint: list(requests) for endpoint, requests in self._requests.items()}
+            counts = dict(self._counts)
+        summary = {}
+        for endpoint, requests in snapshot.items():
+            stages = {}
+            for stage in dict.fromkeys(stage for timings in requests for stage in timings):
+                # Requests that skipped a stage spent no time in it
+                values = np.array([timings.get(stage, 0.0) for timings in requests]) * 1000
+                stages[stage] = {
+                    "mean_ms": round(float(values.mean()), 2),
+                    "p50_ms": round(float(np.percentile(values, 50)), 2),
+                    "p95_ms": round(float(np.percentile(values, 95)), 2),
+                    "max_ms": round(float(values.max()), 2),
+                }
+            summary[endpoint] = {"requests": counts[endpoint], "window": len(requests), "stages": stages}
+        return summary
@@ -0,0 +1,157 @@
+"""Scoring kernels: one per match-score component.
+
+A kernel turns profiles into per-profile feature columns once
+(``precompute``) and scores whole (mentees, mentors) blocks from those
+columns (``score``). ``score_pair`` is the plain per-pair reference used
+by ``calculate_match_score``. The matching system sums the weighted
+kernel scores into a single block; each kernel's weight is read from
+``MATCHING_CONFIG`` under its ``weight_key``.
+
+New signals are added by subclassing ``ScoringKernel``, registering it
+and passing its name in ``ImprovedMentorMatchingSystem(kernels=[...])``.
+Kernels a system does not list are never precomputed or scored.
+"""
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union
+
+import numpy as np
+import scipy.sparse as sp
+
+from ..models.profile import Profile
+from ..models.vocabulary import VocabularyInterner
+from .quantization import embedding_dot
+from .vocabulary import jaccard_matrix
+
+if TYPE_CHECKING:
+    from .matching import ImprovedMentorMatchingSystem
+
+# Per-profile feature columns: dense arrays plus CSR skill/domain rows
+Features = Dict[str, Union[np.ndarray, sp.csr_matrix]]
+
+
+def embedding_matrix(profiles: List[Profile]) -> np.ndarray:
+    """Stack embeddings into a row-normalized matrix; missing embeddings become zero rows."""
+    dims = {np.asarray(p.semantic_embedding).shape[-1] for p in profiles if p.semantic_embedding is not None}
+    if len(dims) > 1:
+        raise ValueError(f"Inconsistent embedding dimensions: {sorted(dims)}")
+    matrix = np.zeros((len(profiles), dims.pop() if dims else 0), dtype=np.float64)
+    for row, profile in enumerate(profiles):
+        if profile.semantic_embedding is not None:
+            matrix[row] = np.asarray(profile.semantic_embedding, dtype=np.float64).ravel()
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+    norms[norms == 0.0] = 1.0
+    return matrix / norms[:, np.newaxis]
+
+
+class ScoringKernel(ABC):
+    """Base class for one score component.
+
+    ``columns`` names the feature columns ``precompute`` returns; they must
+    be unique across kernels. ``context`` is shared by every profile
+    prepared for one match, e.g. to hold a vocabulary both sides intern
+    into. ``max_score`` bounds ``score`` and is used by exact pruning.
+    """
+
+    name: str = ""
+    weight_key: str = ""
+    columns: Tuple[str, ...] = ()
+    max_score: float = 1.0
+
+    @abstractmethod
+    def precompute(self, profiles: List[Profile], context: dict) -> Features:
+        """The kernel's ``columns`` for ``profiles``, one row per profile."""
+
+    @abstractmethod
+    def score(self, matching_system: "ImprovedMentorMatchingSystem", mentor_features: Features,
+              mentee_features: Features) -> np.ndarray:
+        """The (mentees, mentors) block of scores."""
+
+    @abstractmethod
+    def score_pair(self, matching_system: "ImprovedMentorMatchingSystem", mentor: Profile,
+                   mentee: Profile) -> float:
+        """The score of one pair, matching ``score``."""
+
+
+class ExperienceKernel(ScoringKernel):
+    name = "experience_score"
+    weight_key = "experience_weight"
+    columns = ("years",)
+
+    def precompute(self, profiles: List[Profile], context: dict) -> Features:
+        return {"years": np.array([p.cumulative_year for p in profiles], dtype=np.float64)}
+
+    def score(self, matching_system, mentor_features, mentee_features):
+        gap = mentor_features["years"][np.newaxis, :] - mentee_features["years"][:, np.newaxis]
+        in_range = (gap >= matching_system.min_experience_gap) & (gap <= matching_system.max_experience_gap)
+        return np.where(in_range, 1.0 - (gap / matching_system.max_experience_gap), 0.0)
+
+    def score_pair(self, matching_system, mentor, mentee):
+        return matching_system.calculate_experience_score(mentor.cumulative_year, mentee.cumulative_year)
+
+
+class SemanticKernel(ScoringKernel):
+    name = "semantic_score"
+    weight_key = "semantic_weight"
+    columns = ("embeddings",)
+
+    def precompute(self, profiles: List[Profile], context: dict) -> Features:
+        return {"embeddings": embedding_matrix(profiles)}
+
+    def score(self, matching_system, mentor_features, mentee_features):
+        if not mentor_features["embeddings"].shape[1]:
+            return np.zeros((mentee_features["embeddings"].shape[0], mentor_features["embeddings"].shape[0]))
+        # Works on whatever precision prepare_features stored the column in
+        return embedding_dot(mentee_features, mentor_features)
+
+    def score_pair(self, matching_system, mentor, mentee):
+        return matching_system.calculate_semantic_similarity(mentor.semantic_embedding, mentee.semantic_embedding)
+
+
+class JaccardKernel(ScoringKernel):
+    """Jaccard similarity of a set field, over binary CSR rows of interned ids."""
+
+    def __init__(self, name: str, weight_key: str, field: str, column: str):
+        self.name = name
+        self.weight_key = weight_key
+        self.field = field
+        self.column = column
+        self.columns = (column,)
+
+    def precompute(self, profiles: List[Profile], context: dict) -> Features:
+        interner = context.setdefault(self.column, VocabularyInterner())
+        return {self.column: interner.encode(getattr(p, self.field) for p in profiles)}
+
+    def score(self, matching_system, mentor_features, mentee_features):
+        return jaccard_matrix(mentee_features[self.column], mentor_features[self.column])
+
+    def score_pair(self, matching_system, mentor, mentee):
+        return matching_system.calculate_domain_similarity(getattr(mentor, self.field), getattr(mentee, self.field))
+
+
+KERNELS: Dict[str, ScoringKernel] = {}
+
+
+def register_kernel(kernel: ScoringKernel) -> ScoringKernel:
+    if kernel.name in KERNELS:
+        raise ValueError(f"Scoring kernel {kernel.name!r} is already registered")
+    KERNELS[kernel.name] = kernel
+    return kernel
+
+
+def resolve_kernels(kernels: List[Union[str, ScoringKernel]]) -> List[ScoringKernel]:
+    resolved = [KERNELS[kernel] if isinstance(kernel, str) else kernel for kernel in kernels]
+    columns = [column for kernel in resolved for column in kernel.columns]
+    if len(columns) != len(set(columns)):
+        raise ValueError(f"Scoring kernels share feature columns: {columns}")
+    return resolved
+
+
+register_kernel(ExperienceKernel())
+register_kernel(SemanticKernel())
+register_kernel(JaccardKernel("domain_score", "domain_weight", "industry_domains", "domains"))
+register_kernel(JaccardKernel("skill_score", "skill_weight", "extracted_skills", "skills"))
+
+# Summed in this order, which is also the order of the breakdown keys
+DEFAULT_KERNELS = ["experience_score", "semantic_score", "domain_score", "skill_score"]
+# Columns every feature producer (profile stores, incremental sides) builds itself
+BUILTIN_COLUMNS = frozenset({"years", "embeddings", "embedding_scales", "domains", "skills"})
@@ -0,0 +1,27 @@
+import numpy as np
+import scipy.sparse as sp
+
+
+def jaccard_matrix(left: sp.csr_matrix, right: sp.csr_matrix) -> np.ndarray:
+    """Dense (left rows x right rows) Jaccard similarity of two binary CSR matrices.
+
+    Pairs where either side is empty score 0.0, as in
+    ``ImprovedMentorMatchingSystem.calculate_domain_similarity``.
+    """
+    width = max(left.shape[1], right.shape[1])
+    left = _pad_columns(left, width)
+    right = _pad_columns(right, width)
+
+    intersection = (left @ right.T).toarray().astype(np.float64)
+    left_sizes = np.diff(left.indptr).astype(np.float64)[:, np.newaxis]
+    right_sizes = np.diff(right.indptr).astype(np.float64)[np.newaxis, :]
+    union = left_sizes + right_sizes - intersection
+    nonempty = (left_sizes > 0) & (right_sizes > 0)
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=nonempty)
+
+
+def _pad_columns(matrix: sp.csr_matrix, width: int) -> sp.csr_matrix:
+    # Rows encoded before the vocabulary grew are narrower but otherwise valid
+    if matrix.shape[1] == width:
+        return matrix
+    return sp.csr_matrix((matrix.data, matrix.indices, matrix.indptr), shape=(matrix.shape[0], width))
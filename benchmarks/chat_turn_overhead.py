@@ -0,0 +1,111 @@
+"""Per-turn cost of keeping conversation history, pydantic messages vs records.
+
+Run from the repository root:
+
+    python -m benchmarks.chat_turn_overhead --turns 200000
+
+Each turn does the coach's history bookkeeping for one chat exchange:
+render the last ``context_window`` messages for the prompt, then add the
+question and the answer. ``pydantic`` replays what the coach did before,
+a validated ``Message`` per message in a ring buffer and the context
+re-joined from them on every turn; ``records`` is the
+``InMemoryConversationStore`` path with ``ChatRecord``. Only the
+bookkeeping is timed, no retrieval or LLM call. Memory is the traced
+allocation per stored message once ``--conversations`` conversations
+each hold a full window.
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from collections import deque
+
+from alx_connect.config.config import INTERVIEW_COACH_CONFIG
+from alx_connect.models.chat import ChatRecord, Message, MessageRole
+from alx_connect.services.conversation_store import InMemoryConversationStore
+
+QUESTION = "How should I answer a question about a project that failed?"
+ANSWER = "Structure the answer as situation, task, action and result. " * 4
+
+
+class PydanticHistory:
+    """The coach's previous bookkeeping: ``Message`` objects, context re-joined per turn."""
+
+    def __init__(self, max_messages: int):
+        self.max_messages = max_messages
+        self.conversations = {}
+
+    def render(self, conversation_id: str, limit: int) -> str:
+        messages = list(self.conversations.get(conversation_id, ()))[-limit:]
+        return "\n".join([f"{msg.role}: {msg.content}" for msg in messages])
+
+    def record_turn(self, conversation_id: str, question: str, answer: str):
+        messages = self.conversations.setdefault(conversation_id, deque(maxlen=self.max_messages))
+        messages.append(Message(role=MessageRole.USER, content=question))
+        messages.append(Message(role=MessageRole.ASSISTANT, content=answer))
+
+
+class RecordHistory:
+    def __init__(self, max_messages: int):
+        self.store = InMemoryConversationStore(max_messages=max_messages)
+
+    def render(self, conversation_id: str, limit: int) -> str:
+        return self.store.render(conversation_id, limit)
+
+    def record_turn(self, conversation_id: str, question: str, answer: str):
+        self.store.append_many(conversation_id, [
+            ChatRecord.create(MessageRole.USER, question),
+            ChatRecord.create(MessageRole.ASSISTANT, answer),
+        ])
+
+
+HISTORIES = {"pydantic": PydanticHistory, "records": RecordHistory}
+
+
+def _turn_microseconds(name: str, turns: int, conversations: int, window: int) -> float:
+    history = HISTORIES[name](window)
+    started = time.perf_counter()
+    for turn in range(turns):
+        conversation_id = f"c{turn % conversations}"
+        history.render(conversation_id, window)
+        history.record_turn(conversation_id, QUESTION, ANSWER)
+    return (time.perf_counter() - started) / turns * 1e6
+
+
+def _bytes_per_message(name: str, conversations: int, window: int) -> float:
+    tracemalloc.start()
+    history = HISTORIES[name](window)
+    for conversation in range(conversations):
+        for _ in range(window // 2):
+            history.record_turn(f"c{conversation}", QUESTION, ANSWER)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / (conversations * (window // 2) * 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200_000)
+    parser.add_argument("--conversations", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per history, best is kept")
+    args = parser.parse_args()
+
+    window = INTERVIEW_COACH_CONFIG["context_window"]
+    results = {}
+    for name in HISTORIES:
+        results[name] = {
+            "turn_us": round(min(_turn_microseconds(name, args.turns, args.conversations, window)
+                                 for _ in range(args.repeat)), 2),
+            "bytes_per_message": round(_bytes_per_message(name, args.conversations, window)),
+        }
+    print(json.dumps({
+        "turns": args.turns,
+        "conversations": args.conversations,
+        "context_window": window,
+        "results": results,
+        "speedup": round(results["pydantic"]["turn_us"] / results["records"]["turn_us"], 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
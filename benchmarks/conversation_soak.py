@@ -0,0 +1,95 @@
+"""Memory of the interview coach's conversation store over many chat sessions.
+
+Run from the repository root:
+
+    python -m benchmarks.conversation_soak --sessions 1000000 --turns 3
+
+Simulates ``--sessions`` sessions of ``--turns`` question/answer turns,
+one starting every ``--arrival`` simulated seconds, with a sweep every
+``cleanup_interval`` simulated seconds, and samples the process RSS along
+the way. With the bounded store RSS levels off once ``max_conversations``
+sessions are held; ``--unbounded`` replays the same load on a plain dict,
+as the coach kept before.
+"""
+import argparse
+import gc
+import json
+import os
+import time
+
+from alx_connect.config.config import INTERVIEW_COACH_CONFIG
+from alx_connect.models.chat import ChatRecord, ConversationState, Message, MessageRole
+from alx_connect.services.conversation_store import InMemoryConversationStore
+
+
+class SimulatedClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--arrival", type=float, default=0.05, help="simulated seconds between new sessions")
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--unbounded", action="store_true", help="use a plain dict of ConversationState")
+    args = parser.parse_args()
+
+    clock = SimulatedClock()
+    if args.unbounded:
+        conversations = {}
+    else:
+        store = InMemoryConversationStore(clock=clock)
+    interval = INTERVIEW_COACH_CONFIG["cleanup_interval"]
+    next_sweep = interval
+    sample_every = max(args.sessions // args.samples, 1)
+    answer = "Structure the answer as situation, task, action and result. " * 4
+
+    samples = []
+    gc.collect()
+    baseline = _rss_mb()
+    started = time.perf_counter()
+    for session in range(args.sessions):
+        clock.now = session * args.arrival
+        conversation_id = f"session-{session}"
+        for turn in range(args.turns):
+            for role, content in ((MessageRole.USER, f"Question {turn} of {conversation_id}"),
+                                  (MessageRole.ASSISTANT, answer)):
+                if args.unbounded:
+                    conversations.setdefault(conversation_id, ConversationState()).messages.append(
+                        Message(role=role, content=content)
+                    )
+                else:
+                    store.append(conversation_id, ChatRecord.create(role, content))
+        if not args.unbounded and clock.now >= next_sweep:
+            store.sweep()
+            next_sweep += interval
+        if (session + 1) % sample_every == 0:
+            samples.append({
+                "sessions": session + 1,
+                "conversations": len(conversations) if args.unbounded else len(store),
+                "rss_mb": round(_rss_mb(), 1),
+            })
+
+    print(json.dumps({
+        "store": "dict" if args.unbounded else "InMemoryConversationStore",
+        "sessions": args.sessions,
+        "turns": args.turns,
+        "seconds": round(time.perf_counter() - started, 2),
+        "baseline_rss_mb": round(baseline, 1),
+        "stats": None if args.unbounded else store.stats(),
+        "samples": samples,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Concurrent read/write throughput of the conversation store backends.
+
+Run from the repository root:
+
+    python -m benchmarks.conversation_store_throughput --processes 1 2 4 --seconds 5
+
+Each of ``--processes`` spawned workers runs a chat-like loop for
+``--seconds``: a fraction ``--read-ratio`` of operations read the last
+``context_window`` messages of a random conversation, the rest append a
+question/answer turn to one. SQLite workers share one database file, as
+``uvicorn --workers N`` would; memory workers each have a private store,
+which is the upper bound a shared backend is measured against.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from alx_connect.config.config import INTERVIEW_COACH_CONFIG
+from alx_connect.models.chat import ChatRecord, MessageRole
+from alx_connect.services.conversation_store import create_conversation_store
+
+
+def _store(backend: str, path: str):
+    return create_conversation_store(backend, path=path) if backend == "sqlite" else create_conversation_store(backend)
+
+
+def _worker(backend: str, path: str, args: argparse.Namespace, seed: int, start: float, queue: multiprocessing.Queue):
+    store = _store(backend, path)
+    rng = random.Random(seed)
+    answer = "Structure the answer as situation, task, action and result. " * 4
+    reads, writes = [], []
+    while time.time() < start:
+        time.sleep(0.001)
+    deadline = time.perf_counter() + args.seconds
+    while time.perf_counter() < deadline:
+        conversation_id = f"c{rng.randrange(args.conversations)}"
+        started = time.perf_counter()
+        if rng.random() < args.read_ratio:
+            store.recent(conversation_id, INTERVIEW_COACH_CONFIG["context_window"])
+            reads.append(time.perf_counter() - started)
+        else:
+            store.append_many(conversation_id, [
+                ChatRecord.create(MessageRole.USER, f"Question about {conversation_id}"),
+                ChatRecord.create(MessageRole.ASSISTANT, answer),
+            ])
+            writes.append(time.perf_counter() - started)
+    store.close()
+    queue.put({"reads": reads, "writes": writes})
+
+
+def _latency(samples):
+    if not samples:
+        return None
+    values = np.array(samples) * 1000
+    return {"p50_ms": round(float(np.percentile(values, 50)), 3), "p99_ms": round(float(np.percentile(values, 99)), 3)}
+
+
+def run(backend: str, processes: int, args: argparse.Namespace) -> dict:
+    directory = tempfile.mkdtemp(prefix="conversations-")
+    path = os.path.join(directory, "conversations.sqlite3")
+    if backend == "sqlite":
+        # Create the schema once, before the workers race to
+        _store(backend, path).close()
+
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    start = time.time() + 2.0  # let every worker import and connect first
+    workers = [context.Process(target=_worker, args=(backend, path, args, seed, start, queue)) for seed in range(processes)]
+    for worker in workers:
+        worker.start()
+    results = [queue.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+
+    reads = [sample for result in results for sample in result["reads"]]
+    writes = [sample for result in results for sample in result["writes"]]
+    return {
+        "backend": backend,
+        "processes": processes,
+        "reads_per_second": round(len(reads) / args.seconds),
+        "writes_per_second": round(len(writes) / args.seconds),
+        "read_latency": _latency(reads),
+        "write_latency": _latency(writes),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--backends", nargs="+", choices=["memory", "sqlite"], default=["memory", "sqlite"])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--read-ratio", type=float, default=0.5, help="share of operations that read history")
+    parser.add_argument("--conversations", type=int, default=1000)
+    args = parser.parse_args()
+
+    results = [run(backend, processes, args) for backend in args.backends for processes in args.processes]
+    print(json.dumps({
+        "cpu_count": os.cpu_count(),
+        "seconds": args.seconds,
+        "read_ratio": args.read_ratio,
+        "context_window": INTERVIEW_COACH_CONFIG["context_window"],
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
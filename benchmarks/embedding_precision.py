@@ -0,0 +1,92 @@
+"""Top-K ranking shift, memory and speed of reduced-precision embeddings.
+
+Run from the repository root:
+
+    python -m benchmarks.embedding_precision --profiles 20000 --top-k 10
+
+For every precision the vectorized matcher is run and each mentee's top-K
+is compared with the float64 result: recall@K (share of the exact top-K
+still present), exact-order agreement, mean and max rank displacement of
+the exact top-K mentors, and the largest absolute score change.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+from alx_connect.services.quantization import PRECISIONS
+
+from .synthetic import generate_profiles
+
+
+def rankings(matching_system, profiles, top_k):
+    ranked = {}
+    for mentee, matches in matching_system.iter_mentee_matches(profiles, top_k, vectorized=True):
+        ranked[mentee.id] = [(mentor.id, score) for mentor, _, score, _ in matches]
+    return ranked
+
+
+def embedding_bytes(matching_system, profiles):
+    mentors = [p for p in profiles if matching_system.is_mentor(p)]
+    mentees = [p for p in profiles if not matching_system.is_mentor(p)]
+    mentor_features, mentee_features = matching_system.prepare_features(mentors, mentees)
+    return sum(features[name].nbytes for features in (mentor_features, mentee_features)
+               for name in ("embeddings", "embedding_scales") if name in features)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    profiles = generate_profiles(args.profiles, dim=args.dim, seed=args.seed)
+    exact = None
+    results = []
+    for precision in PRECISIONS:
+        matching_system = ImprovedMentorMatchingSystem(embedding_precision=precision)
+        started = time.perf_counter()
+        ranked = rankings(matching_system, profiles, args.top_k)
+        seconds = time.perf_counter() - started
+        if exact is None:
+            exact = ranked
+
+        recalls, same_order, displacements, score_changes = [], 0, [], [0.0]
+        for mentee_id, expected in exact.items():
+            actual = ranked[mentee_id]
+            expected_ids = [mentor_id for mentor_id, _ in expected]
+            actual_ids = [mentor_id for mentor_id, _ in actual]
+            positions = {mentor_id: i for i, mentor_id in enumerate(actual_ids)}
+            if expected_ids:
+                recalls.append(len(set(expected_ids) & set(actual_ids)) / len(expected_ids))
+            same_order += expected_ids == actual_ids
+            # Mentors that fell out of the top-K count as displaced to position K
+            displacements.extend(abs(positions.get(mentor_id, len(expected_ids)) - i) for i, mentor_id in enumerate(expected_ids))
+            actual_scores = dict(actual)
+            score_changes.extend(abs(actual_scores[mentor_id] - score) for mentor_id, score in expected if mentor_id in actual_scores)
+
+        results.append({
+            "precision": precision,
+            "embedding_bytes": embedding_bytes(matching_system, profiles),
+            "seconds": round(seconds, 4),
+            "recall_at_k": round(float(np.mean(recalls)), 5) if recalls else None,
+            "identical_rankings": round(same_order / len(exact), 5) if exact else None,
+            "mean_rank_displacement": round(float(np.mean(displacements)), 5) if displacements else None,
+            "max_rank_displacement": int(max(displacements)) if displacements else None,
+            "max_score_change": float(max(score_changes)),
+        })
+
+    print(json.dumps({
+        "profiles": args.profiles,
+        "dim": args.dim,
+        "top_k": args.top_k,
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Wall time, peak RSS and pairs/sec of every matching engine per cohort size.
+
+Run from the repository root:
+
+    python -m benchmarks.matching_suite --sizes 1000 10000 100000 --output results.json
+    python -m benchmarks.matching_suite --sizes 1000 --compare results.json
+
+Each (engine, size) run happens in a fresh spawned process, so peak RSS
+is that run's own and nothing is shared through caches between runs.
+The pure-Python pairwise engine is skipped above ``--pairwise-limit``
+profiles. With ``--compare`` every run is set against the matching run
+of an earlier results file and slowdowns beyond ``--tolerance`` are flagged.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import queue as queues
+import resource
+import subprocess
+import sys
+import time
+
+from alx_connect.services.incremental_matching import IncrementalMatcher
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+
+from .synthetic import generate_profiles
+
+
+def _pairwise(matching_system, profiles, args):
+    return matching_system.find_matches(profiles, top_k=args.top_k)
+
+
+def _vectorized(matching_system, profiles, args):
+    return matching_system.find_matches(profiles, top_k=args.top_k, vectorized=True)
+
+
+def _pruned(matching_system, profiles, args):
+    return matching_system.find_matches(profiles, top_k=args.top_k, prune=True)
+
+
+def _parallel(matching_system, profiles, args):
+    return matching_system.find_matches(profiles, top_k=args.top_k, vectorized=True, workers=args.workers)
+
+
+def _mentor_index(matching_system, profiles, args):
+    from alx_connect.services.mentor_index import MentorIndex
+    index = MentorIndex.from_profiles([p for p in profiles if matching_system.is_mentor(p)])
+    return matching_system.find_matches(profiles, top_k=args.top_k, mentor_index=index)
+
+
+def _incremental(matching_system, profiles, args):
+    matcher = IncrementalMatcher.from_profiles(profiles, matching_system=matching_system, top_k=args.top_k)
+    return matcher.all_matches()
+
+
+ENGINES = {
+    "pairwise": _pairwise,
+    "vectorized": _vectorized,
+    "pruned": _pruned,
+    "parallel": _parallel,
+    "mentor_index": _mentor_index,
+    "incremental": _incremental,
+}
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20
+
+
+def _run(engine: str, size: int, args: argparse.Namespace, queue: multiprocessing.Queue):
+    profiles = generate_profiles(size, dim=args.dim, seed=args.seed)
+    matching_system = ImprovedMentorMatchingSystem()
+    mentors = sum(1 for p in profiles if matching_system.is_mentor(p))
+    pairs = mentors * (size - mentors)
+    rss_before = _rss_mb() if os.path.exists("/proc/self/statm") else None
+
+    started = time.perf_counter()
+    matches = ENGINES[engine](matching_system, profiles, args)
+    seconds = time.perf_counter() - started
+
+    queue.put({
+        "engine": engine,
+        "profiles": size,
+        "mentors": mentors,
+        "mentees": size - mentors,
+        "pairs": pairs,
+        "matches": len(matches),
+        "seconds": round(seconds, 4),
+        "pairs_per_second": round(pairs / seconds) if seconds else None,
+        "rss_before_mb": round(rss_before, 1) if rss_before is not None else None,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    })
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: list, baseline_path: str, tolerance: float) -> list:
+    with open(baseline_path) as f:
+        baseline = {(r["engine"], r["profiles"]): r for r in json.load(f)["results"] if "seconds" in r}
+    comparisons = []
+    for result in results:
+        before = baseline.get((result["engine"], result["profiles"]))
+        if before is None or "seconds" not in result:
+            continue
+        ratio = result["seconds"] / before["seconds"] if before["seconds"] else None
+        comparisons.append({
+            "engine": result["engine"],
+            "profiles": result["profiles"],
+            "seconds_before": before["seconds"],
+            "seconds": result["seconds"],
+            "ratio": round(ratio, 3) if ratio is not None else None,
+            "peak_rss_mb_before": before["peak_rss_mb"],
+            "peak_rss_mb": result["peak_rss_mb"],
+            "regression": ratio is not None and ratio > 1.0 + tolerance,
+        })
+    return comparisons
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--pairwise-limit", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    parser.add_argument("--compare", help="earlier JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed slowdown before flagging")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for size in args.sizes:
+        for engine in args.engines:
+            if engine == "pairwise" and size > args.pairwise_limit:
+                results.append({"engine": engine, "profiles": size, "skipped": "above --pairwise-limit"})
+                continue
+            if engine == "mentor_index":
+                try:
+                    import faiss  # noqa: F401
+                except ImportError:
+                    results.append({"engine": engine, "profiles": size, "skipped": "faiss not installed"})
+                    continue
+            queue = context.Queue()
+            process = context.Process(target=_run, args=(engine, size, args, queue))
+            process.start()
+            while True:
+                try:
+                    result = queue.get(timeout=1.0)
+                    break
+                except queues.Empty:
+                    if not process.is_alive():
+                        # Killed (e.g. out of memory) before reporting
+                        result = {"engine": engine, "profiles": size, "error": f"exit code {process.exitcode}"}
+                        break
+            process.join()
+            results.append(result)
+
+    report = {
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "dim": args.dim,
+        "top_k": args.top_k,
+        "seed": args.seed,
+        "results": results,
+    }
+    if args.compare:
+        report["comparison"] = compare(results, args.compare, args.tolerance)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Recall and latency of FAISS candidate generation against exact matching.
+
+Run from the repository root:
+
+    python -m benchmarks.mentor_index_recall --profiles 5000 --top-k 10
+"""
+import argparse
+import json
+import time
+
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+from alx_connect.services.mentor_index import MentorIndex
+
+from .synthetic import generate_profiles
+
+
+def top_k_ids(matching_system, profiles, top_k, **kwargs):
+    return {
+        mentee.id: [match[0].id for match in mentee_matches]
+        for mentee, mentee_matches in matching_system.iter_mentee_matches(profiles, top_k=top_k, **kwargs)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=5000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--candidates", type=int, nargs="+", default=[10, 25, 50, 100, 200, 500])
+    parser.add_argument("--factory", default="Flat", help="FAISS index factory string, e.g. Flat or IVF64,Flat")
+    parser.add_argument("--nprobe", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    profiles = generate_profiles(args.profiles, dim=args.dim, seed=args.seed)
+    matching_system = ImprovedMentorMatchingSystem()
+
+    started = time.perf_counter()
+    exact = top_k_ids(matching_system, profiles, args.top_k, vectorized=True)
+    exact_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    index = MentorIndex.from_profiles([p for p in profiles if matching_system.is_mentor(p)],
+                                      factory=args.factory, nprobe=args.nprobe)
+    build_seconds = time.perf_counter() - started
+
+    results = []
+    for n in args.candidates:
+        started = time.perf_counter()
+        approximate = top_k_ids(matching_system, profiles, args.top_k, mentor_index=index, index_candidates=n)
+        seconds = time.perf_counter() - started
+        hits = sum(len(set(exact[m]) & set(approximate[m])) for m in exact)
+        total = sum(len(exact[m]) for m in exact)
+        results.append({
+            "candidates": n,
+            "seconds": round(seconds, 4),
+            "recall_at_k": round(hits / total, 4) if total else 1.0,
+            "speedup": round(exact_seconds / seconds, 2) if seconds else None,
+        })
+
+    print(json.dumps({
+        "profiles": args.profiles,
+        "mentors": len(index),
+        "top_k": args.top_k,
+        "factory": args.factory,
+        "exact_seconds": round(exact_seconds, 4),
+        "index_build_seconds": round(build_seconds, 4),
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Wall time of process-parallel matching for 1/2/4/8 workers.
+
+Run from the repository root:
+
+    python -m benchmarks.parallel_scaling --profiles 20000 --top-k 10
+"""
+import argparse
+import json
+import os
+import time
+
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+
+from .synthetic import generate_profiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    profiles = generate_profiles(args.profiles, dim=args.dim, seed=args.seed)
+    matching_system = ImprovedMentorMatchingSystem()
+
+    baseline = None
+    results = []
+    for workers in args.workers:
+        started = time.perf_counter()
+        matches = matching_system.find_matches(
+            profiles, top_k=args.top_k, vectorized=True, chunk_size=args.chunk_size, workers=workers
+        )
+        seconds = time.perf_counter() - started
+        signature = [(m[0].id, m[1].id, m[2]) for m in matches]
+        if baseline is None:
+            baseline = (seconds, signature)
+        results.append({
+            "workers": workers,
+            "seconds": round(seconds, 4),
+            "speedup": round(baseline[0] / seconds, 2),
+            "identical_to_first": signature == baseline[1],
+        })
+
+    print(json.dumps({
+        "profiles": args.profiles,
+        "top_k": args.top_k,
+        "chunk_size": args.chunk_size,
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Memory of a list of Profile dataclasses versus a columnar ProfileStore.
+
+Run from the repository root:
+
+    python -m benchmarks.profile_store_memory --profiles 100000
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from alx_connect.models.profile_store import ProfileStore
+
+from .synthetic import generate_profiles
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--batch", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    def build_list():
+        profiles = []
+        for start in range(0, args.profiles, args.batch):
+            profiles.extend(generate_profiles(min(args.batch, args.profiles - start), dim=args.dim, seed=args.seed + start))
+        return profiles
+
+    def build_store():
+        # Batches are dropped once stored, so only the columns stay resident
+        store = ProfileStore(dimension=args.dim, capacity=args.profiles)
+        for start in range(0, args.profiles, args.batch):
+            for profile in generate_profiles(min(args.batch, args.profiles - start), dim=args.dim, seed=args.seed + start):
+                store.add(profile)
+        return store
+
+    profiles, list_bytes, list_peak = measure(build_list)
+    del profiles
+    store, store_bytes, store_peak = measure(build_store)
+
+    print(json.dumps({
+        "profiles": args.profiles,
+        "dim": args.dim,
+        "profile_list": {"bytes": list_bytes, "bytes_per_profile": round(list_bytes / args.profiles, 1)},
+        "profile_store": {
+            "bytes": store_bytes,
+            "bytes_per_profile": round(store_bytes / args.profiles, 1),
+            "build_peak_bytes": store_peak,
+        },
+        "ratio": round(list_bytes / store_bytes, 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
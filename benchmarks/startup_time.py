@@ -0,0 +1,82 @@
+"""Cold-start time of the API: ``import alx_connect.main`` and the first request.
+
+Run from the repository root:
+
+    python -m benchmarks.startup_time --repeat 5 --top 15
+
+Every repetition is a fresh interpreter, so nothing is shared through
+module caches. Reports the import time and the time until ``GET /api/v1/``
+is answered, plus the slowest imports by cumulative time from one
+``-X importtime`` run. Service warm-up is disabled, as it would be under
+a lazy first request.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import json, time
+started = time.perf_counter()
+import alx_connect.main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+response = TestClient(alx_connect.main.app).get("/api/v1/")
+answered = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({"import_seconds": imported - started, "first_request_seconds": answered - started}))
+"""
+
+
+def _environment():
+    return dict(os.environ, WARM_UP_SERVICES="false")
+
+
+def measure() -> dict:
+    output = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, check=True,
+                            env=_environment()).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def slowest_imports(top: int) -> list:
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", "import alx_connect.main"],
+                            capture_output=True, text=True, check=True, env=_environment()).stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Only top-level entries of each import chain, nested ones are included in them
+        if name.startswith("   ") and not name.startswith("    "):
+            modules.append({"module": name.strip(), "cumulative_seconds": int(cumulative) / 1e6})
+    return sorted(modules, key=lambda m: -m["cumulative_seconds"])[:top]
+
+
+def _summary(values):
+    return {
+        "min": round(min(values), 4),
+        "median": round(statistics.median(values), 4),
+        "max": round(max(values), 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.repeat)]
+    print(json.dumps({
+        "python": sys.version.split()[0],
+        "repeat": args.repeat,
+        "import_seconds": _summary([run["import_seconds"] for run in runs]),
+        "first_request_seconds": _summary([run["first_request_seconds"] for run in runs]),
+        "slowest_imports": slowest_imports(args.top),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
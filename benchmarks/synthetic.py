@@ -0,0 +1,49 @@
+"""Seeded synthetic cohorts for matching benchmarks."""
+from typing import List
+
+import numpy as np
+
+from alx_connect.models.profile import Profile
+
+TRACKS = {
+    "backend": (["Software Development", "Cloud Computing", "Fintech"],
+                ["Python", "Java", "Go", "SQL", "PostgreSQL", "Docker", "FastAPI", "Django", "Redis", "Kafka"]),
+    "frontend": (["Software Development", "E-commerce", "Media"],
+                 ["JavaScript", "TypeScript", "React", "Vue", "CSS", "HTML", "Next.js", "Figma"]),
+    "data": (["Data Science", "Artificial Intelligence", "Healthcare"],
+             ["Python", "SQL", "Pandas", "NumPy", "PyTorch", "TensorFlow", "Spark", "Statistics"]),
+    "devops": (["Cloud Computing", "Cybersecurity", "Telecommunications"],
+               ["Docker", "Kubernetes", "Terraform", "AWS", "GCP", "Linux", "Bash", "Ansible"]),
+    "security": (["Cybersecurity", "Fintech", "Government"],
+                 ["Linux", "Networking", "Python", "Penetration Testing", "SIEM", "Cryptography"]),
+    "mobile": (["Software Development", "E-commerce", "Media"],
+               ["Kotlin", "Swift", "Flutter", "Dart", "React Native", "Firebase"]),
+}
+
+
+def generate_profiles(count: int, dim: int = 384, seed: int = 0) -> List[Profile]:
+    """Profiles grouped into career tracks whose embeddings cluster together."""
+    rng = np.random.default_rng(seed)
+    track_names = list(TRACKS)
+    centroids = rng.normal(size=(len(track_names), dim))
+    tracks = rng.integers(0, len(track_names), size=count)
+    # Most of the cohort is junior; a long tail of seniors mentors them
+    years = np.minimum(rng.gamma(shape=1.6, scale=3.0, size=count), 30).astype(int)
+    embeddings = centroids[tracks] + rng.normal(scale=1.5, size=(count, dim))
+
+    profiles = []
+    for i in range(count):
+        domains, skills = TRACKS[track_names[tracks[i]]]
+        profiles.append(Profile(
+            id=f"profile-{i}",
+            full_name=f"Synthetic Person {i}",
+            email=f"person{i}@example.com",
+            personal_summary=f"{track_names[tracks[i]]} enthusiast",
+            professional_summary=f"{years[i]} years in {track_names[tracks[i]]}",
+            cumulative_year=int(years[i]),
+            portfolio=f"https://github.com/person{i}",
+            extracted_skills=set(rng.choice(skills, size=rng.integers(1, min(6, len(skills))), replace=False).tolist()),
+            industry_domains=set(rng.choice(domains, size=rng.integers(1, 3), replace=False).tolist()),
+            semantic_embedding=embeddings[i]
+        ))
+    return profiles
@@ -10,8 +10,10 @@ setup(
         "python-dotenv>=0.19.0",
         "pydantic>=2.0.0",
         "numpy>=1.21.0",
+        "scipy>=1.7.0",
         "pandas>=1.3.0",
         "scikit-learn>=1.0.0",
+        "threadpoolctl>=3.0.0",
         "langchain>=0.1.0",
         "langchain-groq>=0.1.0",
         "langchain-community>=0.0.10",
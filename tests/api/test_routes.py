@@ -27,6 +27,13 @@ def test_root_endpoint(client):
     assert response.status_code == 200
     assert "message" in response.json()
 
+def test_readiness_endpoint(client):
+    # The client does not run startup, so nothing has been warmed up
+    response = client.get("/api/v1/ready")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+    assert response.json()["services"]["interview_coach"]["state"] == "pending"
+
 def test_mentor_matching_endpoint(client, sample_profile_input):
     response = client.post(
         "/api/v1/mentor-matching/",
@@ -35,6 +42,45 @@ def test_mentor_matching_endpoint(client, sample_profile_input):
     assert response.status_code == 200
     assert "matches" in response.json()
 
+def test_mentor_matching_stream_endpoint(client, sample_profile_input):
+    response = client.post(
+        "/api/v1/mentor-matching/stream",
+        json=[sample_profile_input.model_dump()]
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+def _submit_matching_job(client, profile_input):
+    response = client.post(
+        "/api/v1/mentor-matching/jobs",
+        json={"profiles": [profile_input.model_dump()], "top_k": 5}
+    )
+    assert response.status_code == 202
+    return response.json()["job_id"]
+
+def test_submit_matching_job_endpoint(client, sample_profile_input):
+    assert _submit_matching_job(client, sample_profile_input)
+
+def test_matching_job_status_endpoint(client, sample_profile_input):
+    job_id = _submit_matching_job(client, sample_profile_input)
+    response = client.get(f"/api/v1/mentor-matching/jobs/{job_id}")
+    assert response.status_code == 200
+    assert "progress" in response.json()
+
+def test_matching_job_results_endpoint(client, sample_profile_input):
+    job_id = _submit_matching_job(client, sample_profile_input)
+    response = client.get(f"/api/v1/mentor-matching/jobs/{job_id}/results", params={"offset": 0, "limit": 10})
+    assert response.status_code == 200
+    assert "matches" in response.json()
+
+def test_cancel_matching_job_endpoint(client, sample_profile_input):
+    job_id = _submit_matching_job(client, sample_profile_input)
+    response = client.delete(f"/api/v1/mentor-matching/jobs/{job_id}")
+    assert response.status_code == 200
+
+def test_matching_job_endpoint_unknown_job(client):
+    assert client.get("/api/v1/mentor-matching/jobs/missing").status_code == 404
+
 def test_ask_question_endpoint(client):
     response = client.post(
         "/api/v1/ask-question/",
@@ -85,4 +131,51 @@ def test_cv_review_endpoint_invalid_file(client):
         files=files
     )
     
-    assert response.status_code == 500 
\ No newline at end of file
+    assert response.status_code == 500 
+
+def test_websocket_chat_streams_tokens(client, monkeypatch):
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from langchain_core.language_models import FakeListChatModel
+    from alx_connect.api import routes
+    from alx_connect.services.container import ServiceContainer
+    from alx_connect.services.interview_coach import InterviewCoach
+
+    services = ServiceContainer()
+    services.register("interview_coach", lambda c: InterviewCoach(
+        llm=FakeListChatModel(responses=["Breathe and structure your answer."]),
+        embeddings=DeterministicFakeEmbedding(size=16)
+    ))
+    monkeypatch.setattr(routes, "services", services)
+
+    with client.websocket_connect("/api/v1/ws/chat/conv1") as websocket:
+        websocket.send_text("Any tips for nerves?")
+        frames = []
+        while not frames or frames[-1]["type"] != "end":
+            frames.append(websocket.receive_json())
+    assert frames[-1]["content"] == "Breathe and structure your answer."
+    assert "".join(f["content"] for f in frames if f["type"] == "token") == frames[-1]["content"]
+
+def test_mentor_matching_embeds_profile_summaries(client, sample_profile_input, monkeypatch, tmp_path):
+    import json
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from alx_connect.api import routes
+    from alx_connect.services.container import ServiceContainer
+    from alx_connect.services.matching import ImprovedMentorMatchingSystem
+    from alx_connect.services.profile_embeddings import ProfileEmbeddingService
+
+    services = ServiceContainer()
+    services.register("profile_embeddings", lambda c: ProfileEmbeddingService(
+        DeterministicFakeEmbedding(size=8), cache_path=str(tmp_path / "embeddings.sqlite3")
+    ))
+    monkeypatch.setattr(routes, "services", services)
+    mentee = sample_profile_input.model_copy(update={"id": "mentee1", "cumulative_year": 1})
+    profiles = [sample_profile_input, mentee]
+
+    response = client.post("/api/v1/mentor-matching/stream", json=[p.model_dump() for p in profiles])
+    line = json.loads(response.content.splitlines()[0])
+
+    embedded = routes.embed_profiles([p.to_profile() for p in profiles])
+    assert embedded[0].semantic_embedding is not None
+    [(_, _, score, breakdown)] = ImprovedMentorMatchingSystem().find_matches(embedded)
+    assert breakdown["semantic_score"] > 0
+    assert line["matches"][0]["score"] == pytest.approx(score)
@@ -38,6 +38,27 @@ def sample_profile():
         semantic_embedding=np.random.rand(384)  # Mock embedding
     )
 
+def make_profile(profile_id, years=3, skills=(), domains=(), embedding=None, **fields):
+    """A ``Profile`` with placeholder text; ``fields`` sets any other ``Profile`` field.
+
+    Plain function rather than a fixture so test modules can build
+    profiles in helpers and parametrizations: ``from conftest import make_profile``.
+    """
+    values = dict(
+        id=profile_id,
+        full_name="Test Person",
+        email=f"{profile_id}@example.com",
+        personal_summary="Summary",
+        professional_summary="Summary",
+        cumulative_year=years,
+        portfolio="https://github.com/example",
+        extracted_skills=set(skills),
+        industry_domains=set(domains),
+        semantic_embedding=embedding
+    )
+    values.update(fields)
+    return Profile(**values)
+
 @pytest.fixture
 def sample_message():
     return Message(
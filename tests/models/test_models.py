@@ -1,7 +1,7 @@
 import pytest
 from datetime import datetime
 from alx_connect.models.profile import Profile, ProfileInput
-from alx_connect.models.chat import Message, MessageRole, ConversationState, QuestionInput
+from alx_connect.models.chat import ChatRecord, Message, MessageRole, ConversationState, QuestionInput
 
 def test_profile_input_validation():
     # Test valid profile input
@@ -99,6 +99,21 @@ def test_message_validation():
             content="   "
         )
 
+def test_chat_record():
+    record = ChatRecord.create(MessageRole.ASSISTANT, "  Hi there!  ")
+    assert record.role == MessageRole.ASSISTANT
+    assert record.render() == "assistant: Hi there!"
+
+    message = record.to_message()
+    assert message.role == MessageRole.ASSISTANT
+    assert message.content == "Hi there!"
+    assert ChatRecord.from_message(message).created == pytest.approx(record.created, abs=1e-3)
+
+    with pytest.raises(ValueError):
+        ChatRecord.create(MessageRole.USER, "   ")
+    with pytest.raises(ValueError):
+        ChatRecord.create("moderator", "Hello")
+
 def test_conversation_state():
     messages = [
         Message(
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+from alx_connect.models.profile import Profile
+from conftest import make_profile
+from alx_connect.models.profile_store import ProfileStore
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+
+def _profile(profile_id, years, embedding=None, skills=(), domains=()):
+    return make_profile(profile_id, years, skills, domains, embedding, full_name=f"Person {profile_id}",
+                        personal_summary="Résumé summary", professional_summary="Professional summary",
+                        seniority_keywords={"Senior"} if years >= 5 else set())
+
+def test_views_round_trip_profile_fields():
+    profile = _profile("a", 7, np.arange(4, dtype=np.float64), {"Python", "SQL"}, {"Cloud"})
+    store = ProfileStore.from_profiles([profile, _profile("b", 2)])
+
+    view = store["a"]
+    assert isinstance(view, Profile)
+    assert view.id == "a"
+    assert view.personal_summary == "Résumé summary"
+    assert view.cumulative_year == 7
+    assert view.extracted_skills == {"Python", "SQL"}
+    assert view.industry_domains == {"Cloud"}
+    assert view.seniority_keywords == {"Senior"}
+    assert view.semantic_embedding.dtype == np.float32
+    assert np.array_equal(view.semantic_embedding, profile.semantic_embedding)
+    assert store["b"].semantic_embedding is None
+    assert view.to_dict() == profile.to_dict()
+
+def test_views_are_read_only_but_copy_is_mutable():
+    store = ProfileStore.from_profiles([_profile("a", 7, skills={"Python"})])
+    view = store["a"]
+    with pytest.raises(AttributeError):
+        view.cumulative_year = 3
+
+    copy = view.copy(cumulative_year=3)
+    copy.extracted_skills.add("Go")
+    assert copy.cumulative_year == 3
+    assert store["a"].extracted_skills == {"Python"}
+
+def test_add_replaces_and_remove_tombstones():
+    store = ProfileStore(capacity=1)
+    store.add(_profile("a", 1))
+    store.add(_profile("b", 2))
+    store.add(_profile("a", 9))
+    assert len(store) == 2
+    assert store["a"].cumulative_year == 9
+
+    store.remove("b")
+    assert "b" not in store
+    assert [view.id for view in store] == ["a"]
+
+def test_rejects_mismatched_embedding_dimension():
+    store = ProfileStore.from_profiles([_profile("a", 1, np.ones(4))])
+    with pytest.raises(ValueError):
+        store.add(_profile("b", 1, np.ones(3)))
+
+def test_matching_on_views_uses_store_columns():
+    rng = np.random.default_rng(0)
+    profiles = [
+        _profile(f"p{i}", int(rng.integers(0, 15)), None if i % 5 == 0 else rng.normal(size=8),
+                 set(rng.choice(["Python", "Go", "SQL", "React"], size=2, replace=False)),
+                 {["Cloud", "Web", "Data"][i % 3]})
+        for i in range(60)
+    ]
+    views = list(ProfileStore.from_profiles(profiles))
+    matching_system = ImprovedMentorMatchingSystem()
+
+    expected = matching_system.find_matches(views)
+    actual = matching_system.find_matches(views, vectorized=True)
+    assert [(m[0].id, m[1].id) for m in expected] == [(m[0].id, m[1].id) for m in actual]
+    # The pairwise path runs sklearn in float32 for float32 embeddings
+    assert [m[2] for m in expected] == pytest.approx([m[2] for m in actual], abs=1e-6)
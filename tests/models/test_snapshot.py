@@ -0,0 +1,62 @@
+import os
+import pytest
+import numpy as np
+from conftest import make_profile
+from alx_connect.models.profile_store import ProfileStore
+from alx_connect.models.snapshot import SnapshotHandle, current_version, list_versions, open_snapshot, write_snapshot
+
+def _profile(profile_id, years, embedding=None, skills=()):
+    return make_profile(profile_id, years, skills, {"Cloud"}, embedding, full_name=f"Person {profile_id}",
+                        professional_summary="Professional summary")
+
+@pytest.fixture
+def store():
+    return ProfileStore.from_profiles([
+        _profile("a", 7, np.array([1.0, 0.0, 0.0]), {"Python"}),
+        _profile("b", 2, None, {"SQL", "Go"}),
+        _profile("c", 1, np.array([0.0, 1.0, 0.0])),
+    ])
+
+def test_round_trip_is_memory_mapped(store, tmp_path):
+    store.remove("c")
+    version = write_snapshot(store, str(tmp_path))
+    assert current_version(str(tmp_path)) == version
+
+    loaded = open_snapshot(str(tmp_path))
+    assert isinstance(loaded.embeddings, np.memmap)
+    assert len(loaded) == 2
+    assert [view.to_dict() for view in loaded] == [view.to_dict() for view in store]
+    assert loaded["b"].extracted_skills == {"SQL", "Go"}
+    assert loaded["b"].semantic_embedding is None
+    assert np.array_equal(loaded["a"].semantic_embedding, store["a"].semantic_embedding)
+
+def test_snapshot_store_is_read_only(store, tmp_path):
+    write_snapshot(store, str(tmp_path))
+    loaded = open_snapshot(str(tmp_path))
+    with pytest.raises(ValueError):
+        loaded.add(_profile("d", 3))
+
+def test_handle_follows_published_versions(store, tmp_path):
+    root = str(tmp_path)
+    write_snapshot(store, root)
+    handle = SnapshotHandle(root)
+    first = handle.get()
+    assert handle.get() is first
+
+    store.add(_profile("d", 9))
+    write_snapshot(store, root)
+    second = handle.get()
+    assert second is not first
+    assert "d" in second
+    assert "d" not in first
+
+def test_old_versions_are_pruned(store, tmp_path):
+    root = str(tmp_path)
+    for _ in range(4):
+        write_snapshot(store, root, keep=2)
+    assert list_versions(root) == ["v000003", "v000004"]
+    assert not [name for name in os.listdir(root) if name.startswith(".")]
+
+def test_open_without_publication_fails(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        open_snapshot(str(tmp_path))
@@ -0,0 +1,57 @@
+import numpy as np
+from alx_connect.services.answer_cache import SemanticAnswerCache, context_fingerprint
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def _vector(*values):
+    return np.array(values, dtype=np.float64)
+
+def test_similar_question_with_same_context_hits():
+    cache = SemanticAnswerCache(similarity_threshold=0.9, ttl=60, max_entries=10)
+    cache.put(_vector(1.0, 0.0, 0.0), "ctx", "REST is an architectural style.")
+
+    assert cache.get(_vector(0.99, 0.1, 0.0), "ctx") == "REST is an architectural style."
+    # Same question, different retrieved context
+    assert cache.get(_vector(1.0, 0.0, 0.0), "other") is None
+    # Same context, different question
+    assert cache.get(_vector(0.0, 1.0, 0.0), "ctx") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+    assert stats["hit_rate"] == 0.3333
+
+def test_entries_expire_and_least_recently_used_is_evicted():
+    clock = Clock()
+    cache = SemanticAnswerCache(similarity_threshold=0.9, ttl=10, max_entries=2, clock=clock)
+    cache.put(_vector(1.0, 0.0), "a", "first")
+    cache.put(_vector(1.0, 0.0), "b", "second")
+    assert cache.get(_vector(1.0, 0.0), "a") == "first"
+
+    cache.put(_vector(1.0, 0.0), "c", "third")
+    assert cache.get(_vector(1.0, 0.0), "b") is None
+    assert cache.get(_vector(1.0, 0.0), "a") == "first"
+    assert cache.stats()["evictions"] == 1
+
+    clock.now = 11.0
+    assert cache.get(_vector(1.0, 0.0), "a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 1
+
+def test_near_duplicate_replaces_the_cached_answer():
+    cache = SemanticAnswerCache(similarity_threshold=0.9, ttl=60, max_entries=10)
+    cache.put(_vector(1.0, 0.0), "ctx", "old")
+    cache.put(_vector(1.0, 0.05), "ctx", "new")
+    assert len(cache) == 1
+    assert cache.get(_vector(1.0, 0.0), "ctx") == "new"
+
+def test_context_fingerprint_depends_on_version_and_documents():
+    from langchain_core.documents import Document
+    documents = [Document(page_content="a"), Document(page_content="b")]
+    assert context_fingerprint(documents, "v1") == context_fingerprint(list(documents), "v1")
+    assert context_fingerprint(documents, "v1") != context_fingerprint(documents, "v2")
+    assert context_fingerprint(documents, "v1") != context_fingerprint(documents[::-1], "v1")
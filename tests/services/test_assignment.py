@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+import scipy.sparse as sp
+from collections import Counter
+from scipy.optimize import linear_sum_assignment
+from conftest import make_profile
+from alx_connect.services.assignment import solve_assignment
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+
+def _random_profiles(count, seed):
+    rng = np.random.default_rng(seed)
+    skills = ["Python", "Java", "Docker", "SQL", "React", "Go"]
+    domains = ["Software", "Cloud", "AI", "Web"]
+    return [
+        make_profile(
+            f"p{i}",
+            int(rng.integers(0, 14)),
+            rng.choice(skills, size=rng.integers(0, 3), replace=False).tolist(),
+            rng.choice(domains, size=rng.integers(0, 2), replace=False).tolist(),
+            None if rng.random() < 0.2 else rng.normal(size=8)
+        )
+        for i in range(count)
+    ]
+
+def _best_total(scores, capacities):
+    """Reference optimum: dense assignment over capacity slots plus one 'unassigned' column per row."""
+    slots = np.repeat(np.arange(scores.shape[1]), capacities)
+    profit = np.hstack([np.where(scores > 0, scores, 0.0)[:, slots], np.zeros((scores.shape[0], scores.shape[0]))])
+    rows, cols = linear_sum_assignment(profit, maximize=True)
+    return profit[rows, cols].sum()
+
+@pytest.mark.parametrize("seed", range(5))
+def test_solve_assignment_is_optimal(seed):
+    rng = np.random.default_rng(seed)
+    dense = np.where(rng.random((12, 5)) < 0.5, rng.random((12, 5)), 0.0)
+    capacities = rng.integers(0, 4, size=5)
+
+    assigned = solve_assignment(sp.csr_matrix(dense), capacities)
+
+    counts = np.bincount(assigned[assigned >= 0], minlength=5)
+    assert np.all(counts <= capacities)
+    assert np.all(dense[np.flatnonzero(assigned >= 0), assigned[assigned >= 0]] > 0)
+    total = dense[np.flatnonzero(assigned >= 0), assigned[assigned >= 0]].sum()
+    assert total == pytest.approx(_best_total(dense, capacities))
+
+def test_assign_mentors_respects_capacity_and_beats_greedy():
+    matching_system = ImprovedMentorMatchingSystem()
+    profiles = _random_profiles(80, seed=3)
+
+    assignments = matching_system.assign_mentors(profiles, capacity=2, candidates=None)
+
+    mentees = [match[1].id for match in assignments]
+    assert len(mentees) == len(set(mentees))
+    assert max(Counter(match[0].id for match in assignments).values()) <= 2
+    for mentor, mentee, score, breakdown in assignments:
+        expected_score, expected_breakdown = matching_system.calculate_match_score(mentor, mentee)
+        assert score == pytest.approx(expected_score, abs=1e-9)
+        assert breakdown == pytest.approx(expected_breakdown, abs=1e-9)
+
+    # Greedy over the ranked matches is feasible, so it can never beat the optimum
+    taken, greedy = Counter(), 0.0
+    for mentor, mentee, score, _ in sorted(matching_system.find_matches(profiles, vectorized=True), key=lambda m: -m[2]):
+        if mentee.id not in taken and taken[mentor.id] < 2:
+            taken[mentee.id] = 1
+            taken[mentor.id] += 1
+            greedy += score
+    assert sum(match[2] for match in assignments) >= greedy - 1e-9
+
+def test_assign_mentors_with_per_mentor_capacity():
+    matching_system = ImprovedMentorMatchingSystem()
+    mentors = [make_profile("busy", 8, domains={"Cloud"}), make_profile("free", 9, domains={"AI"})]
+    mentees = [make_profile(f"e{i}", 1, domains={"Cloud"}) for i in range(3)]
+
+    assignments = matching_system.assign_mentors(mentors + mentees, capacity={"busy": 1, "free": 5}, candidates=2)
+
+    assert Counter(match[0].id for match in assignments) == {"busy": 1, "free": 2}
+
+def test_assign_mentors_leaves_unmatched_mentees_out():
+    matching_system = ImprovedMentorMatchingSystem()
+    profiles = [make_profile("mentor", 8), make_profile("far", 30)]
+    assert matching_system.assign_mentors(profiles) == []
+    with pytest.raises(ValueError):
+        matching_system.assign_mentors(profiles, candidates=0)
@@ -0,0 +1,43 @@
+import numpy as np
+from conftest import make_profile
+from alx_connect.services.candidates import CandidateGenerator
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+
+def _generator(mentors, mentees):
+    matching_system = ImprovedMentorMatchingSystem()
+    mentor_features, mentee_features = matching_system.prepare_features(mentors, mentees)
+    return CandidateGenerator(matching_system, mentor_features), mentee_features
+
+def test_candidates_cover_shared_terms_and_experience_window():
+    mentors = [
+        make_profile("in-window", 8),
+        make_profile("shares-skill", 20, skills={"Python"}),
+        make_profile("shares-domain", 25, domains={"Cloud"}),
+        make_profile("unrelated", 30, skills={"Go"}, domains={"Retail"}),
+    ]
+    mentee = make_profile("mentee", 2, skills={"Python", "SQL"}, domains={"Cloud"})
+    generator, mentee_features = _generator(mentors, [mentee])
+
+    assert generator.candidates(mentee_features, 0).tolist() == [0, 1, 2]
+
+def test_outside_bound_is_semantic_weight_only_with_embeddings():
+    mentors = [make_profile("m", 30, embedding=np.ones(4))]
+    generator, mentee_features = _generator(mentors, [make_profile("e", 1, embedding=np.ones(4)), make_profile("n", 1)])
+
+    assert generator.candidates(mentee_features, 0).tolist() == []
+    assert generator.outside_bound(mentee_features, 0) >= generator.matching_system.semantic_weight
+    assert generator.outside_bound(mentee_features, 1) == 0.0
+
+def test_pruned_scores_never_exceed_bound():
+    rng = np.random.default_rng(0)
+    mentors = [make_profile(f"m{i}", int(rng.integers(5, 30)), embedding=rng.normal(size=6)) for i in range(40)]
+    mentees = [make_profile(f"e{i}", int(rng.integers(0, 5)), embedding=rng.normal(size=6)) for i in range(10)]
+    matching_system = ImprovedMentorMatchingSystem()
+    generator, mentee_features = _generator(mentors, mentees)
+
+    for row, mentee in enumerate(mentees):
+        kept = set(generator.candidates(mentee_features, row).tolist())
+        for col, mentor in enumerate(mentors):
+            if col not in kept:
+                score, _ = matching_system.calculate_match_score(mentor, mentee)
+                assert score <= generator.outside_bound(mentee_features, row)
@@ -0,0 +1,75 @@
+import asyncio
+import pytest
+from alx_connect.services.chat_stream import relay_tokens
+
+async def _tokens(count, produced=None, closed=None, fail_at=None):
+    try:
+        for i in range(count):
+            if i == fail_at:
+                raise RuntimeError("stream broke")
+            if produced is not None:
+                produced.append(i)
+            yield f"t{i} "
+            await asyncio.sleep(0)
+    finally:
+        if closed is not None:
+            closed.append(True)
+
+def test_tokens_are_coalesced_for_a_slow_client():
+    frames = []
+
+    async def slow_send(frame):
+        frames.append(frame)
+        await asyncio.sleep(0.01)
+
+    reply = asyncio.run(relay_tokens(_tokens(20), slow_send, max_buffer=100))
+    tokens = [frame for frame in frames if frame["type"] == "token"]
+    assert reply == "".join(f"t{i} " for i in range(20))
+    assert "".join(frame["content"] for frame in tokens) == reply
+    assert 1 < len(tokens) < 20
+    assert frames[-1] == {"type": "end", "content": reply}
+
+def test_generation_pauses_while_the_client_is_behind():
+    produced = []
+
+    async def main():
+        release = asyncio.Event()
+
+        async def blocked_send(frame):
+            await release.wait()
+
+        relay = asyncio.create_task(relay_tokens(_tokens(50, produced), blocked_send, max_buffer=3))
+        await asyncio.sleep(0.05)
+        # One token in the frame being sent, three queued, one waiting for space
+        assert len(produced) <= 5
+        release.set()
+        return await relay
+
+    assert len(asyncio.run(main()).split()) == 50
+    assert len(produced) == 50
+
+def test_cancelling_the_relay_closes_the_generator():
+    closed = []
+
+    async def main():
+        async def send(frame):
+            await asyncio.sleep(1)
+
+        relay = asyncio.create_task(relay_tokens(_tokens(50, closed=closed), send, max_buffer=2))
+        await asyncio.sleep(0.02)
+        relay.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await relay
+
+    asyncio.run(main())
+    assert closed == [True]
+
+def test_generator_errors_are_sent_and_raised():
+    frames = []
+
+    async def send(frame):
+        frames.append(frame)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(relay_tokens(_tokens(5, fail_at=3), send))
+    assert frames[-1] == {"type": "error", "detail": "stream broke"}
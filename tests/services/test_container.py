@@ -0,0 +1,63 @@
+import asyncio
+import threading
+import time
+import pytest
+from alx_connect.services.container import ServiceContainer
+
+def test_services_are_built_once_on_first_use():
+    container = ServiceContainer()
+    built = []
+    container.register("model", lambda c: built.append("model") or object())
+    container.register("coach", lambda c: {"model": c.get("model")})
+    assert container.status()["model"]["state"] == "pending"
+
+    coach = container.get("coach")
+    assert container.get("coach") is coach
+    assert coach["model"] is container.get("model")
+    assert built == ["model"]
+    assert container.is_ready(["model", "coach"])
+    with pytest.raises(ValueError):
+        container.register("model", lambda c: None)
+
+def test_concurrent_callers_share_one_build():
+    container = ServiceContainer()
+    calls = []
+
+    def slow(c):
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    container.register("model", slow)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(container.get("model"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len({id(result) for result in results}) == 1
+
+def test_failed_build_is_recorded_and_retried():
+    container = ServiceContainer()
+    attempts = []
+
+    def flaky(c):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("model download failed")
+        return "model"
+
+    container.register("model", flaky)
+    container.register("other", lambda c: "other")
+    # Warm-up records the failure and carries on with the next service
+    asyncio.run(container.warm_up(["model", "other"]))
+    status = container.status()
+    assert status["model"]["state"] == "failed"
+    assert "model download failed" in status["model"]["error"]
+    assert status["other"]["state"] == "ready"
+    assert not container.is_ready(["model", "other"])
+
+    assert asyncio.run(container.aget("model")) == "model"
+    assert container.status()["model"]["error"] is None
+    assert container.is_ready(["model", "other"])
@@ -0,0 +1,163 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from alx_connect.models.chat import ChatRecord, ConversationState, Message, MessageRole
+from alx_connect.services.conversation_store import (
+    ConversationStore, InMemoryConversationStore, SQLiteConversationStore, sweep_periodically
+)
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def _message(text, role=MessageRole.USER):
+    return ChatRecord.create(role, text)
+
+def test_messages_are_kept_in_a_ring_buffer():
+    store = InMemoryConversationStore(max_conversations=10, max_messages=3, ttl=60)
+    for i in range(5):
+        store.append("c1", _message(f"m{i}"))
+    assert [m.content for m in store.recent("c1")] == ["m2", "m3", "m4"]
+    assert [m.content for m in store.recent("c1", 2)] == ["m3", "m4"]
+    assert store.recent("missing") == []
+
+def test_least_recently_active_conversation_is_evicted():
+    clock = Clock()
+    store = InMemoryConversationStore(max_conversations=2, max_messages=3, ttl=60, clock=clock)
+    store.append("a", _message("hi"))
+    store.append("b", _message("hi"))
+    store.append("a", _message("again"))
+    store.append("c", _message("hi"))
+    assert "b" not in store
+    assert "a" in store and "c" in store
+    assert store.stats() == {"conversations": 2, "evicted": 1, "expired": 0}
+
+def test_sweep_drops_inactive_conversations():
+    clock = Clock()
+    store = InMemoryConversationStore(max_conversations=10, max_messages=3, ttl=60, clock=clock)
+    store.append("old", _message("hi"))
+    clock.now = 50.0
+    store.append("new", _message("hi"))
+    clock.now = 100.0
+    assert store.sweep() == ["old"]
+    assert len(store) == 1
+
+    # Imported states keep their idle time
+    store["imported"] = ConversationState(messages=[Message(role=MessageRole.USER, content="hello")], last_activity=datetime.now() - timedelta(hours=2))
+    assert [m.content for m in store["imported"].messages] == ["hello"]
+    assert store.sweep() == ["imported"]
+
+def test_render_lists_the_recent_messages():
+    store = InMemoryConversationStore(max_conversations=10, max_messages=3, ttl=60)
+    assert store.render("c1") == ""
+    store.append_many("c1", [_message("q1"), _message("a1", MessageRole.ASSISTANT)])
+    assert store.render("c1", 5) == "user: q1\nassistant: a1"
+    assert store.render("c1", 1) == "assistant: a1"
+
+    store.append_many("c1", [_message("q2"), _message("a2", MessageRole.ASSISTANT)])
+    assert store.render("c1") == "assistant: a1\nuser: q2\nassistant: a2"
+
+def test_states_are_pydantic_at_the_boundary():
+    store = InMemoryConversationStore(max_conversations=10, max_messages=3, ttl=60)
+    store.append("c1", _message("  hi  "))
+    message = store["c1"].messages[0]
+    assert isinstance(message, Message)
+    assert message.role == MessageRole.USER and message.content == "hi"
+    assert abs((datetime.now() - message.timestamp).total_seconds()) < 5
+
+def test_sweeper_runs_periodically():
+    calls = []
+
+    async def main():
+        sweeper = asyncio.create_task(sweep_periodically(lambda: calls.append(1), interval=0.01))
+        await asyncio.sleep(0.055)
+        sweeper.cancel()
+
+    asyncio.run(main())
+    assert 3 <= len(calls) <= 6
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "conversations.sqlite3")
+    worker_a = SQLiteConversationStore(path, max_conversations=10, max_messages=3, ttl=60)
+    worker_b = SQLiteConversationStore(path, max_conversations=10, max_messages=3, ttl=60)
+    worker_a.append_many("c1", [_message("q1"), _message("a1", MessageRole.ASSISTANT)])
+    worker_b.append_many("c1", [_message("q2"), _message("a2", MessageRole.ASSISTANT)])
+
+    # Trimmed to the last max_messages, in order, whichever worker wrote them
+    recent = worker_a.recent("c1")
+    assert [m.content for m in recent] == ["a1", "q2", "a2"]
+    assert [m.role for m in recent] == [MessageRole.ASSISTANT, MessageRole.USER, MessageRole.ASSISTANT]
+    assert [m.content for m in worker_b.recent("c1", 2)] == ["q2", "a2"]
+    assert "c1" in worker_b and len(worker_b) == 1
+    assert [m.content for m in worker_b["c1"].messages] == ["a1", "q2", "a2"]
+
+    del worker_b["c1"]
+    assert "c1" not in worker_a and worker_a.recent("c1") == []
+    worker_a.close()
+    worker_b.close()
+
+def test_sqlite_sweep_expires_and_caps_conversations(tmp_path):
+    clock = Clock()
+    store = SQLiteConversationStore(str(tmp_path / "c.sqlite3"), max_conversations=2, max_messages=3, ttl=120, clock=clock)
+    for i, conversation_id in enumerate(["old", "a", "b", "c"]):
+        clock.now = 50.0 * i
+        store.append(conversation_id, _message("hi"))
+    clock.now = 150.0
+    assert store.sweep() == ["old", "a"]
+    assert len(store) == 2
+    assert store.stats() == {"conversations": 2, "evicted": 1, "expired": 1}
+    store.close()
+
+def test_sqlite_appends_from_threads_are_all_kept(tmp_path):
+    import threading
+    store = SQLiteConversationStore(str(tmp_path / "c.sqlite3"), max_conversations=100, max_messages=1000, ttl=60)
+
+    def chat(conversation_id):
+        for turn in range(20):
+            store.append_many(conversation_id, [_message(f"q{turn}"), _message(f"a{turn}", MessageRole.ASSISTANT)])
+
+    threads = [threading.Thread(target=chat, args=(f"c{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for i in range(4):
+        contents = [m.content for m in store.recent(f"c{i}", 1000)]
+        assert contents == [f"{kind}{turn}" for turn in range(20) for kind in "qa"]
+    store.close()
+
+def test_sqlite_failed_group_commit_raises_in_every_grouped_thread(tmp_path, monkeypatch):
+    import sqlite3
+    import threading
+    import time
+    store = SQLiteConversationStore(str(tmp_path / "c.sqlite3"), max_conversations=100, max_messages=10, ttl=60)
+    errors = {}
+
+    def chat(conversation_id):
+        try:
+            store.append_many(conversation_id, [_message("q")])
+        except sqlite3.OperationalError as error:
+            errors[conversation_id] = error
+
+    def fail(pending):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    # Queue both appends behind a held write lock, so one commit groups them
+    with store._write_lock:
+        threads = [threading.Thread(target=chat, args=(f"c{i}",)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        while len(store._pending) < 2:
+            time.sleep(0.001)
+        monkeypatch.setattr(store, "_write", fail)
+    for thread in threads:
+        thread.join()
+    assert sorted(errors) == ["c0", "c1"]
+    store.close()
+
+def test_store_interface_is_abstract():
+    with pytest.raises(TypeError):
+        ConversationStore()
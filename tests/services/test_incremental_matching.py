@@ -0,0 +1,84 @@
+import pytest
+import numpy as np
+from conftest import make_profile
+from alx_connect.services.incremental_matching import IncrementalMatcher
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+
+SKILLS = ["Python", "Java", "Docker", "SQL", "React", "Go"]
+DOMAINS = ["Software", "Cloud", "AI", "Web"]
+
+def _random_profile(rng, profile_id):
+    return make_profile(
+        profile_id,
+        int(rng.integers(0, 14)),
+        rng.choice(SKILLS, size=rng.integers(0, 3), replace=False).tolist(),
+        rng.choice(DOMAINS, size=rng.integers(0, 2), replace=False).tolist(),
+        # Few distinct one-hot embeddings make exact score ties common and
+        # keep cosine similarities exact, so tie order does not hinge on rounding
+        None if rng.random() < 0.2 else np.eye(4)[rng.integers(0, 4)]
+    )
+
+def _rebuild(profiles, top_k):
+    return ImprovedMentorMatchingSystem().find_matches(profiles, top_k=top_k, vectorized=True)
+
+def _assert_same(expected, actual):
+    assert [(m[0].id, m[1].id) for m in expected] == [(m[0].id, m[1].id) for m in actual]
+    assert [m[2] for m in expected] == pytest.approx([m[2] for m in actual], abs=1e-12)
+    assert [m[3] for m in expected] == [pytest.approx(m[3], abs=1e-12) for m in actual]
+
+@pytest.mark.parametrize("seed", range(12))
+@pytest.mark.parametrize("slack", [0, 2])
+@pytest.mark.parametrize("top_k", [1, 3])
+def test_updates_agree_with_full_rebuild(seed, slack, top_k):
+    rng = np.random.default_rng(seed)
+    profiles = {f"p{i}": _random_profile(rng, f"p{i}") for i in range(25)}
+    matcher = IncrementalMatcher.from_profiles(profiles.values(), top_k=top_k, slack=slack)
+    _assert_same(_rebuild(list(profiles.values()), top_k), matcher.all_matches())
+
+    next_id = len(profiles)
+    for _ in range(60):
+        action = rng.choice(["insert", "update", "remove"])
+        if action == "insert" or not profiles:
+            profile = _random_profile(rng, f"p{next_id}")
+            next_id += 1
+            profiles[profile.id] = profile
+            matcher.upsert(profile)
+        elif action == "update":
+            profile_id = rng.choice(list(profiles))
+            # May move the profile between the mentor and mentee sides
+            profiles[profile_id] = _random_profile(rng, profile_id)
+            matcher.upsert(profiles[profile_id])
+        else:
+            profile_id = rng.choice(list(profiles))
+            del profiles[profile_id]
+            matcher.remove(profile_id)
+
+        _assert_same(_rebuild(list(profiles.values()), top_k), matcher.all_matches())
+
+def test_matches_for_single_mentee():
+    rng = np.random.default_rng(0)
+    mentee = _random_profile(rng, "mentee").copy(cumulative_year=1, industry_domains={"Cloud"})
+    mentor = _random_profile(rng, "mentor").copy(cumulative_year=8, industry_domains={"Cloud"})
+    matcher = IncrementalMatcher(top_k=2)
+    matcher.upsert(mentee)
+    assert matcher.matches("mentee") == []
+
+    matcher.upsert(mentor)
+    [(matched_mentor, matched_mentee, score, breakdown)] = matcher.matches("mentee")
+    assert (matched_mentor.id, matched_mentee.id) == ("mentor", "mentee")
+    assert breakdown["domain_score"] == 1.0
+
+    matcher.remove("mentor")
+    assert matcher.matches("mentee") == []
+    assert "mentor" not in matcher
+
+def test_compaction_keeps_rankings():
+    rng = np.random.default_rng(1)
+    profiles = {f"p{i}": _random_profile(rng, f"p{i}") for i in range(20)}
+    matcher = IncrementalMatcher.from_profiles(profiles.values(), top_k=2, slack=1)
+    for _ in range(3000):
+        profile_id = f"p{rng.integers(0, 20)}"
+        profiles[profile_id] = _random_profile(rng, profile_id)
+        matcher.upsert(profiles[profile_id])
+    assert matcher.mentors.size + matcher.mentees.size < 3000
+    _assert_same(_rebuild(list(profiles.values()), 2), matcher.all_matches())
@@ -90,4 +90,121 @@ def test_clean_inactive_conversations(interview_coach):
     
     # Verify results
     assert active_id in interview_coach.conversations
-    assert inactive_id not in interview_coach.conversations 
\ No newline at end of file
+    assert inactive_id not in interview_coach.conversations 
+
+@pytest.fixture
+def offline_coach(tmp_path, monkeypatch):
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from langchain_core.language_models import FakeListChatModel
+    from alx_connect.config.config import KNOWLEDGE_BASE_CONFIG
+    monkeypatch.setitem(KNOWLEDGE_BASE_CONFIG, "path", str(tmp_path / "kb"))
+    monkeypatch.setitem(KNOWLEDGE_BASE_CONFIG, "refresh_interval", 0)
+    return InterviewCoach(llm=FakeListChatModel(responses=["Practice out loud."]), embeddings=DeterministicFakeEmbedding(size=16))
+
+def test_vectorstore_is_kept_until_the_knowledge_base_changes(offline_coach, tmp_path):
+    from alx_connect.services.knowledge_base import KnowledgeBaseIndexer
+    vectorstore = offline_coach.get_vectorstore()
+    assert offline_coach.get_vectorstore() is vectorstore
+
+    csv_path = tmp_path / "qa.csv"
+    csv_path.write_text("question,answer,category,difficulty\nWhat is REST?,An architectural style.,APIs,Easy\n")
+    KnowledgeBaseIndexer(offline_coach.embeddings, str(tmp_path / "kb")).index([str(csv_path)])
+
+    swapped = offline_coach.get_vectorstore()
+    assert swapped is not vectorstore
+    assert swapped.knowledge_base_version == "v000001"
+    assert offline_coach.get_vectorstore() is swapped
+
+def test_stage_timer_splits_retrieval_and_llm(offline_coach):
+    import asyncio
+    from alx_connect.services.request_metrics import StageTimer
+    timer = StageTimer()
+    answer, _ = asyncio.run(offline_coach.answer_question("How do I prepare?", timer))
+
+    assert answer == "Practice out loud."
+    timings = timer.timings()
+    assert {"embedding", "retrieval", "llm", "total"} <= timings.keys()
+    assert timings["total"] >= timings["retrieval"] + timings["llm"]
+    assert "retrieval;dur=" in timer.server_timing()
+
+def test_repeated_question_is_answered_from_the_cache(offline_coach):
+    import asyncio
+    offline_coach.llm.responses = ["Talk about your projects.", "Something else."]
+
+    answer, cached = asyncio.run(offline_coach.answer_question("Tell me about yourself"))
+    assert (answer, cached) == ("Talk about your projects.", False)
+    answer, cached = asyncio.run(offline_coach.answer_question("Tell me about yourself"))
+    assert (answer, cached) == ("Talk about your projects.", True)
+    assert offline_coach.answer_cache.stats()["hits"] == 1
+
+def test_generate_response_streams_and_records_the_reply(offline_coach):
+    import asyncio
+    from alx_connect.services.request_metrics import StageTimer
+    offline_coach.llm.responses = ["Use the STAR method."]
+    timer = StageTimer()
+
+    async def collect():
+        return [token async for token in offline_coach.generate_response("How do I answer behavioral questions?", "chat1", timer)]
+
+    tokens = asyncio.run(collect())
+    assert len(tokens) > 1
+    assert "".join(tokens) == "Use the STAR method."
+    messages = offline_coach.conversations["chat1"].messages
+    assert [m.role for m in messages] == [MessageRole.USER, MessageRole.ASSISTANT]
+    assert messages[1].content == "Use the STAR method."
+    assert timer.timings()["first_token"] <= timer.timings()["total"]
+
+def test_fit_to_budget_keeps_leading_texts():
+    from alx_connect.services.interview_coach import fit_to_budget
+    # 5 tokens are about 20 characters
+    assert fit_to_budget(["a" * 8, "b" * 8, "c" * 8], 5) == ["a" * 8, "b" * 8]
+    assert fit_to_budget(["x" * 50, "y"], 5) == ["x" * 20]
+    assert fit_to_budget([], 5) == []
+
+class RecordingEmbeddings:
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+        self.queries = []
+
+    async def aembed_query(self, text):
+        self.queries.append(text)
+        return await self.embeddings.aembed_query(text)
+
+def test_follow_up_questions_are_retrieved_and_answered_in_context(offline_coach, monkeypatch):
+    import asyncio
+    from alx_connect.services.request_metrics import StageTimer
+    embeddings = RecordingEmbeddings(offline_coach.embeddings)
+    monkeypatch.setattr(offline_coach, "embeddings", embeddings)
+    offline_coach.record_turn("c1", "How do I negotiate salary?", "Research the market rate.")
+
+    reads = []
+    recent = offline_coach.conversations.recent
+    monkeypatch.setattr(offline_coach.conversations, "recent", lambda *args: reads.append(args) or recent(*args))
+    monkeypatch.setattr(offline_coach.conversations, "render", None)
+
+    timer = StageTimer()
+    _, _, messages = asyncio.run(offline_coach.prepare_prompt("And for a first job?", "c1", timer))
+    assert len(reads) == 1
+    assert embeddings.queries == ["And for a first job?\nHow do I negotiate salary?"]
+    assert messages[0].content.endswith(
+        "Conversation so far:\nuser: How do I negotiate salary?\nassistant: Research the market rate."
+    )
+    assert messages[1].content == "And for a first job?"
+    assert "history" in timer.timings()
+
+    # The same words outside the conversation are a different question
+    offline_coach.llm.responses = ["Ask about growth.", "Say what you are looking for."]
+    timer = StageTimer()
+    assert asyncio.run(offline_coach.answer_question("And for a first job?", timer, conversation_id="c1")) == ("Ask about growth.", False)
+    assert "llm" in timer.timings()
+    assert asyncio.run(offline_coach.answer_question("And for a first job?")) == ("Say what you are looking for.", False)
+    assert asyncio.run(offline_coach.answer_question("And for a first job?", conversation_id="c1")) == ("Ask about growth.", True)
+
+def test_prompt_history_keeps_the_newest_messages_within_budget(offline_coach, monkeypatch):
+    from alx_connect.config.config import INTERVIEW_COACH_CONFIG
+    monkeypatch.setitem(INTERVIEW_COACH_CONFIG, "history_token_budget", 10)
+    offline_coach.record_turn("c1", "Old question", "An old and rather long answer about something else")
+    offline_coach.record_turn("c1", "New question", "Short")
+
+    history = offline_coach.get_prompt_history(offline_coach.conversations.recent("c1"))
+    assert history == "user: New question\nassistant: Short"
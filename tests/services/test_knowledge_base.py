@@ -0,0 +1,67 @@
+import csv
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding, FakeEmbeddings
+from alx_connect.services.knowledge_base import KnowledgeBaseIndexer, iter_csv_batches, load_knowledge_base
+from alx_connect.models.snapshot import list_versions
+
+QUESTIONS = [
+    ("What is a load balancer?", "It spreads requests across servers.", "System Design", "Easy"),
+    ("Explain database sharding.", "Splitting data across databases by key.", "System Design", "Medium"),
+    ("What is a closure?", "A function capturing variables from its scope.", "Python", "Easy"),
+]
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Question", "Answer", "Category", "Difficulty"])
+        writer.writerows(rows)
+    return str(path)
+
+@pytest.fixture
+def embeddings():
+    return DeterministicFakeEmbedding(size=16)
+
+def test_csv_rows_are_streamed_in_batches(tmp_path):
+    path = _write_csv(tmp_path / "qa.csv", QUESTIONS + [("", "no question", "", "")])
+    batches = list(iter_csv_batches([path], batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[0][0]["question"] == "What is a load balancer?"
+    assert batches[1][0]["source"] == "qa.csv" and batches[1][0]["row"] == 3
+
+def test_index_is_published_and_loaded(tmp_path, embeddings):
+    root = str(tmp_path / "kb")
+    assert load_knowledge_base(embeddings, root) is None
+
+    indexer = KnowledgeBaseIndexer(embeddings, root, batch_size=2, embedding_batch_size=1)
+    result = indexer.index([_write_csv(tmp_path / "qa.csv", QUESTIONS)])
+    assert result == {"version": "v000001", "added": 3, "skipped": 0, "documents": 3}
+
+    vectorstore = load_knowledge_base(embeddings, root)
+    assert vectorstore.knowledge_base_version == "v000001"
+    assert vectorstore.index.ntotal == 3
+    query = indexer.documents([dict(zip(("question", "answer", "category", "difficulty"), QUESTIONS[1]))])[0].page_content
+    document = vectorstore.similarity_search(query, k=1)[0]
+    assert "database sharding" in document.page_content
+    assert document.metadata == {"category": "System Design", "difficulty": "Medium", "source": "qa.csv", "row": 2}
+
+def test_append_embeds_only_new_questions(tmp_path, embeddings):
+    root = str(tmp_path / "kb")
+    indexer = KnowledgeBaseIndexer(embeddings, root)
+    indexer.index([_write_csv(tmp_path / "first.csv", QUESTIONS[:2])])
+
+    new = ("What is a generator?", "A function that yields values lazily.", "Python", "Medium")
+    result = indexer.index([_write_csv(tmp_path / "second.csv", QUESTIONS[1:] + [new])], append=True)
+    assert result == {"version": "v000002", "added": 2, "skipped": 1, "documents": 4}
+    assert load_knowledge_base(embeddings, root).index.ntotal == 4
+
+    # Nothing new: no version is published
+    assert indexer.index([str(tmp_path / "second.csv")], append=True)["added"] == 0
+    indexer.index([str(tmp_path / "first.csv")])
+    assert list_versions(root) == ["v000002", "v000003"]
+    assert load_knowledge_base(embeddings, root).index.ntotal == 2
+
+def test_other_embedding_model_is_rejected(tmp_path, embeddings):
+    root = str(tmp_path / "kb")
+    KnowledgeBaseIndexer(embeddings, root).index([_write_csv(tmp_path / "qa.csv", QUESTIONS)])
+    with pytest.raises(ValueError):
+        load_knowledge_base(FakeEmbeddings(size=16), root)
@@ -0,0 +1,50 @@
+import json
+import numpy as np
+from conftest import make_profile
+from alx_connect.services.match_stream import iter_ndjson_matches
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+
+def _profiles(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        make_profile(f"p{i}", int(rng.integers(0, 14)), domains={"Cloud"} if i % 2 else {"AI"},
+                     embedding=rng.normal(size=8))
+        for i in range(count)
+    ]
+
+def test_ndjson_lines_follow_ranked_matches():
+    matching_system = ImprovedMentorMatchingSystem()
+    profiles = _profiles(50)
+
+    lines = list(iter_ndjson_matches(matching_system, profiles, top_k=3, chunk_size=4))
+
+    expected = list(matching_system.iter_mentee_matches(profiles, top_k=3, vectorized=True))
+    assert all(line.endswith(b"\n") for line in lines)
+    records = [json.loads(line) for line in lines]
+    assert [record["mentee_id"] for record in records] == [mentee.id for mentee, _ in expected]
+    for record, (_, matches) in zip(records, expected):
+        assert [(m["mentor_id"], m["score"]) for m in record["matches"]] == [(m[0].id, m[2]) for m in matches]
+
+def test_ndjson_is_produced_lazily():
+    lines = iter_ndjson_matches(ImprovedMentorMatchingSystem(), _profiles(30), top_k=2, chunk_size=1)
+    first = json.loads(next(lines))
+    assert set(first) == {"mentee_id", "matches"}
+
+def test_prepare_runs_on_mentors_then_each_mentee_block():
+    matching_system = ImprovedMentorMatchingSystem()
+    profiles = _profiles(50)
+    prepared = []
+
+    def prepare(block):
+        prepared.append([p.id for p in block])
+        return block
+
+    lines = iter_ndjson_matches(matching_system, profiles, top_k=3, chunk_size=4, prepare=prepare)
+    first = next(lines)
+    mentors = [p.id for p in profiles if matching_system.is_mentor(p)]
+    mentees = [p.id for p in profiles if not matching_system.is_mentor(p)]
+    # The first line needs only the mentors and the first block of mentees
+    assert prepared == [mentors, mentees[:4]]
+
+    assert [first, *lines] == list(iter_ndjson_matches(matching_system, profiles, top_k=3, chunk_size=4))
+    assert prepared[1:] == [mentees[start:start + 4] for start in range(0, len(mentees), 4)]
@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from conftest import make_profile
 from alx_connect.services.matching import ImprovedMentorMatchingSystem
 
 def test_calculate_domain_similarity():
@@ -87,4 +88,97 @@ def test_find_matches(sample_profile):
         assert mentor.cumulative_year >= 5
         assert mentee.cumulative_year < 5
         assert 0 <= score <= 1
-        assert isinstance(breakdown, dict) 
\ No newline at end of file
+        assert isinstance(breakdown, dict) 
+
+def _random_profiles(count, seed=0, dim=16):
+    rng = np.random.default_rng(seed)
+    domains = ["Software", "Cloud", "AI", "Web", "Data", "Security"]
+    skills = ["Python", "Java", "Docker", "SQL", "React", "Go", "AWS", "Rust"]
+    profiles = []
+    for i in range(count):
+        profiles.append(make_profile(
+            f"p{i}",
+            int(rng.integers(0, 16)),
+            rng.choice(skills, size=rng.integers(0, 4), replace=False),
+            rng.choice(domains, size=rng.integers(0, 3), replace=False),
+            None if i % 7 == 0 else rng.normal(size=dim),
+            full_name=f"Person {i}"
+        ))
+    return profiles
+
+def _assert_same_matches(expected, actual):
+    assert len(expected) == len(actual)
+    for (e_mentor, e_mentee, e_score, e_breakdown), (a_mentor, a_mentee, a_score, a_breakdown) in zip(expected, actual):
+        assert e_mentor.id == a_mentor.id
+        assert e_mentee.id == a_mentee.id
+        assert a_score == pytest.approx(e_score, abs=1e-12)
+        assert a_breakdown.keys() == e_breakdown.keys()
+        for key in e_breakdown:
+            assert a_breakdown[key] == pytest.approx(e_breakdown[key], abs=1e-12)
+
+def test_find_matches_vectorized_matches_pairwise():
+    matching_system = ImprovedMentorMatchingSystem()
+    profiles = _random_profiles(120)
+
+    expected = matching_system.find_matches(profiles)
+    for chunk_size in (1, 7, 1024):
+        actual = matching_system.find_matches(profiles, vectorized=True, chunk_size=chunk_size)
+        _assert_same_matches(expected, actual)
+
+def test_find_matches_vectorized_without_embeddings():
+    matching_system = ImprovedMentorMatchingSystem()
+    profiles = [p.copy(semantic_embedding=None) for p in _random_profiles(30, seed=1)]
+
+    _assert_same_matches(
+        matching_system.find_matches(profiles),
+        matching_system.find_matches(profiles, vectorized=True)
+    )
+
+def test_find_matches_top_k_truncates_full_ranking():
+    matching_system = ImprovedMentorMatchingSystem()
+    profiles = _random_profiles(120, seed=2)
+    # Coarse embeddings force ties so the K boundary has to respect mentor order
+    for profile in profiles:
+        if profile.semantic_embedding is not None:
+            profile.semantic_embedding = np.sign(profile.semantic_embedding[:2])
+
+    full = matching_system.find_matches(profiles)
+    for top_k in (1, 3, 10):
+        expected = []
+        for mentee_id in dict.fromkeys(m[1].id for m in full):
+            expected.extend([m for m in full if m[1].id == mentee_id][:top_k])
+        _assert_same_matches(expected, matching_system.find_matches(profiles, top_k=top_k))
+        _assert_same_matches(expected, matching_system.find_matches(profiles, top_k=top_k, vectorized=True, chunk_size=16))
+
+def test_find_matches_rejects_invalid_top_k():
+    matching_system = ImprovedMentorMatchingSystem()
+    with pytest.raises(ValueError):
+        matching_system.find_matches(_random_profiles(10), top_k=0)
+
+def test_find_matches_pruned_matches_exhaustive():
+    matching_system = ImprovedMentorMatchingSystem()
+    profiles = _random_profiles(150, seed=4)
+
+    expected = matching_system.find_matches(profiles, vectorized=True)
+    _assert_same_matches(expected, matching_system.find_matches(profiles, prune=True, chunk_size=32))
+    for top_k in (1, 5):
+        expected = matching_system.find_matches(profiles, top_k=top_k, vectorized=True)
+        _assert_same_matches(expected, matching_system.find_matches(profiles, top_k=top_k, prune=True))
+
+def test_find_matches_min_score():
+    matching_system = ImprovedMentorMatchingSystem()
+    profiles = _random_profiles(60, seed=5)
+
+    matches = matching_system.find_matches(profiles, min_score=0.3)
+    assert matches
+    assert all(score > 0.3 for _, _, score, _ in matches)
+    _assert_same_matches(matches, matching_system.find_matches(profiles, min_score=0.3, prune=True))
+
+def test_find_matches_parallel_matches_serial():
+    matching_system = ImprovedMentorMatchingSystem()
+    profiles = _random_profiles(150, seed=6)
+
+    for top_k in (None, 3):
+        expected = matching_system.find_matches(profiles, top_k=top_k, vectorized=True, chunk_size=16)
+        actual = matching_system.find_matches(profiles, top_k=top_k, chunk_size=16, workers=2)
+        assert [(m[0].id, m[1].id, m[2], m[3]) for m in expected] == [(m[0].id, m[1].id, m[2], m[3]) for m in actual]
@@ -0,0 +1,115 @@
+import threading
+import time
+import pytest
+import numpy as np
+from conftest import make_profile
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+from alx_connect.services.matching_jobs import JobStatus, MatchingJob, MatchingJobManager, match_to_dict
+
+def _profiles(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        make_profile(f"p{i}", int(rng.integers(0, 14)), domains={"Cloud"} if i % 2 else {"AI"},
+                     embedding=rng.normal(size=8))
+        for i in range(count)
+    ]
+
+def _wait(manager, job_id, timeout=10.0):
+    deadline = time.time() + timeout
+    while manager.get(job_id).status not in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
+        assert time.time() < deadline
+        time.sleep(0.01)
+    return manager.get(job_id)
+
+@pytest.fixture
+def manager():
+    manager = MatchingJobManager(workers=1)
+    yield manager
+    manager.shutdown()
+
+def test_job_results_match_synchronous_matching(manager):
+    profiles = _profiles(60)
+    job = manager.submit(profiles, top_k=3)
+    job = _wait(manager, job.id)
+
+    expected = [match_to_dict(match) for match in ImprovedMentorMatchingSystem().find_matches(profiles, top_k=3, vectorized=True)]
+    assert job.status == JobStatus.COMPLETED
+    assert job.mentees_done == job.mentees_total == sum(1 for p in profiles if p.cumulative_year < 5)
+
+    pages, offset = [], 0
+    while offset is not None:
+        page = manager.results_page(job.id, offset, limit=7)
+        pages.extend(page["matches"])
+        offset = page["next_offset"]
+    assert pages == expected
+
+def test_small_jobs_are_scored_without_a_process_pool(manager, monkeypatch):
+    from alx_connect.services import matching
+
+    def no_pool(*args):
+        raise AssertionError("a one-block cohort should not start worker processes")
+
+    monkeypatch.setattr(matching, "iter_matches_parallel", no_pool)
+    job = _wait(manager, manager.submit(_profiles(10), top_k=3).id)
+    assert job.status == JobStatus.COMPLETED
+
+def test_cancel_stops_a_running_job(manager):
+    release = threading.Event()
+    # Occupy the only worker so the next job stays queued
+    manager.executor.submit(release.wait)
+    job = manager.submit(_profiles(20))
+    assert manager.get(job.id).status == JobStatus.QUEUED
+
+    manager.cancel(job.id)
+    release.set()
+    job = _wait(manager, job.id)
+    assert job.status == JobStatus.CANCELLED
+    assert job.results == []
+
+def test_unknown_job_and_job_limit():
+    manager = MatchingJobManager(workers=1, max_jobs=1)
+    try:
+        assert manager.get("missing") is None
+        assert manager.results_page("missing") is None
+        assert manager.cancel("missing") is None
+        manager.submit(_profiles(4))
+        with pytest.raises(RuntimeError):
+            manager.submit(_profiles(4))
+        with pytest.raises(ValueError):
+            manager.submit(_profiles(4), top_k=0)
+    finally:
+        manager.shutdown()
+
+def test_expired_jobs_are_evicted_but_unfinished_ones_kept():
+    manager = MatchingJobManager(workers=1, job_ttl=60)
+    try:
+        finished = MatchingJob([], {})
+        finished.status, finished.finished_at = JobStatus.COMPLETED, time.time() - 120
+        finishing = MatchingJob([], {})
+        # Status already final, finished_at not set yet
+        finishing.status = JobStatus.COMPLETED
+        manager.jobs = {finished.id: finished, finishing.id: finishing}
+        manager._evict_expired()
+        assert list(manager.jobs) == [finishing.id]
+    finally:
+        manager.shutdown()
+
+def test_job_cancelled_while_queued_never_runs(manager):
+    job = MatchingJob(_profiles(20), {"top_k": 3, "min_score": 0.0, "prune": False})
+    manager.jobs[job.id] = job
+    manager.cancel(job.id)
+    manager._run(job)
+    assert job.status == JobStatus.CANCELLED
+    assert job.started_at is None and job.results == []
+
+def test_profiles_are_prepared_inside_the_job(manager):
+    prepared = []
+
+    def prepare(profiles):
+        prepared.append(len(profiles))
+        return profiles[:10]
+
+    job = _wait(manager, manager.submit(_profiles(40), top_k=3, prepare=prepare).id)
+    assert prepared == [40]
+    assert job.status == JobStatus.COMPLETED
+    assert {match["mentee_id"] for match in job.results} <= {f"p{i}" for i in range(10)}
@@ -0,0 +1,74 @@
+import pytest
+import numpy as np
+from conftest import make_profile
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+from alx_connect.services.mentor_index import MentorIndex
+
+def _profile(profile_id, embedding, years=8):
+    embedding = None if embedding is None else np.array(embedding, dtype=np.float64)
+    return make_profile(profile_id, years, domains={"Software"}, embedding=embedding)
+
+@pytest.fixture
+def mentors():
+    return [
+        _profile("m0", [1.0, 0.0, 0.0]),
+        _profile("m1", [0.0, 1.0, 0.0]),
+        _profile("m2", [0.0, 0.0, 1.0]),
+        _profile("m3", None)
+    ]
+
+def test_search_returns_nearest_mentors(mentors):
+    index = MentorIndex.from_profiles(mentors)
+    assert len(index) == 4
+    assert index.unindexed_ids() == ["m3"]
+
+    results = index.search(np.array([[0.0, 2.0, 0.1], [0.9, 0.0, 0.0]]), 1)
+    assert results == [["m1"], ["m0"]]
+
+def test_add_replaces_and_remove_deletes(mentors):
+    index = MentorIndex.from_profiles(mentors)
+
+    index.add([_profile("m0", [0.0, 1.0, 0.0])])
+    assert len(index) == 4
+    assert set(index.search(np.array([0.0, 1.0, 0.0]), 2)[0]) == {"m0", "m1"}
+
+    index.remove(["m1", "m3"])
+    assert "m1" not in index
+    assert "m3" not in index
+    assert index.search(np.array([0.0, 1.0, 0.0]), 5) == [["m0", "m2"]]
+
+def test_save_and_load_round_trip(mentors, tmp_path):
+    index = MentorIndex.from_profiles(mentors)
+    index.save(str(tmp_path))
+
+    loaded = MentorIndex.load(str(tmp_path))
+    assert len(loaded) == len(index)
+    assert loaded.search(np.array([0.0, 0.0, 1.0]), 1) == [["m2"]]
+    loaded.add([_profile("m4", [0.0, 0.0, 1.0])])
+    assert set(loaded.search(np.array([0.0, 0.0, 1.0]), 2)[0]) == {"m2", "m4"}
+
+def test_rejects_wrong_dimension(mentors):
+    index = MentorIndex.from_profiles(mentors)
+    with pytest.raises(ValueError):
+        index.search(np.ones(5), 1)
+
+def test_find_matches_with_index_equals_exact_when_all_candidates_retrieved():
+    rng = np.random.default_rng(3)
+    profiles = [
+        _profile(f"p{i}", None if i % 9 == 0 else rng.normal(size=8), years=int(rng.integers(0, 15)))
+        for i in range(80)
+    ]
+    matching_system = ImprovedMentorMatchingSystem()
+    index = MentorIndex.from_profiles([p for p in profiles if p.cumulative_year >= 5])
+
+    exact = matching_system.find_matches(profiles, top_k=5, vectorized=True)
+    approximate = matching_system.find_matches(profiles, top_k=5, mentor_index=index, index_candidates=len(profiles))
+    assert [(m[0].id, m[1].id) for m in exact] == [(m[0].id, m[1].id) for m in approximate]
+    assert [m[2] for m in exact] == pytest.approx([m[2] for m in approximate])
+
+def test_find_matches_with_index_only_scores_candidates(mentors):
+    mentee = _profile("e0", [0.0, 1.0, 0.0], years=1)
+    index = MentorIndex.from_profiles(mentors)
+    matches = ImprovedMentorMatchingSystem().find_matches(mentors + [mentee], mentor_index=index, index_candidates=1)
+    # The semantic neighbour plus the mentor the index cannot rank
+    assert {m[0].id for m in matches} == {"m1", "m3"}
@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+from conftest import make_profile
+from alx_connect.services.profile_embeddings import ProfileEmbeddingService, normalize_text
+
+class FakeEmbeddings:
+    model_name = "fake-model"
+
+    def __init__(self):
+        self.batches = []
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text)), float(sum(map(ord, text)) % 97), 1.0] for text in texts]
+
+def _profile(profile_id, personal, professional="Backend engineer"):
+    return make_profile(profile_id, personal_summary=personal, professional_summary=professional)
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "embeddings.sqlite3")
+
+def test_normalize_text_collapses_whitespace():
+    assert normalize_text("  Loves\n\tPython   and  Go ") == "Loves Python and Go"
+    assert normalize_text(None) == ""
+
+def test_embed_profiles_batches_and_normalizes(cache_path):
+    model = FakeEmbeddings()
+    service = ProfileEmbeddingService(model, cache_path=cache_path, batch_size=2)
+    profiles = [_profile(f"p{i}", f"Summary {i}") for i in range(5)]
+
+    service.embed_profiles(profiles)
+    assert [len(batch) for batch in model.batches] == [2, 2, 1]
+    for profile in profiles:
+        assert profile.semantic_embedding.dtype == np.float32
+        assert np.linalg.norm(profile.semantic_embedding) == pytest.approx(1.0, abs=1e-6)
+
+def test_unchanged_profiles_are_served_from_disk_cache(cache_path):
+    profiles = [_profile("a", "Summary A"), _profile("b", "Summary B")]
+    first = ProfileEmbeddingService(FakeEmbeddings(), cache_path=cache_path)
+    first.embed_profiles(profiles)
+    first.close()
+
+    model = FakeEmbeddings()
+    second = ProfileEmbeddingService(model, cache_path=cache_path)
+    # Same text modulo whitespace hits the cache; the edited profile does not
+    edited = [_profile("a", "  Summary   A "), _profile("b", "Summary B, updated")]
+    second.embed_profiles(edited)
+    assert model.batches == [["Summary B, updated Backend engineer"]]
+    assert np.array_equal(edited[0].semantic_embedding, profiles[0].semantic_embedding)
+
+def test_cache_is_keyed_by_model(cache_path):
+    ProfileEmbeddingService(FakeEmbeddings(), cache_path=cache_path).embed_texts(["same text"])
+
+    other = FakeEmbeddings()
+    other.model_name = "other-model"
+    ProfileEmbeddingService(other, cache_path=cache_path).embed_texts(["same text"])
+    assert other.batches == [["same text"]]
+
+def test_duplicate_texts_are_embedded_once(cache_path):
+    model = FakeEmbeddings()
+    vectors = ProfileEmbeddingService(model, cache_path=cache_path).embed_texts(["x", "x", "y"])
+    assert vectors.shape == (3, 3)
+    assert sum(len(batch) for batch in model.batches) == 2
+    assert np.array_equal(vectors[0], vectors[1])
+
+def test_empty_summaries_are_skipped(cache_path):
+    model = FakeEmbeddings()
+    profile = _profile("a", " ", professional="")
+    ProfileEmbeddingService(model, cache_path=cache_path).embed_profiles([profile])
+    assert profile.semantic_embedding is None
+    assert model.batches == []
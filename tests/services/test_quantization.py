@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+from conftest import make_profile
+from alx_connect.services.incremental_matching import IncrementalMatcher
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+from alx_connect.services.quantization import (
+    decode_embeddings, embedding_dot, encode_embeddings, quantize_int8
+)
+
+def _profiles(count, seed=0, dim=32):
+    rng = np.random.default_rng(seed)
+    return [
+        make_profile(
+            f"p{i}",
+            int(rng.integers(0, 14)),
+            rng.choice(["Python", "Go", "SQL", "AWS"], size=rng.integers(0, 3), replace=False).tolist(),
+            {"Cloud"} if i % 3 else (),
+            None if i % 6 == 0 else rng.normal(size=dim)
+        )
+        for i in range(count)
+    ]
+
+def _signature(matches):
+    return [(m[0].id, m[1].id) for m in matches]
+
+def test_int8_roundtrip_and_dot_product():
+    rng = np.random.default_rng(0)
+    matrix = rng.normal(size=(20, 64))
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix[3] = 0.0
+
+    codes, scales = quantize_int8(matrix)
+    assert codes.dtype == np.int8 and scales.dtype == np.float32
+    assert np.all(codes[3] == 0)
+    features = {"embeddings": codes, "embedding_scales": scales}
+    decoded = decode_embeddings(features)
+    assert np.abs(decoded - matrix).max() <= scales.max() / 2 + 1e-6
+
+    # Products of codes are exact in float32, so only the scales round
+    assert np.allclose(embedding_dot(features, features), decoded @ decoded.T, rtol=1e-6, atol=1e-7)
+
+@pytest.mark.parametrize("precision,tolerance", [("float32", 1e-6), ("float16", 1e-3), ("int8", 2e-2)])
+def test_reduced_precision_scores_stay_close(precision, tolerance):
+    profiles = _profiles(80)
+    exact = {(m[0].id, m[1].id): m[2] for m in ImprovedMentorMatchingSystem().find_matches(profiles, vectorized=True, min_score=-np.inf)}
+    matching_system = ImprovedMentorMatchingSystem(embedding_precision=precision)
+    reduced = matching_system.find_matches(profiles, vectorized=True, min_score=-np.inf)
+    # Semantic weight scales the embedding error
+    assert max(abs(m[2] - exact[(m[0].id, m[1].id)]) for m in reduced) <= tolerance
+
+    assert encode_embeddings(np.zeros((2, 4)), precision)["embeddings"].dtype == np.dtype(precision)
+
+@pytest.mark.parametrize("precision", ["float32", "int8"])
+def test_engines_agree_at_reduced_precision(precision):
+    matching_system = ImprovedMentorMatchingSystem(embedding_precision=precision)
+    profiles = _profiles(70, seed=1)
+    vectorized = matching_system.find_matches(profiles, top_k=3, vectorized=True)
+
+    assert _signature(matching_system.find_matches(profiles, top_k=3, prune=True)) == _signature(vectorized)
+    assert _signature(matching_system.find_matches(profiles, top_k=3, vectorized=True, workers=2, chunk_size=16)) == _signature(vectorized)
+    matcher = IncrementalMatcher.from_profiles(profiles, matching_system=matching_system, top_k=3)
+    assert _signature(matcher.all_matches()) == _signature(vectorized)
+
+def test_unknown_precision_is_rejected():
+    with pytest.raises(ValueError):
+        ImprovedMentorMatchingSystem(embedding_precision="bfloat16")
+
+def test_int8_rejects_dimensions_it_cannot_score_exactly():
+    from alx_connect.services.quantization import INT8_MAX_DIMENSION
+    encode_embeddings(np.ones((2, INT8_MAX_DIMENSION)), "int8")
+    with pytest.raises(ValueError):
+        encode_embeddings(np.ones((2, INT8_MAX_DIMENSION + 1)), "int8")
+
+@pytest.mark.parametrize("precision", ["float16", "int8"])
+def test_mentor_blocks_are_scored_like_the_whole_matrix(precision, monkeypatch):
+    from alx_connect.services import quantization
+    rng = np.random.default_rng(1)
+    mentees = encode_embeddings(rng.normal(size=(5, 16)), precision)
+    mentors = encode_embeddings(rng.normal(size=(37, 16)), precision)
+    whole = embedding_dot(mentees, mentors)
+    # Blocks of 10 mentor rows, the last one partial
+    monkeypatch.setattr(quantization, "DOT_BLOCK_BYTES", 4 * 16 * 10)
+    np.testing.assert_array_equal(embedding_dot(mentees, mentors), whole)
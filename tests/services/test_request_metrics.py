@@ -0,0 +1,15 @@
+from alx_connect.services.request_metrics import RequestMetrics
+
+def test_summary_covers_the_recent_window():
+    metrics = RequestMetrics(window=3)
+    for seconds in (0.5, 0.01, 0.02, 0.03):
+        metrics.record("ask_question", {"llm": seconds, "total": seconds + 0.01})
+    metrics.record("ask_question", {"total": 0.01})
+
+    summary = metrics.summary()["ask_question"]
+    assert summary["requests"] == 5
+    assert summary["window"] == 3
+    # The slow first request has left the window; the last one skipped the LLM
+    assert summary["stages"]["llm"]["max_ms"] == 30.0
+    assert summary["stages"]["llm"]["mean_ms"] == 16.67
+    assert summary["stages"]["total"]["p50_ms"] == 30.0
@@ -0,0 +1,85 @@
+import pytest
+import numpy as np
+from urllib.parse import urlparse
+from conftest import make_profile
+from alx_connect.services.incremental_matching import IncrementalMatcher
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+from alx_connect.services.scoring_kernels import KERNELS, ScoringKernel, register_kernel, resolve_kernels
+
+class PortfolioHostKernel(ScoringKernel):
+    """1.0 when both portfolios are hosted on the same site."""
+
+    name = "portfolio_score"
+    weight_key = "portfolio_weight"
+    columns = ("portfolio_host",)
+
+    def precompute(self, profiles, context):
+        return {"portfolio_host": np.array([hash(urlparse(p.portfolio).netloc) for p in profiles], dtype=np.int64)}
+
+    def score(self, matching_system, mentor_features, mentee_features):
+        return (mentee_features["portfolio_host"][:, np.newaxis] == mentor_features["portfolio_host"][np.newaxis, :]).astype(np.float64)
+
+    def score_pair(self, matching_system, mentor, mentee):
+        return float(urlparse(mentor.portfolio).netloc == urlparse(mentee.portfolio).netloc)
+
+def _profiles(count, seed=0):
+    rng = np.random.default_rng(seed)
+    hosts = ["https://github.com/x", "https://gitlab.com/x", "https://example.org/x"]
+    return [
+        make_profile(
+            f"p{i}",
+            int(rng.integers(0, 14)),
+            rng.choice(["Python", "Go", "SQL"], size=rng.integers(0, 3), replace=False).tolist(),
+            {"Cloud"} if i % 3 else (),
+            None if i % 5 == 0 else rng.normal(size=8),
+            portfolio=hosts[rng.integers(0, 3)]
+        )
+        for i in range(count)
+    ]
+
+def _system():
+    kernels = ["experience_score", "semantic_score", "domain_score", "skill_score", PortfolioHostKernel()]
+    return ImprovedMentorMatchingSystem(kernels=kernels, weights={"portfolio_weight": 0.1})
+
+def _signature(matches):
+    return [(m[0].id, m[1].id, round(m[2], 9), tuple(sorted((k, round(v, 9)) for k, v in m[3].items()))) for m in matches]
+
+def test_added_kernel_is_scored_in_every_path():
+    matching_system = _system()
+    profiles = _profiles(60)
+
+    pairwise = matching_system.find_matches(profiles, top_k=4)
+    assert all(m[3].keys() == {"experience_score", "semantic_score", "domain_score", "skill_score", "portfolio_score"} for m in pairwise)
+    for path in ({"vectorized": True}, {"prune": True}, {"workers": 2, "chunk_size": 8}):
+        assert _signature(matching_system.find_matches(profiles, top_k=4, **path)) == _signature(pairwise)
+
+    matcher = IncrementalMatcher.from_profiles(profiles, matching_system=matching_system, top_k=4)
+    assert _signature(matcher.all_matches()) == _signature(pairwise)
+
+def test_added_kernel_changes_scores_by_its_weight():
+    profiles = _profiles(30)
+    # Keep every pair, so both runs cover the same ones
+    base = {(m[0].id, m[1].id): m[2] for m in ImprovedMentorMatchingSystem().find_matches(profiles, vectorized=True, min_score=-np.inf)}
+    matches = _system().find_matches(profiles, vectorized=True, min_score=-np.inf)
+    assert len(matches) == len(base)
+    for mentor, mentee, score, breakdown in matches:
+        assert score == pytest.approx(base[(mentor.id, mentee.id)] + 0.1 * breakdown["portfolio_score"])
+
+def test_default_kernels_and_registry():
+    assert [kernel.name for kernel in ImprovedMentorMatchingSystem().kernels] == [
+        "experience_score", "semantic_score", "domain_score", "skill_score"
+    ]
+    with pytest.raises(ValueError):
+        register_kernel(KERNELS["skill_score"])
+    with pytest.raises(ValueError):
+        resolve_kernels(["skill_score", "skill_score"])
+
+def test_kernels_must_implement_every_method():
+    class ScoreOnlyKernel(ScoringKernel):
+        name = "score_only"
+
+        def score(self, matching_system, mentor_features, mentee_features):
+            return np.zeros((0, 0))
+
+    with pytest.raises(TypeError):
+        ScoreOnlyKernel()
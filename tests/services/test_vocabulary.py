@@ -0,0 +1,34 @@
+from alx_connect.services.matching import ImprovedMentorMatchingSystem
+from alx_connect.models.vocabulary import VocabularyInterner
+from alx_connect.services.vocabulary import jaccard_matrix
+
+def test_interner_assigns_stable_ids():
+    interner = VocabularyInterner(["Python", "Docker"])
+    assert interner.intern("Python") == 0
+    assert interner.intern("SQL") == 2
+    assert len(interner) == 3
+    assert interner.terms == ["Python", "Docker", "SQL"]
+
+def test_encode_and_decode_round_trip():
+    interner = VocabularyInterner()
+    sets = [{"Python", "Docker"}, set(), {"SQL"}]
+    matrix = interner.encode(sets)
+    assert matrix.shape == (3, 3)
+    assert [interner.decode(matrix[row]) for row in range(3)] == sets
+
+def test_jaccard_matrix_matches_set_similarity():
+    matching_system = ImprovedMentorMatchingSystem()
+    left_sets = [{"Software", "Cloud", "AI"}, {"Software"}, set()]
+    right_sets = [{"Software", "Cloud", "Web"}, {"Marketing"}, set(), {"AI", "Software"}]
+
+    interner = VocabularyInterner()
+    left = interner.encode(left_sets)
+    # Encoded later against a larger vocabulary, so widths differ
+    right = interner.encode(right_sets)
+    result = jaccard_matrix(left, right)
+
+    assert result.shape == (3, 4)
+    for i, left_set in enumerate(left_sets):
+        for j, right_set in enumerate(right_sets):
+            assert result[i, j] == matching_system.calculate_domain_similarity(right_set, left_set)
+    assert result[0, 0] == 0.5